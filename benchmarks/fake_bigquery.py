@@ -0,0 +1,359 @@
+"""
+Fake BigQuery API server for load testing the dry runner on one machine
+
+Implements just enough of the BigQuery REST API for `BigQuerySQLRunner`: dry run `jobs.insert`
+and `tables.get`. Every dry run query returns the same schema. Each request waits for a
+latency drawn from a configurable distribution, can fail with an injected error and is
+throttled with `rateLimitExceeded` like BigQuery when it is over the configured quota.
+
+Point the dry runner at it with `--bigquery-api-endpoint http://127.0.0.1:<port>`
+
+Usage: python -m benchmarks.fake_bigquery [--port 9050] [--latency lognormal] [--latency-seconds 0.2]
+    [--latency-spread 0.5] [--error-rate 0.01] [--error-reason backendError]
+    [--queries-per-second 100] [--max-concurrent-requests 50] [--tables tables.json] [--seed 1]
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Latency = Callable[[random.Random], float]
+
+_JOBS_PATH = re.compile(r"^/bigquery/v2/projects/(?P<project>[^/]+)/jobs$")
+_TABLE_PATH = re.compile(
+    r"^/bigquery/v2/projects/(?P<project>[^/]+)/datasets/(?P<dataset>[^/]+)/tables/(?P<table>[^/]+)$"
+)
+
+ERROR_STATUS_CODES: Dict[str, int] = {
+    "backendError": 500,
+    "internalError": 500,
+    "badGateway": 502,
+    "rateLimitExceeded": 403,
+    "quotaExceeded": 403,
+    "invalidQuery": 400,
+    "accessDenied": 403,
+    "invalid": 400,
+    "notFound": 404,
+}
+
+DEFAULT_QUERY_SCHEMA: List[Dict[str, Any]] = [
+    {"name": "a", "type": "STRING", "mode": "NULLABLE"}
+]
+
+
+def constant_latency(seconds: float) -> Latency:
+    return lambda _: seconds
+
+
+def uniform_latency(low: float, high: float) -> Latency:
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float) -> Latency:
+    """
+    Long tailed latency, most requests take about `median` seconds but a few take much longer
+    """
+    mu = math.log(median) if median > 0 else float("-inf")
+    return lambda rng: rng.lognormvariate(mu, sigma) if median > 0 else 0.0
+
+
+@dataclass
+class FakeBigQueryConfig:
+    latency: Latency = field(default_factory=lambda: constant_latency(0.0))
+    error_rate: float = 0.0
+    error_reason: str = "backendError"
+    queries_per_second: Optional[float] = None
+    max_concurrent_requests: Optional[int] = None
+    # `project.dataset.table` to a list of BigQuery schema fields
+    tables: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    query_schema: List[Dict[str, Any]] = field(
+        default_factory=lambda: list(DEFAULT_QUERY_SCHEMA)
+    )
+    total_bytes_processed: int = 0
+    seed: Optional[int] = None
+
+
+@dataclass
+class FakeBigQueryStats:
+    requests: int = 0
+    dry_run_queries: int = 0
+    table_lookups: int = 0
+    injected_errors: int = 0
+    throttled: int = 0
+    max_concurrent_requests: int = 0
+
+
+class _TokenBucket:
+    def __init__(self, rate: float):
+        self._rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(
+            self._rate, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class FakeBigQueryServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, config: FakeBigQueryConfig, host: str = "127.0.0.1", port: int = 0
+    ):
+        super().__init__((host, port), _FakeBigQueryHandler)
+        self.config = config
+        self.stats = FakeBigQueryStats()
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._concurrent_requests = 0
+        self._bucket = (
+            _TokenBucket(config.queries_per_second)
+            if config.queries_per_second
+            else None
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "FakeBigQueryServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeBigQueryServer":
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def begin_request(self) -> Tuple[float, Optional[str]]:
+        """
+        Count the request and decide how long it takes and whether it fails. Returns the
+        latency and the error reason to fail with, if any
+        """
+        with self._lock:
+            self.stats.requests += 1
+            self._concurrent_requests += 1
+            self.stats.max_concurrent_requests = max(
+                self.stats.max_concurrent_requests, self._concurrent_requests
+            )
+            latency = max(0.0, self.config.latency(self._random))
+            over_concurrency = (
+                self.config.max_concurrent_requests is not None
+                and self._concurrent_requests > self.config.max_concurrent_requests
+            )
+            if over_concurrency or (self._bucket and not self._bucket.take()):
+                self.stats.throttled += 1
+                return latency, "rateLimitExceeded"
+            if self._random.random() < self.config.error_rate:
+                self.stats.injected_errors += 1
+                return latency, self.config.error_reason
+        return latency, None
+
+    def end_request(self) -> None:
+        with self._lock:
+            self._concurrent_requests -= 1
+
+    def record(self, stat: str) -> None:
+        with self._lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
+
+
+class _FakeBigQueryHandler(BaseHTTPRequestHandler):
+    server: FakeBigQueryServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, reason: str, message: str) -> None:
+        status = ERROR_STATUS_CODES.get(reason, 500)
+        self._send_json(
+            status,
+            {
+                "error": {
+                    "code": status,
+                    "message": message,
+                    "errors": [{"reason": reason, "message": message}],
+                }
+            },
+        )
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _handle(self, route: Callable[[], None]) -> None:
+        latency, error_reason = self.server.begin_request()
+        try:
+            time.sleep(latency)
+            if error_reason:
+                self._send_error(error_reason, f"Injected {error_reason} error")
+            else:
+                route()
+        finally:
+            self.server.end_request()
+
+    def do_POST(self) -> None:
+        match = _JOBS_PATH.match(self.path.split("?")[0])
+        if not match:
+            self._send_error("notFound", f"Not found: {self.path}")
+            return
+        self._handle(lambda: self._insert_job(match.group("project")))
+
+    def do_GET(self) -> None:
+        match = _TABLE_PATH.match(self.path.split("?")[0])
+        if not match:
+            self._send_error("notFound", f"Not found: {self.path}")
+            return
+        self._handle(lambda: self._get_table(**match.groupdict()))
+
+    def _insert_job(self, project: str) -> None:
+        job = self._read_json()
+        configuration = job.get("configuration", {})
+        if not configuration.get("dryRun"):
+            self._send_error("invalid", "The fake BigQuery only supports dry runs")
+            return
+        self.server.record("dry_run_queries")
+        job_reference = job.get("jobReference") or {}
+        job_reference.setdefault("projectId", project)
+        job_reference.setdefault("jobId", str(uuid.uuid4()))
+        self._send_json(
+            200,
+            {
+                "kind": "bigquery#job",
+                "jobReference": job_reference,
+                "configuration": configuration,
+                "status": {"state": "DONE"},
+                "statistics": {
+                    "creationTime": str(int(time.time() * 1000)),
+                    "totalBytesProcessed": str(
+                        self.server.config.total_bytes_processed
+                    ),
+                    "query": {
+                        "totalBytesProcessed": str(
+                            self.server.config.total_bytes_processed
+                        ),
+                        "schema": {"fields": self.server.config.query_schema},
+                    },
+                },
+            },
+        )
+
+    def _get_table(self, project: str, dataset: str, table: str) -> None:
+        self.server.record("table_lookups")
+        table_id = f"{project}.{dataset}.{table}"
+        fields = self.server.config.tables.get(table_id)
+        if fields is None:
+            self._send_error("notFound", f"Not found: Table {table_id}")
+            return
+        self._send_json(
+            200,
+            {
+                "kind": "bigquery#table",
+                "tableReference": {
+                    "projectId": project,
+                    "datasetId": dataset,
+                    "tableId": table,
+                },
+                "schema": {"fields": fields},
+            },
+        )
+
+
+_LATENCY_DISTRIBUTIONS: Dict[str, Callable[[float, float], Latency]] = {
+    "constant": lambda seconds, _: constant_latency(seconds),
+    "uniform": lambda seconds, spread: uniform_latency(
+        max(0.0, seconds - spread), seconds + spread
+    ),
+    "lognormal": lognormal_latency,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9050)
+    parser.add_argument(
+        "--latency", choices=sorted(_LATENCY_DISTRIBUTIONS), default="constant"
+    )
+    parser.add_argument("--latency-seconds", type=float, default=0.0)
+    parser.add_argument(
+        "--latency-spread",
+        type=float,
+        default=0.0,
+        help="Half width for uniform latency, sigma for lognormal latency",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--error-reason", choices=sorted(ERROR_STATUS_CODES), default="backendError"
+    )
+    parser.add_argument("--queries-per-second", type=float, default=None)
+    parser.add_argument("--max-concurrent-requests", type=int, default=None)
+    parser.add_argument(
+        "--tables", help="JSON file of `project.dataset.table` to schema fields"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    tables: Dict[str, List[Dict[str, Any]]] = {}
+    if args.tables:
+        with open(args.tables) as f:
+            tables = json.load(f)
+    config = FakeBigQueryConfig(
+        latency=_LATENCY_DISTRIBUTIONS[args.latency](
+            args.latency_seconds, args.latency_spread
+        ),
+        error_rate=args.error_rate,
+        error_reason=args.error_reason,
+        queries_per_second=args.queries_per_second,
+        max_concurrent_requests=args.max_concurrent_requests,
+        tables=tables,
+        seed=args.seed,
+    )
+    server = FakeBigQueryServer(config, args.host, args.port)
+    print(f"Fake BigQuery listening on {server.endpoint}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.stats.__dict__, indent=2))
+
+
+if __name__ == "__main__":
+    main()
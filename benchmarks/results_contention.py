@@ -0,0 +1,80 @@
+"""
+Contention benchmark for `Results` lookups
+
+Simulates a run where every node looks up its upstream results while other worker threads are
+adding theirs. Compares the old access pattern (`n in results.keys()`, which copies every key
+under the lock) with `Results.get_many`
+
+Usage: python -m benchmarks.results_contention [--nodes 10000] [--upstreams 100] [--threads 64]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from dbt_dry_run.models import Table
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.manifest import Node, NodeConfig
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.results import Results
+
+UpstreamLookup = Callable[[Results, List[str]], List[DryRunResult]]
+
+
+def _copying_lookup(results: Results, upstreams: List[str]) -> List[DryRunResult]:
+    return [results.get_result(n) for n in upstreams if n in results.keys()]
+
+
+def _get_many_lookup(results: Results, upstreams: List[str]) -> List[DryRunResult]:
+    return results.get_many(upstreams)
+
+
+def _build_result(unique_id: str) -> DryRunResult:
+    node = Node(
+        name=unique_id,
+        unique_id=unique_id,
+        config=NodeConfig(materialized="table"),
+        database="db",
+        schema="schema",
+        alias=unique_id,
+        resource_type="model",
+        original_file_path=f"{unique_id}.sql",
+    )
+    return DryRunResult(node, Table(fields=[]), DryRunStatus.SUCCESS, None)
+
+
+def run(lookup: UpstreamLookup, nodes: int, upstreams: int, threads: int) -> float:
+    node_keys = [f"model.bench.node_{i}" for i in range(nodes)]
+    prebuilt = [_build_result(key) for key in node_keys]
+    results = Results()
+    for result in prebuilt[:upstreams]:
+        results.add_result(result.node.unique_id, result)
+
+    def run_node(index: int) -> None:
+        lookup(results, node_keys[max(0, index - upstreams) : index])
+        results.add_result(node_keys[index], prebuilt[index])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(run_node, range(upstreams, nodes)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--upstreams", type=int, default=100)
+    parser.add_argument("--threads", type=int, default=64)
+    args = parser.parse_args()
+
+    for name, lookup in [
+        ("keys() copy", _copying_lookup),
+        ("get_many", _get_many_lookup),
+    ]:
+        elapsed = run(lookup, args.nodes, args.upstreams, args.threads)
+        print(f"{name:>12}: {elapsed:.3f}s ({args.nodes / elapsed:,.0f} nodes/s)")
+
+
+if __name__ == "__main__":
+    main()
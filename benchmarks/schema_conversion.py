@@ -0,0 +1,80 @@
+"""
+Benchmark for converting the schemas BigQuery returns into `Table`s
+
+Builds a wide nested schema of `SchemaField`s, like the response to a dry run of a wide table,
+and compares converting it with validation against the trusted conversion in
+`BigQuerySQLRunner.get_schema_from_schema_fields`, checking both give the same `Table`
+
+Usage: python -m benchmarks.schema_conversion [--columns 3000] [--nested-fields 10] [--repeat 5]
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from google.cloud.bigquery import SchemaField
+
+from dbt_dry_run.models import Table
+from dbt_dry_run.sql_runner.big_query_sql_runner import BigQuerySQLRunner
+
+Convert = Callable[[List[SchemaField]], Table]
+
+_LEAF_TYPES = ["STRING", "INT64", "FLOAT64", "TIMESTAMP", "BOOL", "NUMERIC"]
+
+
+def nested_schema(columns: int, nested_fields: int) -> List[SchemaField]:
+    """
+    `columns` fields in total, every `nested_fields + 1`th one a struct of leaves and every
+    other struct repeated with a struct nested in it
+    """
+    schema: List[SchemaField] = []
+    index = 0
+    while index < columns:
+        leaves = [
+            SchemaField(f"leaf_{i}", _LEAF_TYPES[i % len(_LEAF_TYPES)])
+            for i in range(nested_fields)
+        ]
+        if len(schema) % 2:
+            leaves[-1] = SchemaField(
+                "inner", "RECORD", fields=leaves[: nested_fields // 2]
+            )
+        schema.append(
+            SchemaField(
+                f"struct_{index}",
+                "RECORD",
+                mode="REPEATED" if len(schema) % 2 else "NULLABLE",
+                fields=leaves,
+                description=f"Column {index}",
+            )
+        )
+        index += nested_fields + 1
+    return schema
+
+
+def run(convert: Convert, schema: List[SchemaField]) -> float:
+    start = time.perf_counter()
+    convert(schema)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--columns", type=int, default=3_000)
+    parser.add_argument("--nested-fields", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    schema = nested_schema(args.columns, args.nested_fields)
+    conversions: List[tuple[str, Convert]] = [
+        ("validated", BigQuerySQLRunner._validate_schema_fields),
+        ("trusted", BigQuerySQLRunner.get_schema_from_schema_fields),
+    ]
+    if conversions[0][1](schema) != conversions[1][1](schema):
+        raise AssertionError("Converted schemas are different")
+    for name, convert in conversions:
+        elapsed = min(run(convert, schema) for _ in range(args.repeat))
+        print(f"{name:>9}: {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark for merging the schema of an incremental model with its existing table
+
+Builds an existing table and a predicted table with a few new fields, for a wide schema of
+many top level structs and a deep schema of structs nested to BigQuery's limit. Compares the
+old merge, which deep copied every field and scanned every new field at every struct, with
+`merge_table_fields` and checks both give the same schema
+
+Usage: python -m benchmarks.schema_merge [--leaves 10000] [--new-fields 100] [--repeat 3]
+"""
+
+import argparse
+import time
+from copy import deepcopy
+from typing import Callable, List
+
+from dbt_dry_run.models import BigQueryFieldType, TableField
+from dbt_dry_run.models.table import (
+    MAX_SUPPORTED_NESTED_FIELD_DEPTH,
+    TableFieldWithPath,
+)
+from dbt_dry_run.schema_manipulation import (
+    collect_flattened_field_paths,
+    merge_table_fields,
+)
+
+Merge = Callable[[List[TableField], List[TableField]], List[TableField]]
+
+
+def _copying_merge(
+    table_1_fields: List[TableField], table_2_fields: List[TableField]
+) -> List[TableField]:
+    table_1_paths = {f.path for f in collect_flattened_field_paths(table_1_fields)}
+    fields_to_add = [
+        f
+        for f in collect_flattened_field_paths(table_2_fields)
+        if f.path not in table_1_paths
+    ]
+    merged = [_copying_add_fields_to_struct(f, fields_to_add) for f in table_1_fields]
+    for new_field in fields_to_add:
+        if new_field.is_top_level and not any(
+            f.name == new_field.field.name for f in merged
+        ):
+            merged.append(new_field.field)
+    return merged
+
+
+def _copying_add_fields_to_struct(
+    struct: TableField,
+    nested_fields: List[TableFieldWithPath],
+    current_path: tuple[str, ...] = (),
+    current_depth: int = 1,
+) -> TableField:
+    path = current_path + (struct.name,)
+    field_copy = deepcopy(struct)
+    if field_copy.fields and current_depth < MAX_SUPPORTED_NESTED_FIELD_DEPTH:
+        field_copy.fields = [
+            _copying_add_fields_to_struct(f, nested_fields, path, current_depth + 1)
+            for f in field_copy.fields
+        ]
+    else:
+        field_copy.fields = field_copy.fields or None
+    for new_field in nested_fields:
+        if (
+            new_field.path[:-1] == path
+            and current_depth < MAX_SUPPORTED_NESTED_FIELD_DEPTH
+            and len(new_field.path) <= MAX_SUPPORTED_NESTED_FIELD_DEPTH
+        ):
+            if field_copy.fields is None:
+                field_copy.fields = []
+            if not any(f.name == new_field.field.name for f in field_copy.fields):
+                field_copy.fields.append(new_field.field)
+    return field_copy
+
+
+def _leaf(name: str) -> TableField:
+    return TableField(name=name, type=BigQueryFieldType.STRING)
+
+
+def _struct(name: str, fields: List[TableField]) -> TableField:
+    return TableField(name=name, type=BigQueryFieldType.RECORD, fields=fields)
+
+
+def wide_schema(leaves: int, new_fields: int) -> tuple[List[TableField], ...]:
+    """
+    Structs of 100 leaves each, with new leaves added to the first structs
+    """
+
+    def build(extra: int) -> List[TableField]:
+        return [
+            _struct(
+                f"struct_{s}",
+                [_leaf(f"leaf_{i}") for i in range(100)]
+                + ([_leaf("new_leaf")] if s < extra else []),
+            )
+            for s in range(leaves // 100)
+        ]
+
+    return build(0), build(new_fields)
+
+
+def deep_schema(leaves: int, new_fields: int) -> tuple[List[TableField], ...]:
+    """
+    Chains of structs nested to the maximum depth, each level with a few leaves, with new
+    leaves added at the bottom of the first chains
+    """
+    depth = MAX_SUPPORTED_NESTED_FIELD_DEPTH - 1
+    chains = max(1, leaves // (depth * 5))
+
+    def chain(level: int, new: bool) -> List[TableField]:
+        fields = [_leaf(f"leaf_{i}") for i in range(5)]
+        if level < depth:
+            fields.append(_struct(f"level_{level}", chain(level + 1, new)))
+        elif new:
+            fields.append(_leaf("new_leaf"))
+        return fields
+
+    def build(extra: int) -> List[TableField]:
+        return [_struct(f"chain_{c}", chain(1, c < extra)) for c in range(chains)]
+
+    return build(0), build(new_fields)
+
+
+def run(merge: Merge, existing: List[TableField], predicted: List[TableField]) -> float:
+    start = time.perf_counter()
+    merge(existing, predicted)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--leaves", type=int, default=10_000)
+    parser.add_argument("--new-fields", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for schema_name, build in [("wide", wide_schema), ("deep", deep_schema)]:
+        existing, predicted = build(args.leaves, args.new_fields)
+        if _copying_merge(existing, predicted) != merge_table_fields(
+            existing, predicted
+        ):
+            raise AssertionError(f"Merged {schema_name} schemas are different")
+        for name, merge in [
+            ("deepcopy", _copying_merge),
+            ("indexed", merge_table_fields),
+        ]:
+            elapsed = min(run(merge, existing, predicted) for _ in range(args.repeat))
+            print(f"{schema_name:>5} {name:>9}: {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import json
 import os
-from typing import Optional
+from contextlib import ExitStack
+from typing import List, Optional
 
 import typer
 from typer import Option
@@ -9,8 +10,21 @@ from dbt_dry_run.adapter.service import DbtArgs, ProjectService
 from dbt_dry_run.adapter.utils import default_profiles_dir
 from dbt_dry_run.exception import ManifestValidationError
 from dbt_dry_run.execution import dry_run_manifest
-from dbt_dry_run.flags import Flags, set_flags
+from dbt_dry_run.flags import (
+    DEFAULT_MAX_INCREMENTAL_SCAN_RATIO,
+    Flags,
+    SQLRunnerType,
+    set_flags,
+)
+from dbt_dry_run.metrics_textfile import MetricsTextfileWriter
+from dbt_dry_run.ndjson_report import NDJSONReportWriter
+from dbt_dry_run.progress import DEFAULT_PROGRESS_INTERVAL, ProgressReporter
+from dbt_dry_run.report_file import ReportFormat, write_report
 from dbt_dry_run.result_reporter import ResultReporter
+from dbt_dry_run.results import ResultListener
+from dbt_dry_run.retry import DEFAULT_RETRY_BUDGET
+from dbt_dry_run.scan_budget import parse_bytes
+from dbt_dry_run.tracing import TraceWriter
 from dbt_dry_run.version import VERSION
 
 app = typer.Typer()
@@ -28,6 +42,30 @@ def dry_run(
     full_refresh: bool = False,
     extra_check_columns_metadata_key: Optional[str] = None,
     threads: Optional[int] = None,
+    prefetch_metadata: bool = False,
+    retry_budget: int = DEFAULT_RETRY_BUDGET,
+    sql_runner: SQLRunnerType = SQLRunnerType.BIGQUERY,
+    record_cassette: Optional[str] = None,
+    replay_cassette: Optional[str] = None,
+    bigquery_api_endpoint: Optional[str] = None,
+    max_bytes_processed: Optional[int] = None,
+    baseline_report: Optional[str] = None,
+    max_bytes_processed_growth: Optional[float] = None,
+    full_refresh_manifest: Optional[str] = None,
+    max_incremental_scan_ratio: float = DEFAULT_MAX_INCREMENTAL_SCAN_RATIO,
+    test_batch_size: int = 0,
+    local_generic_tests: bool = False,
+    seed_sample_rows: Optional[int] = None,
+    seed_schema_cache: Optional[str] = None,
+    seed_schema_cache_trust_mtime: bool = False,
+    report_ndjson_path: Optional[str] = None,
+    report_format: ReportFormat = ReportFormat.JSON,
+    report_tables: bool = True,
+    progress: bool = True,
+    progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+    metrics_path: Optional[str] = None,
+    metrics_interval: Optional[float] = None,
+    trace_path: Optional[str] = None,
 ) -> int:
     cli_vars_parsed = json.loads(cli_vars)
     set_flags(
@@ -35,6 +73,22 @@ def dry_run(
             skip_not_compiled=skip_not_compiled,
             full_refresh=full_refresh,
             extra_check_columns_metadata_key=extra_check_columns_metadata_key,
+            prefetch_metadata=prefetch_metadata,
+            retry_budget=retry_budget,
+            sql_runner=sql_runner,
+            record_cassette=record_cassette,
+            replay_cassette=replay_cassette,
+            bigquery_api_endpoint=bigquery_api_endpoint,
+            max_bytes_processed=max_bytes_processed,
+            baseline_report=baseline_report,
+            max_bytes_processed_growth=max_bytes_processed_growth,
+            full_refresh_manifest=full_refresh_manifest,
+            max_incremental_scan_ratio=max_incremental_scan_ratio,
+            test_batch_size=test_batch_size,
+            local_generic_tests=local_generic_tests,
+            seed_sample_rows=seed_sample_rows,
+            seed_schema_cache=seed_schema_cache,
+            seed_schema_cache_trust_mtime=seed_schema_cache_trust_mtime,
         )
     )
     args = DbtArgs(
@@ -48,15 +102,30 @@ def dry_run(
     project = ProjectService(args)
     exit_code: int
     try:
-        dry_run_results = dry_run_manifest(project)
+        with ExitStack() as stack:
+            listeners: List[ResultListener] = []
+            if progress:
+                listeners.append(
+                    stack.enter_context(ProgressReporter(interval=progress_interval))
+                )
+            if trace_path:
+                listeners.append(stack.enter_context(TraceWriter(trace_path)))
+            if metrics_path:
+                listeners.append(
+                    stack.enter_context(
+                        MetricsTextfileWriter(metrics_path, metrics_interval)
+                    )
+                )
+            if report_ndjson_path:
+                ndjson_report = stack.enter_context(open(report_ndjson_path, "w"))
+                listeners.append(NDJSONReportWriter(ndjson_report))
+            dry_run_results = dry_run_manifest(project, listeners)
         reporter = ResultReporter(dry_run_results, set(), verbose)
         exit_code = reporter.report_and_check_results()
 
-        report = reporter.get_report()
-
         if report_path:
-            with open(report_path, "w") as f:
-                f.write(report.json(by_alias=True))
+            report = reporter.get_report()
+            write_report(report, report_path, report_format, report_tables)
 
     except ManifestValidationError as e:
         print("Dry run failed to validate manifest")
@@ -83,6 +152,144 @@ runs because the dry run queries execute much faster and don't use any resources
 """
 
 
+_PREFETCH_METADATA_HELP = """
+    Load the schemas of incremental models and sources with one INFORMATION_SCHEMA query per dataset before the
+    dry run starts instead of one API call per node. These are real (not dry run) queries so they need
+    permission to query INFORMATION_SCHEMA and are billed
+"""
+
+
+_RETRY_BUDGET_HELP = """
+    Total number of retries allowed across the whole dry run for transient BigQuery errors (Rate limits, backend
+    errors, timeouts). Invalid SQL and other deterministic errors are never retried
+"""
+
+
+_SQL_RUNNER_HELP = """
+    How to get the schema of each node. `bigquery` dry runs every query in BigQuery. `offline` infers the schema
+    locally without any network access, nodes it can't infer are reported as SKIPPED. Needs the `offline` extra
+"""
+
+
+_RECORD_CASSETTE_HELP = """
+    Record the response to every BigQuery request in this JSON file so that the run can be replayed later with
+    `--replay-cassette`
+"""
+
+_REPLAY_CASSETTE_HELP = """
+    Answer every BigQuery request from a file recorded with `--record-cassette` instead of BigQuery. Useful for
+    benchmarking the dry runner itself on a real project without network access
+"""
+
+
+_BIGQUERY_API_ENDPOINT_HELP = """
+    Send BigQuery API requests to this endpoint instead of the default, for example a private endpoint or a local
+    emulator. The credentials from the dbt profile are still used
+"""
+
+
+_MAX_BYTES_PROCESSED_HELP = """
+    Fail any node whose dry run processes more than this many bytes (e.g. `500GB`) unless it sets its own budget
+    with the `dry_run.max_bytes_processed` meta key
+"""
+
+_BASELINE_REPORT_HELP = """
+    A report from a previous dry run, for example of the main branch, to compare the bytes processed by each node
+    against with `--max-bytes-processed-growth`
+"""
+
+_MAX_BYTES_PROCESSED_GROWTH_HELP = """
+    Fail any node whose dry run processes more than this percentage more bytes than it did in `--baseline-report`
+"""
+
+
+_FULL_REFRESH_MANIFEST_HELP = """
+    Path to a `manifest.json` compiled with `dbt compile --full-refresh`. Incremental models are also dry run with
+    their full refresh SQL and fail if their incremental run doesn't process meaningfully fewer bytes, which usually
+    means the incremental filter doesn't prune partitions
+"""
+
+_MAX_INCREMENTAL_SCAN_RATIO_HELP = """
+    The most an incremental run can process as a fraction of a full refresh when using `--full-refresh-manifest`
+"""
+
+
+_TEST_BATCH_SIZE_HELP = """
+    Dry run up to this many tests that are ready at the same time in one query. If a batch fails it is split until
+    the failing tests are found, which are dry run on their own. Batched tests have no bytes processed in the report
+"""
+
+
+_LOCAL_GENERIC_TESTS_HELP = """
+    Validate dbt's `not_null`, `unique`, `accepted_values` and `relationships` tests against the predicted schemas of
+    the models they test instead of dry running them. Tests that can't be validated with certainty are dry run.
+    Validated tests have no table in the report
+"""
+
+
+_SEED_SAMPLE_ROWS_HELP = """
+    Infer the column types of seeds from only their first rows instead of the whole file. This is faster for large
+    seeds but can infer a different type than `dbt seed` if a later row doesn't fit it
+"""
+
+
+_SEED_SCHEMA_CACHE_HELP = """
+    Save the inferred schema of every seed to this file, keyed by the hash of the seed's content, and reuse it in
+    later runs instead of parsing seeds that haven't changed
+"""
+
+_SEED_SCHEMA_CACHE_TRUST_MTIME_HELP = """
+    Don't hash seeds whose size and modification time are the same as when they were last hashed for
+    `--seed-schema-cache`
+"""
+
+
+_REPORT_NDJSON_PATH_HELP = """
+    Write the report to this file as newline delimited JSON while the dry run is running, one record per node as it
+    finishes followed by a summary record
+"""
+
+
+_REPORT_FORMAT_HELP = """
+    `json` writes every node's table in full. `compact` writes each distinct table once and has nodes refer to it by
+    fingerprint. Either format is compressed if `--report-path` ends in `.gz` (gzip) or `.zst` (zstd, needs the
+    `zstd` extra before Python 3.14)
+"""
+
+_REPORT_TABLES_HELP = """
+    Whether to include the predicted table of every node in the report
+"""
+
+
+_PROGRESS_HELP = """
+    Show how many nodes have completed, failed, are in flight and are retrying, how many nodes complete per second
+    and an ETA while the dry run is running. This is one line that is redrawn in a terminal, otherwise a line is
+    logged every `--progress-interval` seconds
+"""
+
+_PROGRESS_INTERVAL_HELP = """
+    Seconds between progress lines when the output isn't a terminal
+"""
+
+
+_METRICS_PATH_HELP = """
+    Write metrics about the run, such as node and BigQuery API latencies, retries, cache hits and bytes processed, to
+    this file in the Prometheus text format when the run finishes. The file name should end in `.prom` to be picked up by
+    node-exporter's textfile collector
+"""
+
+_METRICS_INTERVAL_HELP = """
+    Also write `--metrics-path` every this many seconds while the dry run is running
+"""
+
+
+_TRACE_PATH_HELP = """
+    Write a timeline of the dry run to this file as Chrome trace event JSON, which can be opened in
+    https://ui.perfetto.dev or `chrome://tracing`. It has a span for every node on its worker thread with child spans
+    for preprocessing, each BigQuery call, schema change handling and linting, and shows queue waits and retries
+"""
+
+
 def version_callback(value: bool) -> None:
     if value:
         print(f"dbt-dry-run v{VERSION}")
@@ -112,8 +319,65 @@ def run(
         "--extra-check-columns-metadata-key",
         help=_EXTRA_CHECK_COLUMNS_METADATA_KEY_HELP,
     ),
+    prefetch_metadata: bool = Option(
+        False, "--prefetch-metadata", help=_PREFETCH_METADATA_HELP
+    ),
+    retry_budget: int = Option(DEFAULT_RETRY_BUDGET, min=0, help=_RETRY_BUDGET_HELP),
+    sql_runner: SQLRunnerType = Option(SQLRunnerType.BIGQUERY, help=_SQL_RUNNER_HELP),
+    record_cassette: Optional[str] = Option(None, help=_RECORD_CASSETTE_HELP),
+    replay_cassette: Optional[str] = Option(None, help=_REPLAY_CASSETTE_HELP),
+    bigquery_api_endpoint: Optional[str] = Option(
+        None, help=_BIGQUERY_API_ENDPOINT_HELP
+    ),
+    max_bytes_processed: Optional[str] = Option(None, help=_MAX_BYTES_PROCESSED_HELP),
+    baseline_report: Optional[str] = Option(None, help=_BASELINE_REPORT_HELP),
+    max_bytes_processed_growth: Optional[float] = Option(
+        None, min=0, help=_MAX_BYTES_PROCESSED_GROWTH_HELP
+    ),
+    full_refresh_manifest: Optional[str] = Option(
+        None, help=_FULL_REFRESH_MANIFEST_HELP
+    ),
+    max_incremental_scan_ratio: float = Option(
+        DEFAULT_MAX_INCREMENTAL_SCAN_RATIO,
+        min=0,
+        max=1,
+        help=_MAX_INCREMENTAL_SCAN_RATIO_HELP,
+    ),
+    test_batch_size: int = Option(0, min=0, help=_TEST_BATCH_SIZE_HELP),
+    local_generic_tests: bool = Option(False, help=_LOCAL_GENERIC_TESTS_HELP),
+    seed_sample_rows: Optional[int] = Option(None, min=1, help=_SEED_SAMPLE_ROWS_HELP),
+    seed_schema_cache: Optional[str] = Option(None, help=_SEED_SCHEMA_CACHE_HELP),
+    seed_schema_cache_trust_mtime: bool = Option(
+        False, help=_SEED_SCHEMA_CACHE_TRUST_MTIME_HELP
+    ),
+    report_ndjson_path: Optional[str] = Option(None, help=_REPORT_NDJSON_PATH_HELP),
+    report_format: ReportFormat = Option(ReportFormat.JSON, help=_REPORT_FORMAT_HELP),
+    report_tables: bool = Option(True, help=_REPORT_TABLES_HELP),
+    progress: bool = Option(True, help=_PROGRESS_HELP),
+    progress_interval: float = Option(
+        DEFAULT_PROGRESS_INTERVAL, min=1, help=_PROGRESS_INTERVAL_HELP
+    ),
+    metrics_path: Optional[str] = Option(None, help=_METRICS_PATH_HELP),
+    metrics_interval: Optional[float] = Option(
+        None, min=1, help=_METRICS_INTERVAL_HELP
+    ),
+    trace_path: Optional[str] = Option(None, help=_TRACE_PATH_HELP),
     _: Optional[bool] = Option(None, "--version", callback=version_callback),
 ) -> None:
+    if record_cassette and replay_cassette:
+        raise typer.BadParameter(
+            "--record-cassette and --replay-cassette can't be used together"
+        )
+    if (baseline_report is None) != (max_bytes_processed_growth is None):
+        raise typer.BadParameter(
+            "--baseline-report and --max-bytes-processed-growth must be used together"
+        )
+    try:
+        max_bytes_processed_parsed = (
+            parse_bytes(max_bytes_processed) if max_bytes_processed else None
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--max-bytes-processed")
     exit_code = dry_run(
         project_dir,
         profiles_dir,
@@ -126,6 +390,30 @@ def run(
         full_refresh,
         extra_check_columns_metadata_key,
         threads,
+        prefetch_metadata,
+        retry_budget,
+        sql_runner,
+        record_cassette,
+        replay_cassette,
+        bigquery_api_endpoint,
+        max_bytes_processed_parsed,
+        baseline_report,
+        max_bytes_processed_growth,
+        full_refresh_manifest,
+        max_incremental_scan_ratio,
+        test_batch_size,
+        local_generic_tests,
+        seed_sample_rows,
+        seed_schema_cache,
+        seed_schema_cache_trust_mtime,
+        report_ndjson_path,
+        report_format,
+        report_tables,
+        progress,
+        progress_interval,
+        metrics_path,
+        metrics_interval,
+        trace_path,
     )
     if exit_code > 0:
         raise typer.Exit(exit_code)
@@ -38,6 +38,41 @@ class ManifestValidationError(Exception):
     pass
 
 
+class UnsupportedSQLException(Exception):
+    pass
+
+
+class UnknownColumnException(Exception):
+    pass
+
+
+class CassetteMissException(Exception):
+    pass
+
+
+class ScanBudgetException(Exception):
+    pass
+
+
+class PartitionPruningException(Exception):
+    pass
+
+
+class InvalidGenericTestException(Exception):
+    pass
+
+
+class RetryableException(Exception):
+    """
+    Raised by a `SQLRunner` when a request failed for a reason that may succeed if it is tried
+    again. The original error is kept so it can be reported if the retries run out
+    """
+
+    def __init__(self, exception: Exception):
+        super().__init__(str(exception))
+        self.exception = exception
+
+
 class UnknownSchemaException(Exception):
     pass
 
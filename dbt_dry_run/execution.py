@@ -1,20 +1,66 @@
+import heapq
+import multiprocessing
+import os
+import time
 from concurrent import futures
-from concurrent.futures import Future
+from concurrent.futures import Future, ProcessPoolExecutor
 from concurrent.futures.thread import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Dict, Generator, List, Optional, Tuple
+from dataclasses import replace
+from itertools import count
+from typing import Dict, Generator, List, Optional, Sequence, Tuple, Type, cast
 
-from dbt_dry_run import flags
+from dbt_dry_run import flags, tracing
 from dbt_dry_run.adapter.service import ProjectService
-from dbt_dry_run.exception import ManifestValidationError, NodeExecutionException
+from dbt_dry_run.exception import (
+    ManifestValidationError,
+    NodeExecutionException,
+    RetryableException,
+)
 from dbt_dry_run.linting.column_linting import lint_columns
+from dbt_dry_run.metrics import (
+    BYTES_PROCESSED,
+    NODE_DURATION,
+    NODES,
+    NODES_IN_FLIGHT,
+    WORKER_THREADS,
+)
+from dbt_dry_run.models.cassette import Cassette
+from dbt_dry_run.models.dry_run_result import DryRunResult
 from dbt_dry_run.models.manifest import Manifest, Node
-from dbt_dry_run.node_dispatch import RUNNERS, RunnerKey, dispatch_node
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.node_dispatch import (
+    RUNNERS,
+    RunnerKey,
+    dispatch_node,
+    get_node_runner,
+)
 from dbt_dry_run.node_runner import NodeRunner
-from dbt_dry_run.results import Results
+from dbt_dry_run.node_runner.node_test_runner import NodeTestRunner
+from dbt_dry_run.node_runner.seed_runner import (
+    SeedRunner,
+    load_seed_schema_cache,
+    save_seed_schema_cache,
+)
+from dbt_dry_run.results import ResultListener, Results
+from dbt_dry_run.retry import RetryPolicy
+from dbt_dry_run.scan_budget import check_scan_budgets
 from dbt_dry_run.scheduler import ManifestScheduler
 from dbt_dry_run.sql_runner import SQLRunner
 from dbt_dry_run.sql_runner.big_query_sql_runner import BigQuerySQLRunner
+from dbt_dry_run.sql_runner.cassette_sql_runner import (
+    RecordingSQLRunner,
+    ReplaySQLRunner,
+    load_cassette,
+    save_cassette,
+)
+from dbt_dry_run.sql_runner.coalescing_sql_runner import CoalescingSQLRunner
+from dbt_dry_run.sql_runner.offline_sql_runner import OfflineSQLRunner
+
+SQL_RUNNERS: Dict[flags.SQLRunnerType, Type[SQLRunner]] = {
+    flags.SQLRunnerType.BIGQUERY: BigQuerySQLRunner,
+    flags.SQLRunnerType.OFFLINE: OfflineSQLRunner,
+}
 
 
 def should_check_columns(node: Node) -> bool:
@@ -33,30 +79,172 @@ def should_check_columns(node: Node) -> bool:
 
 
 def dry_run_node(
-    runners: Dict[RunnerKey, NodeRunner], node: Node, results: Results
-) -> None:
+    runners: Dict[RunnerKey, NodeRunner],
+    node: Node,
+    results: Results,
+    retry_policy: RetryPolicy,
+    attempt: int = 1,
+    submitted_at: Optional[float] = None,
+) -> Optional[float]:
+    """
+    This method must be thread safe. Returns the number of seconds to wait before the node
+    should be submitted again if it failed with a retryable error, otherwise the result is
+    added to `results` and `None` is returned. `submitted_at` is the `time.perf_counter` when
+    the node was submitted to the executor, to trace how long it waited for a thread
+    """
+    _trace_queue_wait([node], attempt, submitted_at)
+    results.start_node(node)
+    runner_name = type(get_node_runner(node, runners)).__name__
+    with tracing.span(node.unique_id, "node", runner=runner_name, attempt=attempt):
+        NODES_IN_FLIGHT.inc()
+        try:
+            with NODE_DURATION.time(runner=runner_name):
+                dry_run_result = dispatch_node(node, runners)
+        except RetryableException as e:
+            delay = retry_policy.next_delay(attempt)
+            if delay is not None:
+                _trace_retry([node], attempt, delay, e)
+                results.retry_node(node)
+                return delay
+            dry_run_result = DryRunResult(node, None, DryRunStatus.FAILURE, e.exception)
+        finally:
+            NODES_IN_FLIGHT.dec()
+        _add_result(node, dry_run_result, attempt, results)
+    return None
+
+
+def dry_run_test_batch(
+    runner: NodeTestRunner,
+    nodes: List[Node],
+    results: Results,
+    retry_policy: RetryPolicy,
+    attempt: int = 1,
+    submitted_at: Optional[float] = None,
+) -> Optional[float]:
     """
-    This method must be thread safe
+    Like `dry_run_node` but for a batch of tests that are dry run together. The whole batch
+    is retried if any of its queries fails with a retryable error
     """
-    dry_run_result = dispatch_node(node, runners)
+    _trace_queue_wait(nodes, attempt, submitted_at)
+    for node in nodes:
+        results.start_node(node)
+    node_ids = [node.unique_id for node in nodes]
+    with tracing.span(
+        f"test batch ({len(nodes)} tests)", "node", nodes=node_ids, attempt=attempt
+    ):
+        NODES_IN_FLIGHT.inc(len(nodes))
+        try:
+            with NODE_DURATION.time(runner="TestBatch"):
+                batch_results = runner.run_batch(nodes)
+        except RetryableException as e:
+            delay = retry_policy.next_delay(attempt)
+            if delay is not None:
+                _trace_retry(nodes, attempt, delay, e)
+                for node in nodes:
+                    results.retry_node(node)
+                return delay
+            batch_results = [
+                DryRunResult(node, None, DryRunStatus.FAILURE, e.exception)
+                for node in nodes
+            ]
+        finally:
+            NODES_IN_FLIGHT.dec(len(nodes))
+        for node, dry_run_result in zip(nodes, batch_results):
+            _add_result(node, dry_run_result, attempt, results)
+    return None
+
+
+def _trace_queue_wait(
+    nodes: List[Node], attempt: int, submitted_at: Optional[float]
+) -> None:
+    if submitted_at is not None:
+        tracing.async_span(
+            "queue wait",
+            "queue",
+            submitted_at,
+            time.perf_counter(),
+            nodes=[node.unique_id for node in nodes],
+            attempt=attempt,
+        )
+
+
+def _trace_retry(
+    nodes: List[Node], attempt: int, delay: float, exception: RetryableException
+) -> None:
+    node_ids = [node.unique_id for node in nodes]
+    error = exception.exception.__class__.__name__
+    tracing.instant("retry", "retry", nodes=node_ids, attempt=attempt, error=error)
+    now = time.perf_counter()
+    tracing.async_span(
+        "retry backoff", "retry", now, now + delay, nodes=node_ids, attempt=attempt
+    )
+
+
+def _add_result(
+    node: Node, dry_run_result: DryRunResult, attempt: int, results: Results
+) -> None:
+    dry_run_result = replace(dry_run_result, retry_count=attempt - 1)
     if should_check_columns(node):
-        dry_run_result = lint_columns(node, dry_run_result)
+        with tracing.span("lint columns", "node"):
+            dry_run_result = lint_columns(node, dry_run_result)
     results.add_result(node.unique_id, dry_run_result)
 
 
+def record_result_metrics(results: Results) -> None:
+    # Recorded once the results are final, scan budget checks can still fail a node
+    for result in results.values():
+        NODES.inc(status=result.status.value)
+        if result.statistics and result.statistics.total_bytes_processed:
+            BYTES_PROCESSED.inc(
+                result.statistics.total_bytes_processed, package=result.node.package
+            )
+
+
 @contextmanager
 def create_context(
     project: ProjectService,
-) -> Generator[Tuple[SQLRunner, ThreadPoolExecutor], None, None]:
+) -> Generator[
+    Tuple[SQLRunner, ThreadPoolExecutor, ThreadPoolExecutor, ProcessPoolExecutor],
+    None,
+    None,
+]:
     sql_runner: Optional[SQLRunner]
     executor: Optional[ThreadPoolExecutor] = None
+    metadata_executor: Optional[ThreadPoolExecutor] = None
+    seed_executor: Optional[ProcessPoolExecutor] = None
+    cassette: Optional[Cassette] = None
     try:
-        sql_runner = BigQuerySQLRunner(project)
-        executor = ThreadPoolExecutor(max_workers=project.threads)
-        yield sql_runner, executor
+        if flags.REPLAY_CASSETTE:
+            sql_runner = ReplaySQLRunner(project, load_cassette(flags.REPLAY_CASSETTE))
+        else:
+            sql_runner = SQL_RUNNERS[flags.SQL_RUNNER](project)
+        if flags.RECORD_CASSETTE:
+            cassette = Cassette()
+            sql_runner = RecordingSQLRunner(sql_runner, cassette)
+        sql_runner = CoalescingSQLRunner(sql_runner)
+        executor = ThreadPoolExecutor(
+            max_workers=project.threads, thread_name_prefix="dry-run-worker"
+        )
+        # Target metadata lookups get their own threads so they never queue behind nodes
+        metadata_executor = ThreadPoolExecutor(
+            max_workers=project.threads, thread_name_prefix="target-metadata"
+        )
+        # Worker processes are only started if a large seed is parsed. They are spawned rather
+        # than forked because forking a process with running threads isn't safe
+        seed_executor = ProcessPoolExecutor(
+            max_workers=min(project.threads, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        yield sql_runner, executor, metadata_executor, seed_executor
+        if cassette is not None and flags.RECORD_CASSETTE:
+            save_cassette(cassette, flags.RECORD_CASSETTE)
     finally:
         if executor:
             executor.shutdown()
+        if metadata_executor:
+            metadata_executor.shutdown(cancel_futures=True)
+        if seed_executor:
+            seed_executor.shutdown(cancel_futures=True)
 
 
 def validate_manifest_compatibility(manifest: Manifest) -> None:
@@ -79,34 +267,189 @@ def validate_manifest_compatibility(manifest: Manifest) -> None:
         )
 
 
-def dry_run_manifest(project: ProjectService) -> Results:
+def add_full_refresh_compiled_code(
+    manifest: Manifest, full_refresh_manifest: Manifest
+) -> None:
+    for unique_id, node in manifest.nodes.items():
+        full_refresh_node = full_refresh_manifest.nodes.get(unique_id)
+        if (
+            node.config.materialized == "incremental"
+            and full_refresh_node
+            and full_refresh_node.compiled
+            and full_refresh_node.compiled_code != node.compiled_code
+        ):
+            node.full_refresh_compiled_code = full_refresh_node.compiled_code
+
+
+def dry_run_manifest(
+    project: ProjectService, listeners: Sequence[ResultListener] = ()
+) -> Results:
     executor: ThreadPoolExecutor
-    with create_context(project) as (sql_runner, executor):
-        results = Results()
+    with create_context(project) as (
+        sql_runner,
+        executor,
+        metadata_executor,
+        seed_executor,
+    ):
+        results = Results(listeners)
+        WORKER_THREADS.set(project.threads)
+        retry_policy = RetryPolicy(budget=flags.RETRY_BUDGET)
         runners = {t: runner(sql_runner, results) for t, runner in RUNNERS.items()}
+        seed_schema_cache = (
+            load_seed_schema_cache(flags.SEED_SCHEMA_CACHE)
+            if flags.SEED_SCHEMA_CACHE
+            else None
+        )
+        next_seed_schema_cache = None
+        for runner in runners.values():
+            if isinstance(runner, SeedRunner):
+                runner.use_process_pool(seed_executor)
+                if seed_schema_cache is not None:
+                    next_seed_schema_cache = runner.use_schema_cache(seed_schema_cache)
         manifest = project.get_dbt_manifest()
 
         validate_manifest_compatibility(manifest)
+        if flags.FULL_REFRESH_MANIFEST:
+            add_full_refresh_compiled_code(
+                manifest, Manifest.from_filepath(flags.FULL_REFRESH_MANIFEST)
+            )
 
         scheduler = ManifestScheduler(manifest)
+        generations = list(scheduler)
 
         print(f"Dry running {len(scheduler)} nodes")
-        for generation_id, generation in enumerate(scheduler):
-            gen_futures: Dict[str, Future[None]] = {}
+        results.start(len(scheduler))
+        if flags.PREFETCH_METADATA:
+            _prefetch_target_metadata(generations, runners, sql_runner, executor)
+        for generation in generations:
             for node in generation:
-                task_future = executor.submit(dry_run_node, runners, node, results)
-                gen_futures[node.unique_id] = task_future
-            _wait_for_generation(gen_futures)
+                get_node_runner(node, runners).prefetch_target_metadata(
+                    node, metadata_executor
+                )
 
+        for index, generation in enumerate(generations):
+            with tracing.span(
+                f"generation {index}", "generation", node_count=len(generation)
+            ):
+                _run_generation(generation, runners, results, retry_policy, executor)
+
+        check_scan_budgets(results)
+        record_result_metrics(results)
+        if next_seed_schema_cache is not None and flags.SEED_SCHEMA_CACHE:
+            save_seed_schema_cache(next_seed_schema_cache, flags.SEED_SCHEMA_CACHE)
+
+        sql_runner.update_statistics(results.statistics)
         results.finish()
     return results
 
 
-def _wait_for_generation(node_futures: Dict[str, Future[None]]) -> None:
-    futures.wait(list(node_futures.values()), timeout=None)
-    for node_id, fut in node_futures.items():
-        try:
-            fut.result()
-        except Exception as e:
-            msg = f"Node {node_id} raised unhandled exception '{e.__class__.__name__}'"
-            raise NodeExecutionException(msg) from e
+def _prefetch_target_metadata(
+    generations: List[List[Node]],
+    runners: Dict[RunnerKey, NodeRunner],
+    sql_runner: SQLRunner,
+    executor: ThreadPoolExecutor,
+) -> None:
+    metadata_nodes = [
+        node
+        for generation in generations
+        for node in generation
+        if get_node_runner(node, runners).needs_target_metadata(node)
+    ]
+    if metadata_nodes:
+        print(f"Prefetching target metadata for {len(metadata_nodes)} nodes")
+        sql_runner.prefetch_node_schemas(metadata_nodes, executor)
+
+
+def _batch_tests(
+    generation: List[Node], runners: Dict[RunnerKey, NodeRunner]
+) -> List[List[Node]]:
+    """
+    Split the generation into the groups of nodes that are dry run together. Every node is on
+    its own unless `--test-batch-size` is set, then tests are grouped into batches
+    """
+    if flags.TEST_BATCH_SIZE <= 1:
+        return [[node] for node in generation]
+    tests = [
+        node
+        for node in generation
+        if isinstance(get_node_runner(node, runners), NodeTestRunner)
+    ]
+    test_ids = {node.unique_id for node in tests}
+    work: List[List[Node]] = [
+        [node] for node in generation if node.unique_id not in test_ids
+    ]
+    for start in range(0, len(tests), flags.TEST_BATCH_SIZE):
+        work.append(tests[start : start + flags.TEST_BATCH_SIZE])
+    return work
+
+
+def _run_generation(
+    generation: List[Node],
+    runners: Dict[RunnerKey, NodeRunner],
+    results: Results,
+    retry_policy: RetryPolicy,
+    executor: ThreadPoolExecutor,
+) -> None:
+    """
+    Run every node in the generation. A node that needs to be retried is not slept on in its
+    worker thread, it goes into a delay queue and is submitted again once its backoff has
+    passed so that other nodes can use the thread in the meantime
+    """
+    running: Dict[Future[Optional[float]], Tuple[List[Node], int]] = {}
+    delayed: List[Tuple[float, int, List[Node], int]] = []
+    sequence = count()
+
+    def submit(nodes: List[Node], attempt: int) -> None:
+        submitted_at = time.perf_counter()
+        if len(nodes) == 1:
+            task_future = executor.submit(
+                dry_run_node,
+                runners,
+                nodes[0],
+                results,
+                retry_policy,
+                attempt,
+                submitted_at,
+            )
+        else:
+            runner = cast(NodeTestRunner, get_node_runner(nodes[0], runners))
+            task_future = executor.submit(
+                dry_run_test_batch,
+                runner,
+                nodes,
+                results,
+                retry_policy,
+                attempt,
+                submitted_at,
+            )
+        running[task_future] = (nodes, attempt)
+
+    for nodes in _batch_tests(generation, runners):
+        submit(nodes, 1)
+
+    while running or delayed:
+        timeout = max(0.0, delayed[0][0] - time.monotonic()) if delayed else None
+        if running:
+            done, _ = futures.wait(
+                running, timeout=timeout, return_when=futures.FIRST_COMPLETED
+            )
+        else:
+            done = set()
+            time.sleep(cast(float, timeout))
+
+        for task_future in done:
+            nodes, attempt = running.pop(task_future)
+            try:
+                delay = task_future.result()
+            except Exception as e:
+                node_ids = ", ".join(node.unique_id for node in nodes)
+                msg = f"Node {node_ids} raised unhandled exception '{e.__class__.__name__}'"
+                raise NodeExecutionException(msg) from e
+            if delay is not None:
+                due = time.monotonic() + delay
+                heapq.heappush(delayed, (due, next(sequence), nodes, attempt + 1))
+
+        now = time.monotonic()
+        while delayed and delayed[0][0] <= now:
+            _, _, nodes, attempt = heapq.heappop(delayed)
+            submit(nodes, attempt)
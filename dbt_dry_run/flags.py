@@ -1,9 +1,37 @@
 from dataclasses import dataclass
+from enum import Enum
 from typing import Optional
 
+from dbt_dry_run.retry import DEFAULT_RETRY_BUDGET
+
+
+DEFAULT_MAX_INCREMENTAL_SCAN_RATIO = 0.5
+
+
+class SQLRunnerType(str, Enum):
+    BIGQUERY = "bigquery"
+    OFFLINE = "offline"
+
+
 SKIP_NOT_COMPILED: bool = False
 FULL_REFRESH: bool = False
 EXTRA_CHECK_COLUMNS_METADATA_KEY: Optional[str] = None
+PREFETCH_METADATA: bool = False
+RETRY_BUDGET: int = DEFAULT_RETRY_BUDGET
+SQL_RUNNER: SQLRunnerType = SQLRunnerType.BIGQUERY
+RECORD_CASSETTE: Optional[str] = None
+REPLAY_CASSETTE: Optional[str] = None
+BIGQUERY_API_ENDPOINT: Optional[str] = None
+MAX_BYTES_PROCESSED: Optional[int] = None
+BASELINE_REPORT: Optional[str] = None
+MAX_BYTES_PROCESSED_GROWTH: Optional[float] = None
+FULL_REFRESH_MANIFEST: Optional[str] = None
+MAX_INCREMENTAL_SCAN_RATIO: float = DEFAULT_MAX_INCREMENTAL_SCAN_RATIO
+TEST_BATCH_SIZE: int = 0
+LOCAL_GENERIC_TESTS: bool = False
+SEED_SAMPLE_ROWS: Optional[int] = None
+SEED_SCHEMA_CACHE: Optional[str] = None
+SEED_SCHEMA_CACHE_TRUST_MTIME: bool = False
 
 
 @dataclass
@@ -11,6 +39,22 @@ class Flags:
     skip_not_compiled: bool = False
     full_refresh: bool = False
     extra_check_columns_metadata_key: Optional[str] = None
+    prefetch_metadata: bool = False
+    retry_budget: int = DEFAULT_RETRY_BUDGET
+    sql_runner: SQLRunnerType = SQLRunnerType.BIGQUERY
+    record_cassette: Optional[str] = None
+    replay_cassette: Optional[str] = None
+    bigquery_api_endpoint: Optional[str] = None
+    max_bytes_processed: Optional[int] = None
+    baseline_report: Optional[str] = None
+    max_bytes_processed_growth: Optional[float] = None
+    full_refresh_manifest: Optional[str] = None
+    max_incremental_scan_ratio: float = DEFAULT_MAX_INCREMENTAL_SCAN_RATIO
+    test_batch_size: int = 0
+    local_generic_tests: bool = False
+    seed_sample_rows: Optional[int] = None
+    seed_schema_cache: Optional[str] = None
+    seed_schema_cache_trust_mtime: bool = False
 
 
 _DEFAULT_FLAGS = Flags()
@@ -20,9 +64,41 @@ def set_flags(flags: Flags) -> None:
     global SKIP_NOT_COMPILED
     global FULL_REFRESH
     global EXTRA_CHECK_COLUMNS_METADATA_KEY
+    global PREFETCH_METADATA
+    global RETRY_BUDGET
+    global SQL_RUNNER
+    global RECORD_CASSETTE
+    global REPLAY_CASSETTE
+    global BIGQUERY_API_ENDPOINT
+    global MAX_BYTES_PROCESSED
+    global BASELINE_REPORT
+    global MAX_BYTES_PROCESSED_GROWTH
+    global FULL_REFRESH_MANIFEST
+    global MAX_INCREMENTAL_SCAN_RATIO
+    global TEST_BATCH_SIZE
+    global LOCAL_GENERIC_TESTS
+    global SEED_SAMPLE_ROWS
+    global SEED_SCHEMA_CACHE
+    global SEED_SCHEMA_CACHE_TRUST_MTIME
     SKIP_NOT_COMPILED = flags.skip_not_compiled
     FULL_REFRESH = flags.full_refresh
     EXTRA_CHECK_COLUMNS_METADATA_KEY = flags.extra_check_columns_metadata_key
+    PREFETCH_METADATA = flags.prefetch_metadata
+    RETRY_BUDGET = flags.retry_budget
+    SQL_RUNNER = flags.sql_runner
+    RECORD_CASSETTE = flags.record_cassette
+    REPLAY_CASSETTE = flags.replay_cassette
+    BIGQUERY_API_ENDPOINT = flags.bigquery_api_endpoint
+    MAX_BYTES_PROCESSED = flags.max_bytes_processed
+    BASELINE_REPORT = flags.baseline_report
+    MAX_BYTES_PROCESSED_GROWTH = flags.max_bytes_processed_growth
+    FULL_REFRESH_MANIFEST = flags.full_refresh_manifest
+    MAX_INCREMENTAL_SCAN_RATIO = flags.max_incremental_scan_ratio
+    TEST_BATCH_SIZE = flags.test_batch_size
+    LOCAL_GENERIC_TESTS = flags.local_generic_tests
+    SEED_SAMPLE_ROWS = flags.seed_sample_rows
+    SEED_SCHEMA_CACHE = flags.seed_schema_cache
+    SEED_SCHEMA_CACHE_TRUST_MTIME = flags.seed_schema_cache_trust_mtime
 
 
 def reset_flags() -> None:
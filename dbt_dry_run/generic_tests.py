@@ -0,0 +1,189 @@
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from dbt_dry_run.exception import InvalidGenericTestException
+from dbt_dry_run.models import BigQueryFieldMode, BigQueryFieldType, Table, TableField
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.manifest import Node
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.results import Results
+
+_COLUMN_PATH = re.compile(
+    r"^`?([A-Za-z_][A-Za-z0-9_]*)`?(\.`?[A-Za-z_][A-Za-z0-9_]*`?)*$"
+)
+
+_UNGROUPABLE_TYPES = {
+    BigQueryFieldType.RECORD,
+    BigQueryFieldType.STRUCT,
+    BigQueryFieldType.GEOGRAPHY,
+    BigQueryFieldType.JSON,
+}
+_NUMERIC_TYPES = {
+    BigQueryFieldType.INTEGER,
+    BigQueryFieldType.INT64,
+    BigQueryFieldType.FLOAT,
+    BigQueryFieldType.FLOAT64,
+    BigQueryFieldType.NUMERIC,
+    BigQueryFieldType.BIGNUMERIC,
+}
+# A quoted value in `accepted_values` is a string literal, which BigQuery only coerces to these
+_STRING_LITERAL_TYPES = {
+    BigQueryFieldType.STRING,
+    BigQueryFieldType.DATE,
+    BigQueryFieldType.DATETIME,
+    BigQueryFieldType.TIME,
+    BigQueryFieldType.TIMESTAMP,
+}
+_SAME_TYPES = {
+    BigQueryFieldType.INT64: BigQueryFieldType.INTEGER,
+    BigQueryFieldType.FLOAT64: BigQueryFieldType.FLOAT,
+    BigQueryFieldType.BOOL: BigQueryFieldType.BOOLEAN,
+    BigQueryFieldType.STRUCT: BigQueryFieldType.RECORD,
+}
+
+
+class _CannotValidate(Exception):
+    """
+    The test can't be validated locally with certainty so it has to be dry run
+    """
+
+
+def _get_table(results: Results, unique_id: Optional[str]) -> Table:
+    if not unique_id or unique_id not in results:
+        raise _CannotValidate()
+    table = results.get_result(unique_id).table
+    if table is None:
+        raise _CannotValidate()
+    return table
+
+
+def _get_column(table: Table, column_name: Any, node_id: str) -> TableField:
+    if not isinstance(column_name, str) or not _COLUMN_PATH.match(column_name):
+        # An expression rather than a column
+        raise _CannotValidate()
+    fields: Optional[List[TableField]] = table.fields
+    field: Optional[TableField] = None
+    for part in column_name.replace("`", "").split("."):
+        if field is not None and field.mode == BigQueryFieldMode.REPEATED:
+            raise _CannotValidate()
+        field = next(
+            (f for f in fields or [] if f.name.lower() == part.lower()),
+            None,
+        )
+        if field is None:
+            raise InvalidGenericTestException(
+                f"Column '{column_name}' does not exist in '{node_id}'"
+            )
+        fields = field.fields
+    assert field is not None
+    return field
+
+
+def _normalise_type(field: TableField) -> BigQueryFieldType:
+    return _SAME_TYPES.get(field.type_, field.type_)
+
+
+def _check_groupable(field: TableField, column_name: str) -> None:
+    if field.mode == BigQueryFieldMode.REPEATED or field.type_ in _UNGROUPABLE_TYPES:
+        raise InvalidGenericTestException(
+            f"Column '{column_name}' of type {field.type_.value} can't be grouped by"
+        )
+
+
+def _tested_node_id(node: Node) -> Optional[str]:
+    if node.attached_node:
+        return node.attached_node
+    if len(node.depends_on.nodes) == 1:
+        return node.depends_on.nodes[0]
+    return None
+
+
+def _column_name(node: Node, kwargs: Dict[str, Any]) -> Any:
+    return node.column_name or kwargs.get("column_name")
+
+
+def validate_not_null(node: Node, kwargs: Dict[str, Any], results: Results) -> None:
+    tested_id = _tested_node_id(node)
+    _get_column(
+        _get_table(results, tested_id), _column_name(node, kwargs), str(tested_id)
+    )
+
+
+def validate_unique(node: Node, kwargs: Dict[str, Any], results: Results) -> None:
+    tested_id = _tested_node_id(node)
+    column_name = _column_name(node, kwargs)
+    field = _get_column(_get_table(results, tested_id), column_name, str(tested_id))
+    _check_groupable(field, column_name)
+
+
+def validate_accepted_values(
+    node: Node, kwargs: Dict[str, Any], results: Results
+) -> None:
+    tested_id = _tested_node_id(node)
+    column_name = _column_name(node, kwargs)
+    field = _get_column(_get_table(results, tested_id), column_name, str(tested_id))
+    _check_groupable(field, column_name)
+    if not kwargs.get("quote", True):
+        # Unquoted values are SQL expressions
+        raise _CannotValidate()
+    if _normalise_type(field) not in _STRING_LITERAL_TYPES:
+        raise InvalidGenericTestException(
+            f"Column '{column_name}' of type {field.type_.value} can't be compared with "
+            f"quoted accepted values, set `quote: false`"
+        )
+
+
+def validate_relationships(
+    node: Node, kwargs: Dict[str, Any], results: Results
+) -> None:
+    tested_id = node.attached_node
+    others = [n for n in node.depends_on.nodes if n != tested_id]
+    if tested_id is None or len(others) > 1:
+        raise _CannotValidate()
+    parent_id = others[0] if others else tested_id
+    column_name = _column_name(node, kwargs)
+    child = _get_column(_get_table(results, tested_id), column_name, tested_id)
+    parent = _get_column(_get_table(results, parent_id), kwargs.get("field"), parent_id)
+    child_type, parent_type = _normalise_type(child), _normalise_type(parent)
+    comparable = (
+        child_type == parent_type or {child_type, parent_type} <= _NUMERIC_TYPES
+    )
+    if (
+        not comparable
+        or child_type in _UNGROUPABLE_TYPES
+        or BigQueryFieldMode.REPEATED in (child.mode, parent.mode)
+    ):
+        # BigQuery coerces some pairs of types when joining so only a dry run can say
+        raise _CannotValidate()
+
+
+GENERIC_TEST_VALIDATORS: Dict[str, Callable[[Node, Dict[str, Any], Results], None]] = {
+    "not_null": validate_not_null,
+    "unique": validate_unique,
+    "accepted_values": validate_accepted_values,
+    "relationships": validate_relationships,
+}
+
+
+def validate_generic_test(node: Node, results: Results) -> Optional[DryRunResult]:
+    """
+    Validate one of dbt's built in generic tests against the predicted schemas of the models
+    it tests instead of dry running it. Returns `None` if the test isn't a built in generic
+    test or can't be validated with certainty, in which case it has to be dry run
+    """
+    test_metadata = node.test_metadata
+    if (
+        test_metadata is None
+        or test_metadata.namespace is not None
+        or node.config.where
+        or test_metadata.name not in GENERIC_TEST_VALIDATORS
+    ):
+        return None
+    validator = GENERIC_TEST_VALIDATORS[test_metadata.name]
+    try:
+        validator(node, test_metadata.arguments, results)
+    except _CannotValidate:
+        return None
+    except InvalidGenericTestException as e:
+        return DryRunResult(node, None, DryRunStatus.FAILURE, e)
+    return DryRunResult(node, None, DryRunStatus.SUCCESS, None)
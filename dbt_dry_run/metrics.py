@@ -0,0 +1,305 @@
+import math
+import os
+import time
+from abc import ABCMeta, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock
+from typing import Dict, Generator, List, Sequence, Tuple, Union
+
+LabelValues = Tuple[str, ...]
+
+# Seconds, from a cached answer to a query that is close to timing out
+DEFAULT_LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_value(value: Union[int, float]) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}"
+
+
+class _Metric(metaclass=ABCMeta):
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f"Metric '{self.name}' has labels {list(self.label_names)}, got {list(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    @abstractmethod
+    def reset(self) -> None: ...
+
+    @abstractmethod
+    def samples(self) -> List[str]: ...
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+            *self.samples(),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values = {} if self.label_names else {(): 0}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError(f"Counter '{self.name}' can't be decreased")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._label_values(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Gauge(Counter):
+    metric_type = "gauge"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class _HistogramValues:
+    def __init__(self, bucket_count: int):
+        # Observations in each bucket, not cumulative
+        self.buckets = [0] * bucket_count
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: Dict[LabelValues, _HistogramValues] = {}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._label_values(labels)
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = _HistogramValues(len(self.buckets))
+            values.buckets[bucket] += 1
+            values.count += 1
+            values.sum += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Generator[None, None, None]:
+        """
+        Observe how long the block takes, even if it raises
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        values = self._values.get(self._label_values(labels))
+        return values.count if values else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(
+                (key, (list(v.buckets), v.count, v.sum))
+                for key, v in self._values.items()
+            )
+        lines: List[str] = []
+        bucket_label_names = self.label_names + ("le",)
+        for key, (buckets, count, total) in values:
+            cumulative = 0
+            for upper_bound, observations in zip(self.buckets, buckets):
+                cumulative += observations
+                labels = _format_labels(
+                    bucket_label_names, key + (_format_value(upper_bound),)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    The metrics recorded during a run, rendered in the Prometheus text format that
+    node-exporter's textfile collector reads
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self._metrics[metric.name] = metric
+
+    def counter(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> Counter:
+        counter = Counter(name, documentation, labels)
+        self.register(counter)
+        return counter
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        gauge = Gauge(name, documentation, labels)
+        self.register(gauge)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        histogram = Histogram(name, documentation, labels, buckets)
+        self.register(histogram)
+        return histogram
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def render(self) -> str:
+        return "".join(metric.render() for metric in self._metrics.values())
+
+    def write_textfile(self, path: str) -> None:
+        # node-exporter can read the file at any time so it is replaced in one step. The
+        # temporary file is in the same directory so that the rename is atomic
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(self.render())
+        os.replace(temp_path, path)
+
+
+REGISTRY = MetricsRegistry()
+
+NODE_DURATION = REGISTRY.histogram(
+    "dbt_dry_run_node_duration_seconds",
+    "Time taken to dry run a node, or a batch of tests, for each attempt",
+    ["runner"],
+)
+NODES = REGISTRY.counter(
+    "dbt_dry_run_nodes_total", "Nodes dry run by their result status", ["status"]
+)
+NODES_IN_FLIGHT = REGISTRY.gauge(
+    "dbt_dry_run_nodes_in_flight", "Nodes that are being dry run right now"
+)
+WORKER_THREADS = REGISTRY.gauge(
+    "dbt_dry_run_worker_threads", "Threads that nodes are dry run on"
+)
+BIGQUERY_CLIENTS = REGISTRY.counter(
+    "dbt_dry_run_bigquery_clients_created_total",
+    "BigQuery clients opened by the worker threads",
+)
+BIGQUERY_REQUEST_DURATION = REGISTRY.histogram(
+    "dbt_dry_run_bigquery_request_duration_seconds",
+    "Time taken by each BigQuery API call",
+    ["call"],
+)
+BIGQUERY_RETRYABLE_ERRORS = REGISTRY.counter(
+    "dbt_dry_run_bigquery_retryable_errors_total",
+    "BigQuery API calls that failed with an error that can be retried",
+    ["call"],
+)
+BIGQUERY_THROTTLED = REGISTRY.counter(
+    "dbt_dry_run_bigquery_throttled_total",
+    "BigQuery API calls that were rejected by a rate limit",
+    ["call"],
+)
+RETRIES = REGISTRY.counter(
+    "dbt_dry_run_retries_total", "Retries scheduled for nodes that failed transiently"
+)
+RETRIES_REFUSED = REGISTRY.counter(
+    "dbt_dry_run_retries_refused_total",
+    "Nodes that failed transiently but weren't retried",
+    ["reason"],
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "dbt_dry_run_cache_requests_total",
+    "Lookups in the run's caches by whether they were answered from it",
+    ["cache", "result"],
+)
+BYTES_PROCESSED = REGISTRY.counter(
+    "dbt_dry_run_bytes_processed_total",
+    "Bytes BigQuery estimates the dry run queries would process",
+    ["package"],
+)
+RUN_DURATION = REGISTRY.gauge(
+    "dbt_dry_run_run_duration_seconds", "How long the last dry run took"
+)
+RUN_SUCCESS = REGISTRY.gauge(
+    "dbt_dry_run_success", "1 if the last dry run succeeded, otherwise 0"
+)
+RUN_TIMESTAMP = REGISTRY.gauge(
+    "dbt_dry_run_last_run_timestamp_seconds", "When the last dry run finished"
+)
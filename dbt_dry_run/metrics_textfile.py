@@ -0,0 +1,63 @@
+import time
+from threading import Event, Thread
+from types import TracebackType
+from typing import Optional, Type
+
+from dbt_dry_run.metrics import REGISTRY, RUN_DURATION, RUN_SUCCESS, RUN_TIMESTAMP
+from dbt_dry_run.models.report import DryRunStatus, LintingStatus
+from dbt_dry_run.results import ResultListener, Results
+
+
+class MetricsTextfileWriter(ResultListener):
+    """
+    Writes the metrics to a textfile for node-exporter when the run finishes and, if
+    `interval` is set, every `interval` seconds while it is running. Use as a context manager
+    so the thread is stopped if the run fails
+    """
+
+    def __init__(self, path: str, interval: Optional[float] = None):
+        self._path = path
+        self._interval = interval
+        self._start_time = time.monotonic()
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+
+    def __enter__(self) -> "MetricsTextfileWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self._stop()
+
+    def on_start(self, node_count: int) -> None:
+        self._start_time = time.monotonic()
+        if self._interval:
+            self._thread = Thread(target=self._write_periodically, daemon=True)
+            self._thread.start()
+
+    def on_finish(self, results: Results) -> None:
+        self._stop()
+        success = all(
+            result.status == DryRunStatus.SUCCESS
+            and result.linting_status != LintingStatus.FAILURE
+            for result in results.values()
+        )
+        RUN_DURATION.set(time.monotonic() - self._start_time)
+        RUN_SUCCESS.set(int(success))
+        RUN_TIMESTAMP.set(time.time())
+        REGISTRY.write_textfile(self._path)
+
+    def _stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _write_periodically(self) -> None:
+        assert self._interval is not None
+        while not self._stopped.wait(self._interval):
+            REGISTRY.write_textfile(self._path)
@@ -1,6 +1,7 @@
 from .manifest import Macro, Manifest, Node, NodeConfig, NodeDependsOn, OnSchemaChange
 from .profile import BigQueryConnectionMethod, Output, Profile
-from .report import Report, ReportNode
+from .query_statistics import QueryStatistics
+from .report import Report, ReportNode, RunStatistics
 from .table import BigQueryFieldMode, BigQueryFieldType, Table, TableField
 
 __all__ = [
@@ -17,6 +18,8 @@ __all__ = [
     "Profile",
     "Output",
     "BigQueryConnectionMethod",
+    "QueryStatistics",
     "Report",
     "ReportNode",
+    "RunStatistics",
 ]
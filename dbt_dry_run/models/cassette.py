@@ -0,0 +1,28 @@
+from typing import Dict, Optional
+
+from pydantic import Field
+from pydantic.main import BaseModel
+
+from .dry_run_result import DryRunStatus
+from .query_statistics import QueryStatistics
+from .table import Table
+
+CASSETTE_VERSION = 1
+
+
+class RecordedException(BaseModel):
+    type: str
+    message: str
+
+
+class RecordedQuery(BaseModel):
+    status: DryRunStatus
+    table: Optional[Table]
+    exception: Optional[RecordedException]
+    statistics: Optional[QueryStatistics] = None
+
+
+class Cassette(BaseModel):
+    version: int = CASSETTE_VERSION
+    queries: Dict[str, RecordedQuery] = Field(default_factory=dict)
+    schemas: Dict[str, Optional[Table]] = Field(default_factory=dict)
@@ -3,6 +3,7 @@ from enum import Enum
 from typing import List, Optional
 
 from .manifest import Node
+from .query_statistics import QueryStatistics
 from .table import Table
 
 
@@ -32,6 +33,8 @@ class DryRunResult:
     exception: Optional[Exception]
     linting_status: LintingStatus = LintingStatus.SKIPPED
     linting_errors: List[LintingError] = field(default_factory=lambda: [])
+    retry_count: int = 0
+    statistics: Optional[QueryStatistics] = None
 
     def replace_table(self, table: Table) -> "DryRunResult":
         return DryRunResult(
@@ -39,6 +42,8 @@ class DryRunResult:
             table=table,
             status=self.status,
             exception=self.exception,
+            retry_count=self.retry_count,
+            statistics=self.statistics,
         )
 
     def with_linting_errors(self, linting_errors: List[LintingError]) -> "DryRunResult":
@@ -53,4 +58,6 @@ class DryRunResult:
             exception=self.exception,
             linting_errors=linting_errors,
             linting_status=linting_status,
+            retry_count=self.retry_count,
+            statistics=self.statistics,
         )
@@ -0,0 +1,148 @@
+import hashlib
+from dataclasses import dataclass
+from functools import cached_property
+from threading import Lock
+from typing import List, Optional, Sequence, Tuple
+from weakref import WeakValueDictionary
+
+from .table import BigQueryFieldMode, BigQueryFieldType, Table, TableField
+
+
+def _fingerprint(*parts: Optional[str]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(b"-" if part is None else f"{len(part)}:{part}".encode())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, eq=False)
+class FrozenField:
+    name: str
+    type_: BigQueryFieldType
+    mode: Optional[BigQueryFieldMode]
+    fields: Optional["FrozenSchema"]
+    description: Optional[str]
+    fingerprint: str
+
+    def __eq__(self, other: object) -> bool:
+        return self is other or (
+            isinstance(other, FrozenField) and self.fingerprint == other.fingerprint
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    @cached_property
+    def table_field(self) -> TableField:
+        # The fields were validated when they were first converted so they aren't validated again
+        return TableField.model_construct(
+            name=self.name,
+            type_=self.type_,
+            mode=self.mode,
+            fields=self.fields.table_fields if self.fields is not None else None,
+            description=self.description,
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class FrozenSchema:
+    """
+    An immutable table schema. Schemas are interned, so converting two equal `Table`s gives the
+    same `FrozenSchema` with the same nested fields, and compared by a fingerprint of their
+    fields that is computed once. Use `from_table` and `to_table` to convert at the edges
+    """
+
+    fields: Tuple[FrozenField, ...]
+    fingerprint: str
+
+    def __eq__(self, other: object) -> bool:
+        return self is other or (
+            isinstance(other, FrozenSchema) and self.fingerprint == other.fingerprint
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    @classmethod
+    def from_table(cls, table: Table) -> "FrozenSchema":
+        schema = _INTERNER.by_table(table)
+        if schema is not None:
+            return schema
+        return _INTERNER.schema(table.fields)
+
+    @cached_property
+    def table_fields(self) -> List[TableField]:
+        return [field.table_field for field in self.fields]
+
+    def to_table(self) -> Table:
+        """
+        The same `Table` is returned every time and shared by everything with this schema so it
+        must not be mutated
+        """
+        return self._table
+
+    @cached_property
+    def _table(self) -> Table:
+        table = Table.model_construct(fields=self.table_fields)
+        _INTERNER.remember_table(table, self)
+        return table
+
+
+class _SchemaInterner:
+    """
+    Holds every schema and field that is still referenced, keyed on their fingerprint, and the
+    schema of every `Table` made by `FrozenSchema.to_table`. A table is only looked up by id
+    while its schema is alive, and the schema keeps the table alive, so ids are never reused
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._fields: WeakValueDictionary[str, FrozenField] = WeakValueDictionary()
+        self._schemas: WeakValueDictionary[str, FrozenSchema] = WeakValueDictionary()
+        self._tables: WeakValueDictionary[int, FrozenSchema] = WeakValueDictionary()
+
+    def field(self, field: TableField) -> FrozenField:
+        nested = self.schema(field.fields) if field.fields is not None else None
+        fingerprint = _fingerprint(
+            field.name,
+            field.type_.value,
+            field.mode.value if field.mode else None,
+            field.description,
+            nested.fingerprint if nested is not None else None,
+        )
+        with self._lock:
+            frozen = self._fields.get(fingerprint)
+            if frozen is None:
+                frozen = FrozenField(
+                    field.name,
+                    field.type_,
+                    field.mode,
+                    nested,
+                    field.description,
+                    fingerprint,
+                )
+                self._fields[fingerprint] = frozen
+        return frozen
+
+    def schema(self, fields: Sequence[TableField]) -> FrozenSchema:
+        frozen_fields = tuple(self.field(field) for field in fields)
+        fingerprint = _fingerprint(*(field.fingerprint for field in frozen_fields))
+        with self._lock:
+            frozen = self._schemas.get(fingerprint)
+            if frozen is None:
+                frozen = FrozenSchema(frozen_fields, fingerprint)
+                self._schemas[fingerprint] = frozen
+        return frozen
+
+    def by_table(self, table: Table) -> Optional[FrozenSchema]:
+        schema = self._tables.get(id(table))
+        if schema is not None and schema.to_table() is table:
+            return schema
+        return None
+
+    def remember_table(self, table: Table, schema: FrozenSchema) -> None:
+        with self._lock:
+            self._tables[id(table)] = schema
+
+
+_INTERNER = _SchemaInterner()
@@ -90,6 +90,15 @@ class NodeConfig(BaseModel):
     column_types: Dict[str, str] = Field(default_factory=dict)
     delimiter: Optional[str] = None
     hard_deletes: Optional[Literal["ignore", "invalidate", "new_record"]] = None
+    where: Optional[str] = None
+
+
+class GenericTestMetadata(BaseModel):
+    name: str
+    arguments: Dict[str, Any] = Field(default_factory=dict, alias="kwargs")
+    namespace: Optional[str] = None
+
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ManifestColumn(BaseModel):
@@ -119,11 +128,17 @@ class Node(BaseModel):
     alias: str
     language: Optional[str] = None
     resource_type: str
+    package_name: Optional[str] = None
     original_file_path: str
     root_path: Optional[str] = None
     columns: Dict[str, ManifestColumn] = Field(default_factory=dict)
     meta: Optional[NodeMeta] = None
     external: Optional[ExternalConfig] = None
+    test_metadata: Optional[GenericTestMetadata] = None
+    attached_node: Optional[str] = None
+    column_name: Optional[str] = None
+    # Set from `--full-refresh-manifest`, not part of the dbt manifest
+    full_refresh_compiled_code: Optional[str] = None
 
     @model_validator(mode="before")
     def default_alias(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -142,6 +157,13 @@ class Node(BaseModel):
             name=name_param,
         )
 
+    @property
+    def package(self) -> str:
+        if self.package_name:
+            return self.package_name
+        # unique ids look like `model.<package>.<name>`
+        return self.unique_id.split(".")[1] if "." in self.unique_id else ""
+
     def get_table_ref_literal(self) -> str:
         return self.table_ref.bq_literal
 
@@ -0,0 +1,11 @@
+from typing import List, Optional
+
+from pydantic import Field
+from pydantic.main import BaseModel
+
+
+class QueryStatistics(BaseModel):
+    total_bytes_processed: Optional[int] = None
+    referenced_tables: List[str] = Field(default_factory=list)
+    # Only set for incremental models checked with `--full-refresh-manifest`
+    full_refresh_bytes_processed: Optional[int] = None
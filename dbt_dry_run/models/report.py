@@ -1,9 +1,10 @@
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import Field
 from pydantic.main import BaseModel
 
 from .dry_run_result import DryRunStatus, LintingStatus
+from .query_statistics import QueryStatistics
 from .table import Table
 
 
@@ -12,20 +13,68 @@ class ReportLintingError(BaseModel):
     message: str
 
 
-class ReportNode(BaseModel):
+class ReportNodeResult(BaseModel):
     unique_id: str
     success: bool
     status: DryRunStatus
     error_message: Optional[str]
-    table: Optional[Table]
     linting_status: LintingStatus
     linting_errors: List[ReportLintingError]
+    retry_count: int = 0
+    statistics: Optional[QueryStatistics] = None
+
+
+class ReportNode(ReportNodeResult):
+    table: Optional[Table]
+
 
+class RunStatistics(BaseModel):
+    bigquery_clients_created: int = 0
+    bigquery_client_acquisitions: int = 0
+    bigquery_client_acquisition_seconds: float = 0.0
+    coalesced_queries: int = 0
+    cached_queries: int = 0
+    coalesced_schema_lookups: int = 0
+    cached_schema_lookups: int = 0
+    seed_schema_cache_hits: int = 0
+    seed_schema_cache_misses: int = 0
 
-class Report(BaseModel):
+
+class ReportSummary(BaseModel):
     success: bool
     execution_time: Optional[float]
     node_count: int = Field(..., ge=0)
     failure_count: int = Field(..., ge=0)
     failed_node_ids: List[str] = []
+    total_bytes_processed: int = 0
+    bytes_processed_by_package: Dict[str, int] = Field(default_factory=dict)
+    statistics: RunStatistics = Field(default_factory=RunStatistics)
+
+
+class Report(ReportSummary):
     nodes: List[ReportNode]
+
+
+class NDJSONNodeRecord(ReportNode):
+    record: Literal["node"] = "node"
+
+
+class NDJSONSummaryRecord(ReportSummary):
+    record: Literal["summary"] = "summary"
+
+
+class CompactReportNode(ReportNodeResult):
+    schema_id: Optional[str] = None
+
+
+class CompactReport(ReportSummary):
+    """
+    A `Report` where each distinct table schema is stored once in `schemas`, keyed by its
+    fingerprint, and nodes refer to it by `schema_id`. Tables are left out altogether if
+    `tables_included` is false
+    """
+
+    compact_report_version: int
+    tables_included: bool = True
+    schemas: Dict[str, Table] = Field(default_factory=dict)
+    nodes: List[CompactReportNode]
@@ -0,0 +1,22 @@
+from typing import Dict
+
+from pydantic import Field
+from pydantic.main import BaseModel
+
+from .table import Table
+
+SEED_SCHEMA_CACHE_VERSION = 1
+
+
+class SeedFileState(BaseModel):
+    size: int
+    mtime_ns: int
+    content_hash: str
+
+
+class SeedSchemaCache(BaseModel):
+    version: int = SEED_SCHEMA_CACHE_VERSION
+    # Keyed on the seed's content hash and everything else that changes its inferred schema
+    schemas: Dict[str, Table] = Field(default_factory=dict)
+    # The content hash of each seed file when it was last hashed, keyed on its path
+    files: Dict[str, SeedFileState] = Field(default_factory=dict)
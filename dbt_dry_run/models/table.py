@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import pydantic
 from google.cloud.bigquery import SchemaField
@@ -54,6 +54,68 @@ class TableField(BaseModel):
 
 TableField.model_rebuild()
 
+_FIELD_TYPES: Dict[str, BigQueryFieldType] = {
+    field_type.value: field_type for field_type in BigQueryFieldType
+}
+_FIELD_MODES: Dict[str, BigQueryFieldMode] = {
+    field_mode.value: field_mode for field_mode in BigQueryFieldMode
+}
+
+
+def _trusted_table_fields(
+    api_fields: Sequence[Any], leaf_fields: Optional[List[TableField]]
+) -> Optional[List[TableField]]:
+    table_fields = []
+    for api_field in api_fields:
+        if not isinstance(api_field, dict):
+            return None
+        field_type = api_field.get("type")
+        field_mode = api_field.get("mode", "NULLABLE")
+        name = api_field.get("name")
+        nested_api_fields = api_field.get("fields", [])
+        if not (
+            isinstance(field_type, str)
+            and isinstance(field_mode, str)
+            and isinstance(name, str)
+            and isinstance(nested_api_fields, list)
+        ):
+            return None
+        type_ = _FIELD_TYPES.get(field_type.upper())
+        mode = _FIELD_MODES.get(field_mode.upper())
+        if type_ is None or mode is None:
+            return None
+        if nested_api_fields:
+            nested_fields = _trusted_table_fields(nested_api_fields, leaf_fields)
+            if nested_fields is None:
+                return None
+        else:
+            nested_fields = None if leaf_fields is None else list(leaf_fields)
+        table_fields.append(
+            # The fields have just been checked so they aren't validated again
+            TableField.model_construct(
+                name=name,
+                type_=type_,
+                mode=mode,
+                fields=nested_fields,
+                description=api_field.get("description"),
+            )
+        )
+    return table_fields
+
+
+def trusted_table_fields(
+    schema: Sequence[SchemaField], leaf_fields: Optional[List[TableField]] = None
+) -> Optional[List[TableField]]:
+    """
+    Convert a schema returned by BigQuery without validating it again. The field types and
+    modes are looked up in precomputed maps from the raw API response rather than through the
+    `SchemaField` properties, which build new objects on every access. `leaf_fields` is what
+    fields without nested fields get. Returns `None` if anything in the schema isn't known, in
+    which case it must be converted with validation to get the error
+    """
+    api_fields = [getattr(field, "_properties", None) for field in schema]
+    return _trusted_table_fields(api_fields, leaf_fields)
+
 
 class TableFieldWithPath(BaseModel):
     field: TableField
@@ -92,6 +154,10 @@ class Table(BaseModel):
         if schema is None:
             return []
 
+        trusted_fields = trusted_table_fields(schema, leaf_fields=[])
+        if trusted_fields is not None:
+            return trusted_fields
+
         for field in schema:
             table_field = TableField(
                 name=field.name,
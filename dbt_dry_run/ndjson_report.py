@@ -0,0 +1,38 @@
+from threading import Lock
+from typing import TextIO
+
+from pydantic import BaseModel
+
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.report import NDJSONNodeRecord, NDJSONSummaryRecord
+from dbt_dry_run.result_reporter import ResultReporter, to_report_node
+from dbt_dry_run.results import ResultListener, Results
+
+
+class NDJSONReportWriter(ResultListener):
+    """
+    Writes the report as newline delimited JSON while the dry run is running: one `node` record
+    per result as soon as it is added, then a `summary` record with the rest of the report when
+    the run finishes. Each record is flushed so the file can be tailed. The writer doesn't keep
+    the records, but the results are still held by `Results` for the rest of the run. If a node
+    has more than one record the last one is its result
+    """
+
+    def __init__(self, output: TextIO):
+        self._output = output
+        self._lock = Lock()
+
+    def _write(self, record: BaseModel) -> None:
+        line = record.model_dump_json(by_alias=True)
+        with self._lock:
+            self._output.write(line)
+            self._output.write("\n")
+            self._output.flush()
+
+    def on_result(self, result: DryRunResult) -> None:
+        report_node = to_report_node(result)
+        self._write(NDJSONNodeRecord.model_construct(**dict(report_node)))
+
+    def on_finish(self, results: Results) -> None:
+        summary = ResultReporter(results, set()).get_report_summary()
+        self._write(NDJSONSummaryRecord.model_construct(**dict(summary)))
@@ -35,12 +35,16 @@ def _get_node_runner_key(node: Node) -> RunnerKey:
     return RunnerKey(node.resource_type, node.config.materialized)
 
 
-def dispatch_node(node: Node, runners: Dict[RunnerKey, NodeRunner]) -> DryRunResult:
+def get_node_runner(node: Node, runners: Dict[RunnerKey, NodeRunner]) -> NodeRunner:
     _runner_key = _get_node_runner_key(node)
     try:
-        runner = runners[_runner_key]
+        return runners[_runner_key]
     except KeyError:
         raise ValueError(f"Unknown node '{_runner_key}'")
+
+
+def dispatch_node(node: Node, runners: Dict[RunnerKey, NodeRunner]) -> DryRunResult:
+    runner = get_node_runner(node, runners)
     validation_result = runner.check_node_compiled(node)
     if validation_result:
         return validation_result
@@ -1,8 +1,10 @@
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from concurrent.futures import Executor, Future
+from typing import Dict, Optional
 
 from dbt_dry_run import flags
 from dbt_dry_run.exception import NotCompiledException
+from dbt_dry_run.models import Table
 from dbt_dry_run.models.dry_run_result import DryRunResult
 from dbt_dry_run.models.manifest import Node
 from dbt_dry_run.models.report import DryRunStatus
@@ -18,10 +20,34 @@ class NodeRunner(metaclass=ABCMeta):
     def __init__(self, sql_runner: SQLRunner, results: Results):
         self._sql_runner = sql_runner
         self._results = results
+        self._target_schemas: Dict[str, Future[Optional[Table]]] = {}
 
     @abstractmethod
     def run(self, node: Node) -> DryRunResult: ...
 
+    def needs_target_metadata(self, node: Node) -> bool:
+        """
+        Whether `run` will look up the schema or existence of the node in the target environment
+        """
+        return False
+
+    def prefetch_target_metadata(self, node: Node, executor: Executor) -> None:
+        """
+        Start looking up the node in the target environment in the background. It doesn't
+        depend on any upstream result so it can run while the upstreams are still running.
+        Must be called before the node runs
+        """
+        if self.needs_target_metadata(node):
+            self._target_schemas[node.unique_id] = executor.submit(
+                self._sql_runner.get_node_schema, node
+            )
+
+    def get_target_schema(self, node: Node) -> Optional[Table]:
+        future = self._target_schemas.pop(node.unique_id, None)
+        if future is None:
+            return self._sql_runner.get_node_schema(node)
+        return future.result()
+
     def check_node_compiled(self, node: Node) -> Optional[DryRunResult]:
         if not node.compiled:
             if not flags.SKIP_NOT_COMPILED:
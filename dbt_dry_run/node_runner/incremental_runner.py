@@ -1,9 +1,13 @@
+from dataclasses import replace
+
+from dbt_dry_run import tracing
 from dbt_dry_run.exception import UpstreamFailedException, SchemaChangeException
 from dbt_dry_run.models import BigQueryFieldMode, BigQueryFieldType, Table, TableField
 from dbt_dry_run.models.dry_run_result import DryRunResult
 from dbt_dry_run.models.manifest import Node, OnSchemaChange
 from dbt_dry_run.models.report import DryRunStatus
 from dbt_dry_run.node_runner import NodeRunner
+from dbt_dry_run.scan_budget import CHECK_PARTITION_PRUNING_METADATA_KEY
 from dbt_dry_run.schema_change_handlers import ON_SCHEMA_CHANGE_TABLE_HANDLER
 from dbt_dry_run.sql.literals import get_sql_literal_from_table
 from dbt_dry_run.sql.parsing import get_merge_sql, sql_has_recursive_ctes
@@ -43,13 +47,15 @@ class IncrementalRunner(NodeRunner):
         sql_statement_with_merge = get_merge_sql(
             node.table_ref, common_field_names, select_literal
         )
-        status, model_schema, exception = self._sql_runner.query(
+        status, model_schema, exception, _ = self._sql_runner.query(
             sql_statement_with_merge
         )
         if status == DryRunStatus.SUCCESS:
             return initial_result
         else:
-            return DryRunResult(node, None, status, exception)
+            return DryRunResult(
+                node, None, status, exception, statistics=initial_result.statistics
+            )
 
     def _replace_partition_with_time_ingestion_column(
         self, dry_run_result: DryRunResult
@@ -77,18 +83,55 @@ class IncrementalRunner(NodeRunner):
 
         return dry_run_result.replace_table(Table(fields=final_fields))
 
+    def _add_full_refresh_bytes_processed(
+        self, node: Node, result: DryRunResult
+    ) -> DryRunResult:
+        """
+        Dry run the full refresh SQL of the model from `--full-refresh-manifest` so its bytes
+        processed can be compared with the incremental run's to check partitions are pruned
+        """
+        if (
+            not node.full_refresh_compiled_code
+            or not result.statistics
+            or node.get_combined_metadata(CHECK_PARTITION_PRUNING_METADATA_KEY) is False
+        ):
+            return result
+        full_refresh_node = node.model_copy(
+            update={"compiled_code": node.full_refresh_compiled_code}
+        )
+        full_refresh_sql = self.preprocessor(full_refresh_node, self._results)
+        status, _, _, statistics = self._sql_runner.query(full_refresh_sql)
+        if status != DryRunStatus.SUCCESS or not statistics:
+            return result
+        return replace(
+            result,
+            statistics=result.statistics.model_copy(
+                update={
+                    "full_refresh_bytes_processed": statistics.total_bytes_processed
+                }
+            ),
+        )
+
+    def needs_target_metadata(self, node: Node) -> bool:
+        return not node.get_should_full_refresh()
+
     def run(self, node: Node) -> DryRunResult:
         try:
             run_sql = self.preprocessor(node, self._results)
         except UpstreamFailedException as e:
             return DryRunResult(node, None, DryRunStatus.FAILURE, e)
 
-        status, model_schema, exception = self._sql_runner.query(run_sql)
+        status, model_schema, exception, statistics = self._sql_runner.query(run_sql)
+
+        result = DryRunResult(
+            node, model_schema, status, exception, statistics=statistics
+        )
 
-        result = DryRunResult(node, model_schema, status, exception)
+        if result.status == DryRunStatus.SUCCESS and not node.get_should_full_refresh():
+            result = self._add_full_refresh_bytes_processed(node, result)
 
         if result.status == DryRunStatus.SUCCESS and not node.get_should_full_refresh():
-            target_table = self._sql_runner.get_node_schema(node)
+            target_table = self.get_target_schema(node)
             if target_table:
                 result = self._verify_merge_type_compatibility(
                     node, result, target_table
@@ -97,13 +140,19 @@ class IncrementalRunner(NodeRunner):
                 if result.status == DryRunStatus.SUCCESS:
                     handler = ON_SCHEMA_CHANGE_TABLE_HANDLER[on_schema_change]
                     try:
-                        result = handler(result, target_table)
+                        with tracing.span(
+                            "schema change",
+                            "node",
+                            on_schema_change=on_schema_change.value,
+                        ):
+                            result = handler(result, target_table)
                     except SchemaChangeException as e:
                         return DryRunResult(
                             node=node,
                             table=None,
                             status=DryRunStatus.FAILURE,
                             exception=e,
+                            statistics=result.statistics,
                         )
 
         if result.status == DryRunStatus.SUCCESS and node.is_time_ingestion_partitioned:
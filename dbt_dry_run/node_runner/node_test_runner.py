@@ -1,9 +1,46 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+from dbt_dry_run import flags
 from dbt_dry_run.exception import UpstreamFailedException
+from dbt_dry_run.generic_tests import validate_generic_test
+from dbt_dry_run.models import Table, TableField
 from dbt_dry_run.models.dry_run_result import DryRunResult
 from dbt_dry_run.models.manifest import Node
 from dbt_dry_run.models.report import DryRunStatus
 from dbt_dry_run.node_runner import NodeRunner
-from dbt_dry_run.sql.statements import SQLPreprocessor, insert_dependant_sql_literals
+from dbt_dry_run.sql.statements import (
+    SQLPreprocessor,
+    get_successful_upstream_results,
+    insert_dependant_sql_literals,
+)
+
+BATCH_COLUMN_PREFIX = "__dry_run_test_"
+# BigQuery names anonymous struct fields `_field_<position>` but anonymous columns `f<n>_`
+_ANONYMOUS_STRUCT_FIELD = re.compile(r"^_field_\d+$")
+
+
+def get_test_batch_sql(test_sqls: List[str]) -> str:
+    """
+    Combine test queries into one query that returns each test's rows as an array of structs
+    in its own column, so the schema of every test can be read from one dry run
+    """
+    columns = [
+        f"ARRAY(SELECT AS STRUCT * FROM (\n{sql.strip().rstrip(';')}\n)) AS {BATCH_COLUMN_PREFIX}{index}"
+        for index, sql in enumerate(test_sqls)
+    ]
+    return "SELECT\n" + ",\n".join(columns)
+
+
+def _name_anonymous_fields(fields: List[TableField]) -> List[TableField]:
+    named_fields: List[TableField] = []
+    anonymous_count = 0
+    for field in fields:
+        if _ANONYMOUS_STRUCT_FIELD.match(field.name):
+            field = field.model_copy(update={"name": f"f{anonymous_count}_"})
+            anonymous_count += 1
+        named_fields.append(field)
+    return named_fields
 
 
 class NodeTestRunner(NodeRunner):
@@ -11,14 +48,78 @@ class NodeTestRunner(NodeRunner):
 
     def run(self, node: Node) -> DryRunResult:
         try:
+            local_result = self._validate_locally(node)
+            if local_result:
+                return local_result
             run_sql = self.preprocessor(node, self._results)
         except UpstreamFailedException as e:
             return DryRunResult(node, None, DryRunStatus.FAILURE, e)
+        return self._run_sql(node, run_sql)
+
+    def _validate_locally(self, node: Node) -> Optional[DryRunResult]:
+        if not flags.LOCAL_GENERIC_TESTS or node.test_metadata is None:
+            return None
+        get_successful_upstream_results(node, self._results)
+        return validate_generic_test(node, self._results)
+
+    def _run_sql(self, node: Node, run_sql: str) -> DryRunResult:
         (
             status,
             predicted_table,
             exception,
+            statistics,
         ) = self._sql_runner.query(run_sql)
 
-        result = DryRunResult(node, predicted_table, status, exception)
+        result = DryRunResult(
+            node, predicted_table, status, exception, statistics=statistics
+        )
         return result
+
+    def run_batch(self, nodes: List[Node]) -> List[DryRunResult]:
+        """
+        Dry run many tests with one query. If the combined query fails it is split in half until
+        the failing tests are found, and those are dry run on their own so their results are the
+        same as from `run`. Returns the results in the same order as `nodes`. The bytes processed
+        are only known for the whole batch so batched tests have no statistics
+        """
+        results: Dict[str, DryRunResult] = {}
+        runnable: List[Tuple[Node, str]] = []
+        for node in nodes:
+            validation_result = self.check_node_compiled(node)
+            if validation_result:
+                results[node.unique_id] = validation_result
+                continue
+            try:
+                local_result = self._validate_locally(node)
+                if local_result:
+                    results[node.unique_id] = local_result
+                    continue
+                runnable.append((node, self.preprocessor(node, self._results)))
+            except UpstreamFailedException as e:
+                results[node.unique_id] = DryRunResult(
+                    node, None, DryRunStatus.FAILURE, e
+                )
+        for result in self._bisect(runnable):
+            results[result.node.unique_id] = result
+        return [results[node.unique_id] for node in nodes]
+
+    def _bisect(self, batch: List[Tuple[Node, str]]) -> List[DryRunResult]:
+        if not batch:
+            return []
+        if len(batch) == 1:
+            return [self._run_sql(*batch[0])]
+        status, table, _, _ = self._sql_runner.query(
+            get_test_batch_sql([sql for _, sql in batch])
+        )
+        if status == DryRunStatus.SUCCESS and table and len(table.fields) == len(batch):
+            return [
+                DryRunResult(
+                    node,
+                    Table(fields=_name_anonymous_fields(field.fields or [])),
+                    DryRunStatus.SUCCESS,
+                    None,
+                )
+                for (node, _), field in zip(batch, table.fields)
+            ]
+        middle = len(batch) // 2
+        return self._bisect(batch[:middle]) + self._bisect(batch[middle:])
@@ -1,27 +1,171 @@
+import hashlib
+import json
 import os
+from concurrent.futures import Executor
+from threading import Lock
 from typing import List, Optional
 
-import agate as ag
+from pydantic import ValidationError
 
+from dbt_dry_run import flags
 from dbt_dry_run.exception import UnknownSchemaException
+from dbt_dry_run.metrics import CACHE_REQUESTS
 from dbt_dry_run.models import BigQueryFieldType, Table, TableField
 from dbt_dry_run.models.dry_run_result import DryRunResult
 from dbt_dry_run.models.manifest import Node
 from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.models.seed_schema_cache import (
+    SEED_SCHEMA_CACHE_VERSION,
+    SeedFileState,
+    SeedSchemaCache,
+)
 from dbt_dry_run.node_runner import NodeRunner
+from dbt_dry_run.results import Results
+from dbt_dry_run.seed_inference import SeedSample, infer_seed_sample
+from dbt_dry_run.sql_runner import SQLRunner
+
+# Smaller seeds are parsed in the thread, sending them to another process costs more than it saves
+PROCESS_POOL_MIN_BYTES = 1024 * 1024
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def load_seed_schema_cache(path: str) -> SeedSchemaCache:
+    """
+    Load the seed schema cache saved by a previous run. A missing, unreadable or old cache is
+    treated as empty because every seed can be parsed again
+    """
+    try:
+        with open(path) as f:
+            cache = SeedSchemaCache.model_validate_json(f.read())
+    except (OSError, ValidationError):
+        return SeedSchemaCache()
+    if cache.version != SEED_SCHEMA_CACHE_VERSION:
+        return SeedSchemaCache()
+    return cache
+
+
+def save_seed_schema_cache(cache: SeedSchemaCache, path: str) -> None:
+    # Replace the file in one step so that a concurrent run never reads half a cache
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        f.write(cache.model_dump_json(by_alias=True))
+    os.replace(temp_path, path)
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def seed_schema_cache_key(node: Node, content_hash: str) -> str:
+    """
+    Everything that can change the schema inferred for a seed
+    """
+    key = [
+        content_hash,
+        node.config.delimiter or SeedRunner.DEFAULT_DELIMITER,
+        node.config.column_types,
+        flags.SEED_SAMPLE_ROWS,
+    ]
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
 
 
 class SeedRunner(NodeRunner):
     DEFAULT_DELIMITER = ","
 
+    def __init__(self, sql_runner: SQLRunner, results: Results):
+        super().__init__(sql_runner, results)
+        self._process_pool: Optional[Executor] = None
+        self._schema_cache: Optional[SeedSchemaCache] = None
+        self._next_schema_cache: Optional[SeedSchemaCache] = None
+        self._schema_cache_lock = Lock()
+
+    def use_process_pool(self, executor: Executor) -> None:
+        """
+        Parse large seeds in `executor`, which should be a process pool, so that they don't hold
+        the GIL while other threads are waiting on BigQuery
+        """
+        self._process_pool = executor
+
+    def use_schema_cache(self, cache: SeedSchemaCache) -> SeedSchemaCache:
+        """
+        Look up the schema of each seed in `cache` by the hash of its content before parsing it.
+        Returns the cache to save after the run, which only has the seeds looked up in this run
+        so that it doesn't keep growing as seeds change
+        """
+        self._schema_cache = cache
+        self._next_schema_cache = SeedSchemaCache()
+        return self._next_schema_cache
+
+    def _content_hash(self, full_path: str) -> str:
+        assert self._schema_cache is not None and self._next_schema_cache is not None
+        stat = os.stat(full_path)
+        known = self._schema_cache.files.get(full_path)
+        if (
+            flags.SEED_SCHEMA_CACHE_TRUST_MTIME
+            and known is not None
+            and known.size == stat.st_size
+            and known.mtime_ns == stat.st_mtime_ns
+        ):
+            content_hash = known.content_hash
+        else:
+            content_hash = hash_file(full_path)
+        with self._schema_cache_lock:
+            self._next_schema_cache.files[full_path] = SeedFileState(
+                size=stat.st_size, mtime_ns=stat.st_mtime_ns, content_hash=content_hash
+            )
+        return content_hash
+
+    def _run_with_schema_cache(self, node: Node, full_path: str) -> DryRunResult:
+        assert self._schema_cache is not None and self._next_schema_cache is not None
+        cache_key = seed_schema_cache_key(node, self._content_hash(full_path))
+        statistics = self._results.statistics
+        with self._schema_cache_lock:
+            table = self._schema_cache.schemas.get(cache_key)
+            if table is not None:
+                statistics.seed_schema_cache_hits += 1
+                CACHE_REQUESTS.inc(cache="seed_schema", result="hit")
+                self._next_schema_cache.schemas[cache_key] = table
+                return DryRunResult(
+                    node, table.model_copy(deep=True), DryRunStatus.SUCCESS, None
+                )
+            statistics.seed_schema_cache_misses += 1
+            CACHE_REQUESTS.inc(cache="seed_schema", result="miss")
+        result = self._infer_schema(node, full_path)
+        if result.status == DryRunStatus.SUCCESS and result.table is not None:
+            with self._schema_cache_lock:
+                self._next_schema_cache.schemas[cache_key] = result.table.model_copy(
+                    deep=True
+                )
+        return result
+
+    def _infer_seed_sample(self, node: Node, full_path: str) -> SeedSample:
+        args = (
+            full_path,
+            node.config.delimiter or self.DEFAULT_DELIMITER,
+            frozenset(node.config.column_types),
+            flags.SEED_SAMPLE_ROWS,
+        )
+        if (
+            self._process_pool is not None
+            and os.path.getsize(full_path) >= PROCESS_POOL_MIN_BYTES
+        ):
+            return self._process_pool.submit(infer_seed_sample, *args).result()
+        return infer_seed_sample(*args)
+
     def run(self, node: Node) -> DryRunResult:
         if not node.root_path:
             raise ValueError(f"Node {node.unique_id} does not have `root_path`")
         full_path = os.path.join(node.root_path, node.original_file_path)
-        with open(full_path, "r", encoding="utf-8-sig") as f:
-            csv_table = ag.Table.from_csv(
-                f, delimiter=node.config.delimiter or self.DEFAULT_DELIMITER
-            )
+        if self._schema_cache is not None:
+            return self._run_with_schema_cache(node, full_path)
+        return self._infer_schema(node, full_path)
+
+    def _infer_schema(self, node: Node, full_path: str) -> DryRunResult:
+        csv_table = self._infer_seed_sample(node, full_path).to_agate_table()
 
         fields: List[TableField] = []
         for idx, column in enumerate(csv_table.columns):
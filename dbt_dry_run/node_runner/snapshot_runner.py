@@ -91,6 +91,7 @@ class SnapshotRunner(NodeRunner):
                 table=result.table,
                 status=DryRunStatus.FAILURE,
                 exception=exception,
+                statistics=result.statistics,
             )
         if node.config.strategy == "timestamp":
             if node.config.updated_at not in result.table.field_names:
@@ -102,6 +103,7 @@ class SnapshotRunner(NodeRunner):
                     table=result.table,
                     status=DryRunStatus.FAILURE,
                     exception=exception,
+                    statistics=result.statistics,
                 )
         elif node.config.strategy == "check":
             if _check_cols_missing(node, result.table):
@@ -113,6 +115,7 @@ class SnapshotRunner(NodeRunner):
                     table=result.table,
                     status=DryRunStatus.FAILURE,
                     exception=exception,
+                    statistics=result.statistics,
                 )
         else:
             raise ValueError(f"Unknown snapshot strategy: '{node.config.strategy}'")
@@ -128,12 +131,19 @@ class SnapshotRunner(NodeRunner):
             status,
             predicted_table,
             exception,
+            statistics,
         ) = self._sql_runner.query(run_sql)
-        result = DryRunResult(node, predicted_table, status, exception)
+        result = DryRunResult(
+            node, predicted_table, status, exception, statistics=statistics
+        )
         if result.status == DryRunStatus.SUCCESS and result.table:
-            result.table.fields = [
-                *result.table.fields,
-                *self._get_snapshot_fields(node.config),
-            ]
+            result = result.replace_table(
+                Table(
+                    fields=[
+                        *result.table.fields,
+                        *self._get_snapshot_fields(node.config),
+                    ]
+                )
+            )
             result = self._validate_snapshot_config(node, result)
         return result
@@ -14,6 +14,9 @@ from dbt_dry_run.node_runner import NodeRunner
 
 
 class SourceRunner(NodeRunner):
+    def needs_target_metadata(self, node: Node) -> bool:
+        return not node.is_external_source()
+
     def run(self, node: Node) -> DryRunResult:
         exception: Optional[Exception] = None
         predicted_table: Optional[Table] = None
@@ -32,7 +35,7 @@ class SourceRunner(NodeRunner):
                 status = DryRunStatus.FAILURE
                 exception = e
         else:
-            if not self._sql_runner.node_exists(node):
+            if self.get_target_schema(node) is None:
                 status = DryRunStatus.FAILURE
                 exception = SourceMissingException(
                     f"Could not find source in target environment for node '{node.unique_id}'"
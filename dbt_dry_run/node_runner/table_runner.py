@@ -18,7 +18,9 @@ class TableRunner(NodeRunner):
             run_sql = self.preprocessor(node, self._results)
         except UpstreamFailedException as e:
             return DryRunResult(node, None, DryRunStatus.FAILURE, e)
-        status, model_schema, exception = self._sql_runner.query(run_sql)
+        status, model_schema, exception, statistics = self._sql_runner.query(run_sql)
 
-        result = DryRunResult(node, model_schema, status, exception)
+        result = DryRunResult(
+            node, model_schema, status, exception, statistics=statistics
+        )
         return result
@@ -0,0 +1,162 @@
+import sys
+import time
+from collections import deque
+from threading import Event, Lock, Thread
+from types import TracebackType
+from typing import Callable, Deque, Dict, Optional, Set, TextIO, Type
+
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.manifest import Node
+from dbt_dry_run.models.report import DryRunStatus, LintingStatus
+from dbt_dry_run.results import ResultListener, Results
+
+DEFAULT_PROGRESS_INTERVAL = 30.0
+# How often the progress line is redrawn in a terminal
+TTY_REFRESH_INTERVAL = 0.5
+# The ETA is based on the node rate over this many seconds so that it follows the run
+NODE_RATE_WINDOW_SECONDS = 30.0
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+class ProgressReporter(ResultListener):
+    """
+    Shows how far through the dry run is while it is running: how many nodes have completed,
+    failed, are in flight and are waiting to be retried, how many nodes have recently
+    completed per second and an ETA. The rate counts nodes rather than BigQuery queries, as
+    batched tests and incremental scan checks don't run one query per node, so that the ETA
+    can be worked out from the nodes that are left. In a terminal the progress is one line
+    that is redrawn in place, otherwise, for example in CI, a plain line is written every
+    `interval` seconds. Progress is shown from a background thread so that a run that
+    is stuck waiting on BigQuery can be told apart from a slow one. Use as a context manager
+    so the thread is stopped if the run fails
+    """
+
+    def __init__(
+        self,
+        output: Optional[TextIO] = None,
+        interval: float = DEFAULT_PROGRESS_INTERVAL,
+        tty: Optional[bool] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._output = output or sys.stderr
+        self._tty = self._output.isatty() if tty is None else tty
+        self._interval = TTY_REFRESH_INTERVAL if self._tty else interval
+        self._clock = clock
+        self._lock = Lock()
+        self._node_count = 0
+        self._start_time = clock()
+        self._in_flight: Set[str] = set()
+        # Nodes in the retry delay queue are not in flight until they are tried again
+        self._retrying: Set[str] = set()
+        # Whether each completed node failed, a node's result can be replaced later
+        self._completed: Dict[str, bool] = {}
+        self._completion_times: Deque[float] = deque()
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+
+    def __enter__(self) -> "ProgressReporter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self._stop()
+
+    def on_start(self, node_count: int) -> None:
+        with self._lock:
+            self._node_count = node_count
+            self._start_time = self._clock()
+        self._thread = Thread(target=self._show_periodically, daemon=True)
+        self._thread.start()
+
+    def on_node_start(self, node: Node) -> None:
+        with self._lock:
+            self._in_flight.add(node.unique_id)
+            self._retrying.discard(node.unique_id)
+
+    def on_node_retry(self, node: Node) -> None:
+        with self._lock:
+            self._in_flight.discard(node.unique_id)
+            self._retrying.add(node.unique_id)
+
+    def on_result(self, result: DryRunResult) -> None:
+        failed = (
+            result.status != DryRunStatus.SUCCESS
+            or result.linting_status == LintingStatus.FAILURE
+        )
+        with self._lock:
+            unique_id = result.node.unique_id
+            self._in_flight.discard(unique_id)
+            self._retrying.discard(unique_id)
+            if unique_id not in self._completed:
+                self._completion_times.append(self._clock())
+            self._completed[unique_id] = failed
+
+    def on_finish(self, results: Results) -> None:
+        self._stop()
+
+    def _stop(self) -> None:
+        if self._thread is None or self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._show(final=True)
+
+    def _show_periodically(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self._show()
+
+    def _show(self, final: bool = False) -> None:
+        line = self.format_progress()
+        if self._tty:
+            # Pad over the end of a longer previous line
+            self._output.write(f"\r{line:<100}")
+            if final:
+                self._output.write("\n")
+        else:
+            self._output.write(f"{line}\n")
+        self._output.flush()
+
+    def _node_rate(self, now: float) -> float:
+        window_start = now - NODE_RATE_WINDOW_SECONDS
+        while self._completion_times and self._completion_times[0] < window_start:
+            self._completion_times.popleft()
+        window = min(NODE_RATE_WINDOW_SECONDS, now - self._start_time)
+        if window <= 0:
+            return 0.0
+        return len(self._completion_times) / window
+
+    def format_progress(self) -> str:
+        with self._lock:
+            now = self._clock()
+            completed = len(self._completed)
+            failed = sum(self._completed.values())
+            in_flight = len(self._in_flight)
+            retrying = len(self._retrying)
+            node_rate = self._node_rate(now)
+            elapsed = now - self._start_time
+        remaining = max(0, self._node_count - completed)
+        if remaining == 0:
+            eta = "done"
+        elif node_rate > 0:
+            eta = f"ETA {format_duration(remaining / node_rate)}"
+        else:
+            eta = "ETA unknown"
+        return (
+            f"[{format_duration(elapsed)}] {completed}/{self._node_count} nodes "
+            f"({failed} failed, {in_flight} in flight, {retrying} retrying), "
+            f"{node_rate:.1f} nodes/s, {eta}"
+        )
@@ -0,0 +1,145 @@
+import gzip
+import json
+from enum import Enum
+from types import ModuleType
+from typing import IO, Any, Dict, List
+
+from dbt_dry_run.models import Report, ReportNode, Table
+from dbt_dry_run.models.frozen_schema import FrozenSchema
+from dbt_dry_run.models.report import (
+    CompactReport,
+    CompactReportNode,
+    ReportNodeResult,
+    ReportSummary,
+)
+
+COMPACT_REPORT_VERSION = 1
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class ReportFormat(str, Enum):
+    JSON = "json"
+    COMPACT = "compact"
+
+
+def _zstd() -> ModuleType:
+    try:
+        from compression import zstd  # Python 3.14
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd compressed reports need zstandard, install it with `pip install dbt-dry-run[zstd]`"
+        )
+
+
+def _open_for_write(path: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, "wt", encoding="utf-8")
+    if path.endswith(".zst"):
+        return _zstd().open(path, "wt", encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def _open_for_read(path: str) -> IO[str]:
+    # Compression is detected from the content so a report can be read whatever its name
+    with open(path, "rb") as f:
+        magic = f.read(len(_ZSTD_MAGIC))
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if magic == _ZSTD_MAGIC:
+        return _zstd().open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _summary(report: ReportSummary) -> Dict[str, Any]:
+    return {name: getattr(report, name) for name in ReportSummary.model_fields}
+
+
+def _node_result(node: ReportNodeResult) -> Dict[str, Any]:
+    return {name: getattr(node, name) for name in ReportNodeResult.model_fields}
+
+
+def compact_report(report: Report, include_tables: bool = True) -> CompactReport:
+    schemas: Dict[str, Table] = {}
+    nodes: List[CompactReportNode] = []
+    for node in report.nodes:
+        schema_id = None
+        if include_tables and node.table is not None:
+            schema_id = FrozenSchema.from_table(node.table).fingerprint
+            schemas.setdefault(schema_id, node.table)
+        nodes.append(
+            CompactReportNode.model_construct(**_node_result(node), schema_id=schema_id)
+        )
+    return CompactReport.model_construct(
+        **_summary(report),
+        compact_report_version=COMPACT_REPORT_VERSION,
+        tables_included=include_tables,
+        schemas=schemas,
+        nodes=nodes,
+    )
+
+
+def expand_report(report: CompactReport) -> Report:
+    """
+    Nodes with the same schema share one `Table`
+    """
+    nodes = [
+        ReportNode.model_construct(
+            **_node_result(node),
+            table=report.schemas[node.schema_id] if node.schema_id else None,
+        )
+        for node in report.nodes
+    ]
+    return Report.model_construct(**_summary(report), nodes=nodes)
+
+
+def write_report(
+    report: Report,
+    path: str,
+    report_format: ReportFormat = ReportFormat.JSON,
+    include_tables: bool = True,
+) -> None:
+    """
+    Write the report to `path`, compressed with gzip if it ends in `.gz` or zstd if it ends
+    in `.zst`
+    """
+    if report_format == ReportFormat.COMPACT:
+        output = compact_report(report, include_tables).model_dump_json(by_alias=True)
+    elif include_tables:
+        output = report.model_dump_json(by_alias=True)
+    else:
+        nodes = [
+            ReportNode.model_construct(**_node_result(node), table=None)
+            for node in report.nodes
+        ]
+        output = Report.model_construct(
+            **_summary(report), nodes=nodes
+        ).model_dump_json(by_alias=True)
+    with _open_for_write(path) as f:
+        f.write(output)
+
+
+def read_report(path: str) -> Report:
+    """
+    Read a report written in any format, compact reports are expanded back into a `Report`
+    """
+    with _open_for_read(path) as f:
+        content = json.load(f)
+    if isinstance(content, dict) and "compact_report_version" in content:
+        compact = CompactReport.model_validate(content)
+        if compact.compact_report_version != COMPACT_REPORT_VERSION:
+            raise ValueError(
+                f"Compact report '{path}' has version {compact.compact_report_version}, "
+                f"expected {COMPACT_REPORT_VERSION}"
+            )
+        return expand_report(compact)
+    return Report.model_validate(content)
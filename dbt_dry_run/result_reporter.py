@@ -1,9 +1,15 @@
 import re
-from typing import List, Set, Tuple
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
 
 from dbt_dry_run.models import Report, ReportNode
 from dbt_dry_run.models.dry_run_result import DryRunResult, LintingError
-from dbt_dry_run.models.report import DryRunStatus, LintingStatus, ReportLintingError
+from dbt_dry_run.models.report import (
+    DryRunStatus,
+    LintingStatus,
+    ReportLintingError,
+    ReportSummary,
+)
 from dbt_dry_run.results import Results
 
 QUERY_JOB_SQL_FOLLOWS = "-----Query Job SQL Follows-----"
@@ -19,6 +25,21 @@ def _map_column_errors(column_errors: List[LintingError]) -> List[ReportLintingE
     )
 
 
+def to_report_node(result: DryRunResult) -> ReportNode:
+    exception_type = result.exception.__class__.__name__ if result.exception else None
+    return ReportNode(
+        unique_id=result.node.unique_id,
+        success=result.status == DryRunStatus.SUCCESS,
+        status=result.status,
+        error_message=exception_type,
+        table=result.table,
+        linting_status=result.linting_status,
+        linting_errors=_map_column_errors(result.linting_errors),
+        retry_count=result.retry_count,
+        statistics=result.statistics,
+    )
+
+
 class ResultReporter:
     def __init__(self, results: Results, exclude: Set[str], verbose: bool = False):
         self._results = results
@@ -42,44 +63,50 @@ class ResultReporter:
             )
 
     def get_report(self) -> Report:
-        report_nodes: List[ReportNode] = []
+        report_nodes = [to_report_node(result) for result in self._results.values()]
+        return Report(
+            **dict(self.get_report_summary()),
+            nodes=report_nodes,
+        )
+
+    def get_report_summary(self) -> ReportSummary:
+        """
+        Everything in the report except the nodes
+        """
         success = True
         node_count = 0
         failure_count = 0
         failed_node_ids: List[str] = []
+        total_bytes_processed = 0
+        bytes_processed_by_package: Dict[str, int] = defaultdict(int)
 
         for result in self._results.values():
-            exception_type = (
-                result.exception.__class__.__name__ if result.exception else None
-            )
-            new_node = ReportNode(
-                unique_id=result.node.unique_id,
-                success=result.status == DryRunStatus.SUCCESS,
-                status=result.status,
-                error_message=exception_type,
-                table=result.table,
-                linting_status=result.linting_status,
-                linting_errors=_map_column_errors(result.linting_errors),
-            )
-            report_nodes.append(new_node)
+            if result.statistics and result.statistics.total_bytes_processed:
+                total_bytes_processed += result.statistics.total_bytes_processed
+                bytes_processed_by_package[result.node.package] += (
+                    result.statistics.total_bytes_processed
+                )
 
             node_count += 1
-            if not new_node.success or new_node.linting_status == LintingStatus.FAILURE:
+            if (
+                result.status != DryRunStatus.SUCCESS
+                or result.linting_status == LintingStatus.FAILURE
+            ):
                 success = False
                 failure_count += 1
-                failed_node_ids.append(new_node.unique_id)
+                failed_node_ids.append(result.node.unique_id)
 
-        report = Report(
+        return ReportSummary(
             success=success,
             execution_time=self._results.execution_time_in_seconds,
             node_count=node_count,
             failure_count=failure_count,
             failed_node_ids=failed_node_ids,
-            nodes=report_nodes,
+            total_bytes_processed=total_bytes_processed,
+            bytes_processed_by_package=dict(bytes_processed_by_package),
+            statistics=self._results.statistics,
         )
 
-        return report
-
     def report_and_check_results(self) -> int:
         failures: List[Tuple[DryRunResult, bool]] = []
         for result in self._results.values():
@@ -1,24 +1,97 @@
 from datetime import datetime
 from threading import Lock
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Sequence, Set
 
 from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.manifest import Node
+from dbt_dry_run.models.report import RunStatistics
+
+
+class ResultListener:
+    """
+    Told about every result as it is added, from the worker thread that added it, so it must
+    be thread safe. A node's result can be added again after the run, for example when its
+    scan budget is checked, in which case the later result replaces the earlier one
+    """
+
+    def on_start(self, node_count: int) -> None:
+        pass
+
+    def on_node_start(self, node: Node) -> None:
+        pass
+
+    def on_node_retry(self, node: Node) -> None:
+        pass
+
+    def on_result(self, result: DryRunResult) -> None:
+        pass
+
+    def on_finish(self, results: "Results") -> None:
+        pass
 
 
 class Results:
-    def __init__(self) -> None:
+    """
+    Each node's result is written exactly once by a worker thread and then read many times
+    by its downstream nodes. Writers are serialised with a lock but readers never take it: a
+    single dict lookup or assignment is atomic, so membership checks and lookups are O(1)
+    and never copy the table. `keys` and `values` still take the lock as they iterate
+    """
+
+    def __init__(self, listeners: Sequence[ResultListener] = ()) -> None:
+        self._listeners = list(listeners)
         self._results: Dict[str, DryRunResult] = {}
         self._lock = Lock()
         self._start_time = datetime.utcnow()
         self._end_time: Optional[datetime] = None
+        self.statistics = RunStatistics()
+
+    def start(self, node_count: int) -> None:
+        for listener in self._listeners:
+            listener.on_start(node_count)
+
+    def start_node(self, node: Node) -> None:
+        """
+        Called by the worker thread that is about to dry run `node`, every time it is tried
+        """
+        for listener in self._listeners:
+            listener.on_node_start(node)
+
+    def retry_node(self, node: Node) -> None:
+        """
+        Called by the worker thread that tried `node` when it failed with a retryable error
+        and will wait in the delay queue before it is tried again
+        """
+        for listener in self._listeners:
+            listener.on_node_retry(node)
 
     def add_result(self, node_key: str, result: DryRunResult) -> None:
         with self._lock:
             self._results[node_key] = result
+        for listener in self._listeners:
+            listener.on_result(result)
 
     def get_result(self, node_key: str) -> DryRunResult:
-        with self._lock:
-            return self._results[node_key]
+        return self._results[node_key]
+
+    def get_many(self, node_keys: Iterable[str]) -> List[DryRunResult]:
+        """
+        Get the results for every node key that has completed, in the order given. Keys
+        without a result are skipped
+        """
+        lookup = self._results.get
+        completed: List[DryRunResult] = []
+        for node_key in node_keys:
+            result = lookup(node_key)
+            if result is not None:
+                completed.append(result)
+        return completed
+
+    def __contains__(self, node_key: str) -> bool:
+        return node_key in self._results
+
+    def __len__(self) -> int:
+        return len(self._results)
 
     def keys(self) -> Set[str]:
         with self._lock:
@@ -30,6 +103,8 @@ class Results:
 
     def finish(self) -> None:
         self._end_time = datetime.utcnow()
+        for listener in self._listeners:
+            listener.on_finish(self)
 
     @property
     def execution_time_in_seconds(self) -> Optional[float]:
@@ -0,0 +1,53 @@
+import random
+from threading import Lock
+from typing import Optional
+
+from dbt_dry_run.metrics import RETRIES, RETRIES_REFUSED
+
+MAX_ATTEMPT_NUMBER = 5
+DEFAULT_RETRY_BUDGET = 100
+
+
+class RetryPolicy:
+    """
+    Decides whether a node that failed with a `RetryableException` should be tried again and
+    how long to wait first. Every retry in the run comes out of one shared budget so that a
+    BigQuery incident fails the run quickly instead of retrying every node to its maximum
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_ATTEMPT_NUMBER,
+        budget: int = DEFAULT_RETRY_BUDGET,
+        min_wait: float = 0.5,
+        max_wait: float = 10.0,
+        multiplier: float = 0.5,
+    ):
+        self.max_attempts = max_attempts
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self.multiplier = multiplier
+        self._remaining_budget = budget
+        self._lock = Lock()
+
+    @property
+    def remaining_budget(self) -> int:
+        return self._remaining_budget
+
+    def next_delay(self, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before making attempt `attempt + 1`, or `None` if the node should not be
+        retried. The delay is picked uniformly between `min_wait` and an exponentially growing
+        ceiling so that nodes that failed together don't all retry at the same moment
+        """
+        if attempt >= self.max_attempts:
+            RETRIES_REFUSED.inc(reason="max_attempts")
+            return None
+        with self._lock:
+            if self._remaining_budget <= 0:
+                RETRIES_REFUSED.inc(reason="budget")
+                return None
+            self._remaining_budget -= 1
+        RETRIES.inc()
+        ceiling = min(self.max_wait, self.multiplier * 2**attempt)
+        return random.uniform(self.min_wait, max(self.min_wait, ceiling))
@@ -0,0 +1,145 @@
+import re
+from dataclasses import replace
+from typing import Any, Dict, Mapping, Optional, Type
+
+from dbt_dry_run import flags
+from dbt_dry_run.exception import PartitionPruningException, ScanBudgetException
+from dbt_dry_run.report_file import read_report
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.results import Results
+
+MAX_BYTES_PROCESSED_METADATA_KEY = "dry_run.max_bytes_processed"
+CHECK_PARTITION_PRUNING_METADATA_KEY = "dry_run.check_partition_pruning"
+
+_BYTE_UNITS = ["B", "KB", "MB", "GB", "TB", "PB"]
+_BYTES_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGTP]?i?B)?\s*$", re.IGNORECASE)
+
+
+def parse_bytes(value: Any) -> int:
+    """
+    Parse a number of bytes given either as a number or a string with a unit such as `500GB`
+    or `1.5 TiB`. Units are binary like BigQuery billing, so `1KB` is 1024 bytes
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid number of bytes: '{value}'")
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _BYTES_PATTERN.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid number of bytes: '{value}'")
+    number, unit = match.groups()
+    exponent = _BYTE_UNITS.index((unit or "B").upper().replace("I", ""))
+    return int(float(number) * 1024**exponent)
+
+
+def format_bytes(value: int) -> str:
+    size = float(value)
+    for unit in _BYTE_UNITS[:-1]:
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.2f}{unit}"
+        size /= 1024
+    return f"{size:.2f}{_BYTE_UNITS[-1]}"
+
+
+def load_baseline_bytes_processed(path: str) -> Dict[str, int]:
+    """
+    Read the bytes processed by each node from a report written by a previous dry run
+    """
+    report = read_report(path)
+    return {
+        node.unique_id: node.statistics.total_bytes_processed
+        for node in report.nodes
+        if node.statistics and node.statistics.total_bytes_processed is not None
+    }
+
+
+def _fail(
+    result: DryRunResult,
+    message: str,
+    exception_type: Type[Exception] = ScanBudgetException,
+) -> DryRunResult:
+    return replace(
+        result, status=DryRunStatus.FAILURE, exception=exception_type(message)
+    )
+
+
+def check_scan_budget(
+    result: DryRunResult, baseline: Mapping[str, int]
+) -> DryRunResult:
+    """
+    Fail a successful result if its dry run processes more bytes than the node's
+    `dry_run.max_bytes_processed` (Or `--max-bytes-processed` if it doesn't set one), or if
+    it has grown more than `--max-bytes-processed-growth` percent over the baseline report.
+    Incremental models checked against `--full-refresh-manifest` also fail if their
+    incremental run doesn't process meaningfully fewer bytes than a full refresh
+    """
+    if result.status != DryRunStatus.SUCCESS or not result.statistics:
+        return result
+    bytes_processed = result.statistics.total_bytes_processed
+    if bytes_processed is None:
+        return result
+
+    node_budget = result.node.get_combined_metadata(MAX_BYTES_PROCESSED_METADATA_KEY)
+    try:
+        max_bytes_processed: Optional[int] = (
+            parse_bytes(node_budget)
+            if node_budget is not None
+            else flags.MAX_BYTES_PROCESSED
+        )
+    except ValueError as e:
+        return _fail(result, f"Invalid `{MAX_BYTES_PROCESSED_METADATA_KEY}`: {e}")
+    if max_bytes_processed is not None and bytes_processed > max_bytes_processed:
+        return _fail(
+            result,
+            f"Dry run processes {format_bytes(bytes_processed)} which is over the budget of "
+            f"{format_bytes(max_bytes_processed)}",
+        )
+
+    baseline_bytes_processed = baseline.get(result.node.unique_id)
+    if flags.MAX_BYTES_PROCESSED_GROWTH is not None and baseline_bytes_processed:
+        growth = (
+            (bytes_processed - baseline_bytes_processed)
+            / baseline_bytes_processed
+            * 100
+        )
+        if growth > flags.MAX_BYTES_PROCESSED_GROWTH:
+            return _fail(
+                result,
+                f"Dry run processes {format_bytes(bytes_processed)} which is {growth:.1f}% more than "
+                f"the {format_bytes(baseline_bytes_processed)} in the baseline report, the "
+                f"limit is {flags.MAX_BYTES_PROCESSED_GROWTH:g}%",
+            )
+
+    full_refresh_bytes_processed = result.statistics.full_refresh_bytes_processed
+    if (
+        full_refresh_bytes_processed
+        and bytes_processed
+        > full_refresh_bytes_processed * flags.MAX_INCREMENTAL_SCAN_RATIO
+    ):
+        return _fail(
+            result,
+            f"Incremental run processes {format_bytes(bytes_processed)} which is "
+            f"{bytes_processed / full_refresh_bytes_processed:.0%} of the "
+            f"{format_bytes(full_refresh_bytes_processed)} processed by a full refresh, the limit "
+            f"is {flags.MAX_INCREMENTAL_SCAN_RATIO:.0%}. Check that its incremental filter prunes "
+            f"the partitions of its sources",
+            PartitionPruningException,
+        )
+    return result
+
+
+def check_scan_budgets(results: Results) -> None:
+    """
+    Checked once every node has run so that a node over its budget still passes its
+    predicted schema on to its downstream nodes
+    """
+    baseline = (
+        load_baseline_bytes_processed(flags.BASELINE_REPORT)
+        if flags.BASELINE_REPORT
+        else {}
+    )
+    for result in results.values():
+        checked_result = check_scan_budget(result, baseline)
+        if checked_result is not result:
+            results.add_result(result.node.unique_id, checked_result)
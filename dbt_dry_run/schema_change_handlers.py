@@ -81,6 +81,7 @@ def fail_handler(dry_run_result: DryRunResult, target_table: Table) -> DryRunRes
         table=table,
         status=status,
         exception=exception,
+        statistics=dry_run_result.statistics,
     )
 
 
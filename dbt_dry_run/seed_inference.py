@@ -0,0 +1,162 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import islice
+from typing import AbstractSet, Iterator, List, Optional
+
+import agate as ag
+from agate import csv as agate_csv
+from agate.exceptions import CastError
+from agate.utils import max_precision
+
+
+@dataclass
+class SeedSample:
+    """
+    The column types agate infers for a seed along with just enough of its values to convert
+    them to BigQuery types: the number with the most decimal places in each number column
+    """
+
+    column_names: List[str]
+    column_types: List[ag.DataType]
+    rows: List[List[Optional[str]]]
+
+    def to_agate_table(self) -> ag.Table:
+        return ag.Table(self.rows, self.column_names, self.column_types)
+
+
+def _candidate_types() -> List[ag.DataType]:
+    # The types `agate.TypeTester` tries, in order of preference
+    return [
+        ag.Boolean(),
+        ag.Number(),
+        ag.TimeDelta(),
+        ag.Date(),
+        ag.DateTime(),
+        ag.Text(),
+    ]
+
+
+@dataclass
+class _ColumnInference:
+    """
+    Infers the type of one column by only testing its values against the most preferred type
+    that hasn't failed yet. When a value fails, the next type that accepts it takes over and
+    has to be checked against the rows before it on another pass over the file
+    """
+
+    index: int
+    candidates: List[ag.DataType] = field(default_factory=_candidate_types)
+    # The current candidate was already checked against the rows from here on
+    checked_from: Optional[int] = None
+    # The row the current candidate took over at in this pass
+    changed_at: Optional[int] = None
+    max_decimals: int = 0
+    widest_number: Optional[str] = None
+
+    @property
+    def candidate(self) -> ag.DataType:
+        return self.candidates[0]
+
+    @property
+    def resolved(self) -> bool:
+        # Text accepts every value
+        return isinstance(self.candidate, ag.Text)
+
+    def is_checked(self, row_number: int) -> bool:
+        return (
+            self.changed_at is None
+            and self.checked_from is not None
+            and row_number >= self.checked_from
+        )
+
+    def _accepts(self, candidate: ag.DataType, value: str) -> bool:
+        if not isinstance(candidate, ag.Number):
+            return candidate.test(value)
+        try:
+            number: Optional[Decimal] = candidate.cast(value)
+        except CastError:
+            return False
+        if number is not None:
+            decimals = max_precision([number])
+            if self.widest_number is None or decimals > self.max_decimals:
+                self.max_decimals = decimals
+                self.widest_number = value
+        return True
+
+    def check(self, row_number: int, value: str) -> None:
+        while not self._accepts(self.candidate, value):
+            self.candidates.pop(0)
+            self.changed_at = row_number
+
+
+def _read_rows(
+    path: str, delimiter: str, sample_rows: Optional[int]
+) -> Iterator[List[str]]:
+    with open(path, "r", encoding="utf-8-sig") as f:
+        reader = agate_csv.reader(f, delimiter=delimiter)
+        next(reader, None)
+        yield from islice(reader, sample_rows)
+
+
+def infer_seed_sample(
+    path: str,
+    delimiter: str,
+    known_columns: AbstractSet[str] = frozenset(),
+    sample_rows: Optional[int] = None,
+) -> SeedSample:
+    """
+    Infer the column types of a seed CSV the same way as `agate.Table.from_csv` without loading
+    it into memory. A column's type is the most preferred type that accepts all of its values
+    but, unlike agate, each value is only tested against the best type so far rather than
+    every type. The file is streamed again for the columns whose type changed until every
+    column's type has been checked against every row. Columns in `known_columns` aren't
+    inferred, so if they cover every column only the header is read. `sample_rows` limits how
+    many rows are read, which can infer a narrower type than `dbt seed` if a later row doesn't
+    fit it.
+
+    Large seeds are parsed in a separate process so this must only depend on its arguments
+    """
+    with open(path, "r", encoding="utf-8-sig") as f:
+        header: List[str] = next(agate_csv.reader(f, delimiter=delimiter), [])
+    # agate fills in blank column names and renames duplicates
+    column_names = list(ag.Table([], header, [ag.Text()] * len(header)).column_names)
+    columns = [
+        _ColumnInference(index)
+        for index, name in enumerate(column_names)
+        if name not in known_columns
+    ]
+
+    pending = columns
+    while pending:
+        active = pending
+        for row_number, row in enumerate(_read_rows(path, delimiter, sample_rows)):
+            if len(row) > len(column_names):
+                raise ValueError(
+                    f"Row {row_number} has {len(row)} values, but Table only has {len(column_names)} columns."
+                )
+            still_active = []
+            for column in active:
+                if column.is_checked(row_number):
+                    continue
+                if column.index < len(row):
+                    column.check(row_number, row[column.index])
+                if not column.resolved:
+                    still_active.append(column)
+            active = still_active
+            if not active:
+                break
+        pending = [
+            column
+            for column in pending
+            if not column.resolved and column.changed_at is not None
+        ]
+        for column in pending:
+            column.checked_from, column.changed_at = column.changed_at, None
+
+    column_types: List[ag.DataType] = [ag.Text()] * len(column_names)
+    sample_row: List[Optional[str]] = [None] * len(column_names)
+    for column in columns:
+        column_types[column.index] = column.candidate
+        if isinstance(column.candidate, ag.Number):
+            sample_row[column.index] = column.widest_number
+    return SeedSample(column_names, column_types, [sample_row])
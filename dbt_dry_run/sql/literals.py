@@ -1,3 +1,4 @@
+import hashlib
 import re
 from typing import Callable, Dict
 from uuid import uuid4
@@ -92,3 +93,26 @@ def replace_upstream_sql(node_sql: str, node: Node, table: Table) -> str:
     select_literal = get_sql_literal_from_table(table)
     new_node_sql = regex.sub(r"\1" + select_literal, node_sql)
     return new_node_sql
+
+
+# Upstream STRING and BYTES columns are replaced with a random UUID literal every time
+_UUID_REGEX = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+_NIL_UUID = "00000000-0000-0000-0000-000000000000"
+_WHITESPACE_REGEX = re.compile(r"\s+")
+
+
+def normalise_sql(sql: str) -> str:
+    """
+    Remove the parts of a query that change each time the literals above are generated so
+    that the same SQL for the same upstream schemas always normalises to the same string.
+    Line breaks are kept because a `--` comment ends at the end of its line
+    """
+    sql = _UUID_REGEX.sub(_NIL_UUID, sql)
+    lines = (_WHITESPACE_REGEX.sub(" ", line).strip() for line in sql.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def sql_key(sql: str) -> str:
+    return hashlib.sha256(normalise_sql(sql).encode("utf-8")).hexdigest()
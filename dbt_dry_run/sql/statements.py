@@ -1,7 +1,9 @@
 from typing import Callable, Dict, List, cast
 
+from dbt_dry_run import tracing
 from dbt_dry_run.exception import UpstreamFailedException
 from dbt_dry_run.models import Table
+from dbt_dry_run.models.dry_run_result import DryRunResult
 from dbt_dry_run.models.manifest import Node
 from dbt_dry_run.models.report import DryRunStatus
 from dbt_dry_run.results import Results
@@ -22,21 +24,19 @@ class SQLPreprocessor:
         self.transformers = transformers
 
     def __call__(self, node: Node, results: Results) -> str:
-        sql_statement = node.compiled_code
-        for transformer in self.transformers:
-            sql_statement = transformer(sql_statement, node, results)
-        return sql_statement
+        with tracing.span("preprocess", "node"):
+            sql_statement = node.compiled_code
+            for transformer in self.transformers:
+                sql_statement = transformer(sql_statement, node, results)
+            return sql_statement
 
 
-def insert_dependant_sql_literals(
-    sql_statement: str, node: Node, results: Results
-) -> str:
+def get_successful_upstream_results(node: Node, results: Results) -> List[DryRunResult]:
+    """
+    Raises `UpstreamFailedException` if any upstream of the node didn't succeed
+    """
     if node.depends_on.deep_nodes is not None:
-        upstream_results = [
-            results.get_result(n)
-            for n in node.depends_on.deep_nodes
-            if n in results.keys()
-        ]
+        upstream_results = results.get_many(node.depends_on.deep_nodes)
     else:
         raise KeyError(f"deep_nodes have not been created for {node.unique_id}")
     failed_upstreams = [r for r in upstream_results if r.status != DryRunStatus.SUCCESS]
@@ -46,6 +46,13 @@ def insert_dependant_sql_literals(
         )
         msg = f"Can't insert SELECT literals for {node.unique_id}. Upstreams did not run with status: {failed_upstreams_messages}"
         raise UpstreamFailedException(msg)
+    return upstream_results
+
+
+def insert_dependant_sql_literals(
+    sql_statement: str, node: Node, results: Results
+) -> str:
+    upstream_results = get_successful_upstream_results(node, results)
     completed_upstreams = [r for r in upstream_results if r.table]
 
     node_new_sql = sql_statement
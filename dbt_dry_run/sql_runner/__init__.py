@@ -1,12 +1,17 @@
 from abc import ABCMeta, abstractmethod
-from typing import Optional, Tuple
+from concurrent.futures import Executor
+from typing import Iterable, Optional, Tuple
 
 import agate
 
 from dbt_dry_run.adapter.service import ProjectService
-from dbt_dry_run.models import Table
+from dbt_dry_run.models import QueryStatistics, Table
 from dbt_dry_run.models.manifest import Node
-from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.models.report import DryRunStatus, RunStatistics
+
+QueryResult = Tuple[
+    DryRunStatus, Optional[Table], Optional[Exception], Optional[QueryStatistics]
+]
 
 
 class SQLRunner(metaclass=ABCMeta):
@@ -23,10 +28,26 @@ class SQLRunner(metaclass=ABCMeta):
     @abstractmethod
     def get_node_schema(self, node: Node) -> Optional[Table]: ...
 
+    def prefetch_node_schemas(self, nodes: Iterable[Node], executor: Executor) -> None:
+        """
+        Load the schemas of `nodes` in bulk before the run so that `get_node_schema` and
+        `node_exists` can answer from memory
+        """
+        pass
+
     @abstractmethod
-    def query(
-        self, sql: str
-    ) -> Tuple[DryRunStatus, Optional[Table], Optional[Exception]]: ...
+    def query(self, sql: str) -> QueryResult:
+        """
+        Dry run `sql` and return its status, predicted schema, the exception if it failed and
+        the statistics of the query job if the backend provides them
+        """
+        ...
+
+    def update_statistics(self, statistics: RunStatistics) -> None:
+        """
+        Add any statistics the runner has collected during the run to `statistics`
+        """
+        pass
 
     def convert_agate_type(
         self, agate_table: agate.Table, col_idx: int
@@ -1,6 +1,26 @@
-from typing import List, Optional, Tuple
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
+import requests.exceptions
+from google.api_core.client_options import ClientOptions
+from google.api_core.exceptions import GoogleAPICallError
 from google.cloud.bigquery import (
+    ArrayQueryParameter,
     Client,
     DatasetReference,
     QueryJobConfig,
@@ -9,76 +29,296 @@ from google.cloud.bigquery import (
 )
 from google.cloud.exceptions import BadRequest, Forbidden, NotFound
 from pydantic import ValidationError
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
+from dbt_dry_run import flags, tracing
 from dbt_dry_run.adapter.service import ProjectService
-from dbt_dry_run.exception import UnknownSchemaException
-from dbt_dry_run.models import Table, TableField
+from dbt_dry_run.exception import RetryableException, UnknownSchemaException
+from dbt_dry_run.metrics import (
+    BIGQUERY_CLIENTS,
+    BIGQUERY_REQUEST_DURATION,
+    BIGQUERY_RETRYABLE_ERRORS,
+    BIGQUERY_THROTTLED,
+)
+from dbt_dry_run.models import QueryStatistics, Table, TableField
 from dbt_dry_run.models.manifest import Node
-from dbt_dry_run.models.report import DryRunStatus
-from dbt_dry_run.sql_runner import SQLRunner
+from dbt_dry_run.models.table import trusted_table_fields
+from dbt_dry_run.models.report import DryRunStatus, RunStatistics
+from dbt_dry_run.sql_runner import QueryResult, SQLRunner
+from dbt_dry_run.sql_runner.information_schema import (
+    COLUMN_FIELD_PATHS_SQL,
+    tables_from_column_field_paths,
+)
 
-MAX_ATTEMPT_NUMBER = 5
 QUERY_TIMED_OUT = "Dry run query timed out"
 
+# See https://cloud.google.com/bigquery/docs/error-messages
+RETRYABLE_ERROR_REASONS = frozenset(
+    [
+        "backendError",
+        "badGateway",
+        "internalError",
+        "jobBackendError",
+        "jobInternalError",
+        "jobRateLimitExceeded",
+        "rateLimitExceeded",
+        "timeout",
+    ]
+)
+NON_RETRYABLE_ERROR_REASONS = frozenset(
+    [
+        "accessDenied",
+        "billingNotEnabled",
+        "duplicate",
+        "invalid",
+        "invalidQuery",
+        "notFound",
+        "quotaExceeded",
+        "resourcesExceeded",
+        "responseTooLarge",
+    ]
+)
+RETRYABLE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+RATE_LIMIT_ERROR_REASONS = frozenset(["jobRateLimitExceeded", "rateLimitExceeded"])
+# Retries are scheduled per node by `execution` from the run's retry budget, so the client
+# must not also retry (For up to 10 minutes) underneath it before `is_retryable_error` sees
+# the error
+CLIENT_RETRY = None
+
+
+def is_retryable_error(exception: Exception) -> bool:
+    """
+    Deterministic errors (Invalid SQL, missing tables, permissions) fail the same way every time
+    so are never retried. Rate limits, backend errors and timeouts are
+    """
+    if QUERY_TIMED_OUT in str(exception):
+        return True
+    if isinstance(exception, GoogleAPICallError):
+        reasons = {
+            error.get("reason")
+            for error in exception.errors or []
+            if isinstance(error, dict)
+        }
+        if reasons & NON_RETRYABLE_ERROR_REASONS:
+            return False
+        if reasons & RETRYABLE_ERROR_REASONS:
+            return True
+        return exception.code in RETRYABLE_STATUS_CODES
+    return isinstance(
+        exception,
+        (
+            ConnectionError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ),
+    )
+
+
+def is_rate_limit_error(exception: Exception) -> bool:
+    if not isinstance(exception, GoogleAPICallError):
+        return False
+    reasons = {
+        error.get("reason")
+        for error in exception.errors or []
+        if isinstance(error, dict)
+    }
+    return bool(reasons & RATE_LIMIT_ERROR_REASONS) or exception.code == 429
+
+
+@contextmanager
+def _bigquery_call(call: str) -> Generator[None, None, None]:
+    with tracing.span(f"bigquery.{call}", "bigquery"):
+        with BIGQUERY_REQUEST_DURATION.time(call=call):
+            yield
+
+
+def _retryable_exception(call: str, exception: Exception) -> RetryableException:
+    BIGQUERY_RETRYABLE_ERRORS.inc(call=call)
+    if is_rate_limit_error(exception):
+        BIGQUERY_THROTTLED.inc(call=call)
+    return RetryableException(exception)
+
+
+_TableKey = Tuple[str, str, str]
+
+
+class _ThreadClient:
+    def __init__(self, client: Client):
+        self.client = client
+        self.acquisitions = 0
+        self.acquisition_seconds = 0.0
+
 
 class BigQuerySQLRunner(SQLRunner):
     JOB_CONFIG = QueryJobConfig(dry_run=True, use_query_cache=False)
 
     def __init__(self, project: ProjectService):
         self._project = project
+        self._thread_local = threading.local()
+        self._thread_clients: List[_ThreadClient] = []
+        self._thread_clients_lock = threading.Lock()
+        self._prefetched_schemas: Dict[_TableKey, Optional[Table]] = {}
 
     def node_exists(self, node: Node) -> bool:
         return self.get_node_schema(node) is not None
 
     def get_node_schema(self, node: Node) -> Optional[Table]:
+        table_key = (node.database, node.db_schema, node.alias)
+        if table_key in self._prefetched_schemas:
+            return self._prefetched_schemas[table_key]
         client = self.get_client()
         try:
             dataset = DatasetReference(node.database, node.db_schema)
             table_ref = TableReference(dataset, node.alias)
-            bigquery_table = client.get_table(table_ref)
+            with _bigquery_call("get_table"):
+                bigquery_table = client.get_table(
+                    table_ref,
+                    retry=CLIENT_RETRY,  # type: ignore[arg-type]
+                )
 
             return Table.from_bigquery_table(bigquery_table)
         except NotFound:
             return None
+        except (GoogleAPICallError, requests.exceptions.RequestException) as e:
+            if is_retryable_error(e):
+                raise _retryable_exception("get_table", e) from e
+            raise
+
+    def prefetch_node_schemas(self, nodes: Iterable[Node], executor: Executor) -> None:
+        """
+        Query INFORMATION_SCHEMA once per dataset instead of calling `get_table` once per node.
+        Datasets that can't be queried (Missing dataset, permissions, connection errors) and
+        tables whose schema can't be parsed are left out so `get_node_schema` falls back to
+        `get_table` for them
+        """
+        datasets: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        for node in nodes:
+            datasets[(node.database, node.db_schema)].add(node.alias)
+        for prefetched in executor.map(
+            lambda dataset: self._fetch_dataset_schemas(*dataset), datasets.items()
+        ):
+            self._prefetched_schemas.update(prefetched)
+
+    def _fetch_dataset_schemas(
+        self, dataset: Tuple[str, str], table_names: Set[str]
+    ) -> Dict[_TableKey, Optional[Table]]:
+        database, schema = dataset
+        sql = COLUMN_FIELD_PATHS_SQL.format(database=database, schema=schema)
+        job_config = QueryJobConfig(
+            query_parameters=[
+                ArrayQueryParameter("table_names", "STRING", sorted(table_names))
+            ]
+        )
+        try:
+            with _bigquery_call("information_schema"):
+                query_job = self.get_client().query(
+                    sql,
+                    job_config=job_config,
+                    retry=CLIENT_RETRY,  # type: ignore[arg-type]
+                    job_retry=CLIENT_RETRY,
+                )
+                rows = query_job.result(retry=CLIENT_RETRY, job_retry=CLIENT_RETRY)
+            tables = tables_from_column_field_paths(
+                cast(Iterable[Mapping[str, Any]], rows)
+            )
+        except (GoogleAPICallError, requests.exceptions.RequestException):
+            return {}
+
+        prefetched: Dict[_TableKey, Optional[Table]] = {}
+        for table_name in table_names:
+            if table_name not in tables:
+                prefetched[(database, schema, table_name)] = None
+            elif tables[table_name] is not None:
+                prefetched[(database, schema, table_name)] = tables[table_name]
+        return prefetched
 
     def get_client(self) -> Client:
-        connection = self._project.get_connection()
-        return connection.handle
+        """
+        Each worker thread opens its own client the first time it needs one and then keeps
+        reusing it (and its HTTP keep-alive connections) for the rest of the run, so we only go
+        through dbt's connection bookkeeping once per thread
+        """
+        start = time.perf_counter()
+        thread_client: Optional[_ThreadClient] = getattr(
+            self._thread_local, "client", None
+        )
+        if thread_client is None:
+            connection = self._project.get_connection()
+            thread_client = _ThreadClient(self._create_client(connection.handle))
+            self._thread_local.client = thread_client
+            with self._thread_clients_lock:
+                self._thread_clients.append(thread_client)
+            BIGQUERY_CLIENTS.inc()
+        thread_client.acquisitions += 1
+        thread_client.acquisition_seconds += time.perf_counter() - start
+        return thread_client.client
 
-    @retry(
-        retry=retry_if_exception_type(BadRequest),
-        stop=stop_after_attempt(MAX_ATTEMPT_NUMBER),
-        wait=wait_exponential(multiplier=0.5, min=0.5, max=10),
-    )
-    def query(
-        self, sql: str
-    ) -> Tuple[DryRunStatus, Optional[Table], Optional[Exception]]:
+    @staticmethod
+    def _create_client(connection_client: Client) -> Client:
+        if not flags.BIGQUERY_API_ENDPOINT:
+            return connection_client
+        # The dbt adapter doesn't let us set the endpoint, so build a client with the same
+        # project, credentials and location that points at the overridden endpoint instead
+        return Client(
+            project=connection_client.project,
+            credentials=connection_client._credentials,
+            location=connection_client.location,
+            client_options=ClientOptions(api_endpoint=flags.BIGQUERY_API_ENDPOINT),
+        )
+
+    def update_statistics(self, statistics: RunStatistics) -> None:
+        with self._thread_clients_lock:
+            thread_clients = list(self._thread_clients)
+        statistics.bigquery_clients_created += len(thread_clients)
+        for thread_client in thread_clients:
+            statistics.bigquery_client_acquisitions += thread_client.acquisitions
+            statistics.bigquery_client_acquisition_seconds += (
+                thread_client.acquisition_seconds
+            )
+
+    def query(self, sql: str) -> QueryResult:
         exception = None
         table = None
+        statistics = None
         client = self.get_client()
         try:
-            query_job = client.query(sql, job_config=self.JOB_CONFIG)
+            with _bigquery_call("query"):
+                query_job = client.query(
+                    sql,
+                    job_config=self.JOB_CONFIG,
+                    retry=CLIENT_RETRY,  # type: ignore[arg-type]
+                    job_retry=CLIENT_RETRY,
+                )
             table = self.get_schema_from_schema_fields(query_job.schema or [])
+            statistics = QueryStatistics(
+                total_bytes_processed=query_job.total_bytes_processed,
+                referenced_tables=[
+                    f"{ref.project}.{ref.dataset_id}.{ref.table_id}"
+                    for ref in query_job.referenced_tables
+                ],
+            )
             status = DryRunStatus.SUCCESS
-        except (Forbidden, BadRequest, NotFound) as e:
-            status = DryRunStatus.FAILURE
-            if QUERY_TIMED_OUT in str(e):
+        except (GoogleAPICallError, requests.exceptions.RequestException) as e:
+            if is_retryable_error(e):
+                raise _retryable_exception("query", e) from e
+            if not isinstance(e, (Forbidden, BadRequest, NotFound)):
                 raise
+            status = DryRunStatus.FAILURE
             exception = e
-        return status, table, exception
+        return status, table, exception, statistics
 
     @staticmethod
     def get_schema_from_schema_fields(schema_fields: List[SchemaField]) -> Table:
+        trusted_fields = trusted_table_fields(schema_fields)
+        if trusted_fields is not None:
+            return Table.model_construct(fields=trusted_fields)
+        return BigQuerySQLRunner._validate_schema_fields(schema_fields)
+
+    @staticmethod
+    def _validate_schema_fields(schema_fields: List[SchemaField]) -> Table:
         def _map_schema_fields_to_table_field(schema_field: SchemaField) -> TableField:
             try:
                 parsed_fields = (
-                    BigQuerySQLRunner.get_schema_from_schema_fields(
+                    BigQuerySQLRunner._validate_schema_fields(
                         schema_field.fields
                     ).fields
                     if schema_field.fields
@@ -0,0 +1,130 @@
+from concurrent.futures import Executor
+from threading import Lock
+from typing import Dict, Iterable, Optional, Type
+
+import agate
+
+from dbt_dry_run.adapter.service import ProjectService
+from dbt_dry_run.exception import CassetteMissException
+from dbt_dry_run.models import Table
+from dbt_dry_run.models.cassette import (
+    CASSETTE_VERSION,
+    Cassette,
+    RecordedException,
+    RecordedQuery,
+)
+from dbt_dry_run.models.manifest import Node
+from dbt_dry_run.models.report import DryRunStatus, RunStatistics
+from dbt_dry_run.sql.literals import sql_key
+from dbt_dry_run.sql_runner import QueryResult, SQLRunner
+
+
+def load_cassette(path: str) -> Cassette:
+    with open(path) as f:
+        cassette = Cassette.model_validate_json(f.read())
+    if cassette.version != CASSETTE_VERSION:
+        raise ValueError(
+            f"Cassette '{path}' has version {cassette.version} but only version {CASSETTE_VERSION} is supported"
+        )
+    return cassette
+
+
+def save_cassette(cassette: Cassette, path: str) -> None:
+    with open(path, "w") as f:
+        f.write(cassette.model_dump_json(by_alias=True))
+
+
+class RecordingSQLRunner(SQLRunner):
+    """
+    Wraps another `SQLRunner` and records the response to every `query` and `get_node_schema`
+    in a cassette so that the run can be replayed later with `ReplaySQLRunner`. Requests that
+    raise, such as retryable errors, are not recorded
+    """
+
+    def __init__(self, sql_runner: SQLRunner, cassette: Cassette):
+        super().__init__(sql_runner._project)
+        self._sql_runner = sql_runner
+        self._cassette = cassette
+        self._lock = Lock()
+
+    def node_exists(self, node: Node) -> bool:
+        return self.get_node_schema(node) is not None
+
+    def get_node_schema(self, node: Node) -> Optional[Table]:
+        table = self._sql_runner.get_node_schema(node)
+        with self._lock:
+            self._cassette.schemas[node.get_table_ref_literal()] = table
+        return table
+
+    def prefetch_node_schemas(self, nodes: Iterable[Node], executor: Executor) -> None:
+        self._sql_runner.prefetch_node_schemas(nodes, executor)
+
+    def query(self, sql: str) -> QueryResult:
+        status, table, exception, statistics = self._sql_runner.query(sql)
+        recorded_exception = (
+            RecordedException(type=exception.__class__.__name__, message=str(exception))
+            if exception
+            else None
+        )
+        recorded_query = RecordedQuery(
+            status=status,
+            table=table,
+            exception=recorded_exception,
+            statistics=statistics,
+        )
+        with self._lock:
+            self._cassette.queries[sql_key(sql)] = recorded_query
+        return status, table, exception, statistics
+
+    def update_statistics(self, statistics: RunStatistics) -> None:
+        self._sql_runner.update_statistics(statistics)
+
+    def convert_agate_type(
+        self, agate_table: agate.Table, col_idx: int
+    ) -> Optional[str]:
+        return self._sql_runner.convert_agate_type(agate_table, col_idx)
+
+
+class ReplaySQLRunner(SQLRunner):
+    """
+    Serves every `query` and `get_node_schema` from a cassette recorded by `RecordingSQLRunner`
+    without any access to BigQuery. A query that isn't in the cassette fails with
+    `CassetteMissException`
+    """
+
+    def __init__(self, project: ProjectService, cassette: Cassette):
+        super().__init__(project)
+        self._cassette = cassette
+        self._exception_types: Dict[str, Type[Exception]] = {}
+
+    def node_exists(self, node: Node) -> bool:
+        return self.get_node_schema(node) is not None
+
+    def get_node_schema(self, node: Node) -> Optional[Table]:
+        table = self._cassette.schemas.get(node.get_table_ref_literal())
+        return table.model_copy(deep=True) if table else None
+
+    def _to_exception(self, recorded: RecordedException) -> Exception:
+        # Recreate an exception with the recorded class name so the report is identical
+        exception_type = self._exception_types.get(recorded.type)
+        if exception_type is None:
+            exception_type = type(recorded.type, (Exception,), {})
+            self._exception_types[recorded.type] = exception_type
+        return exception_type(recorded.message)
+
+    def query(self, sql: str) -> QueryResult:
+        recorded = self._cassette.queries.get(sql_key(sql))
+        if recorded is None:
+            return (
+                DryRunStatus.FAILURE,
+                None,
+                CassetteMissException(
+                    f"Query with key '{sql_key(sql)}' was not recorded in the cassette"
+                ),
+                None,
+            )
+        table = recorded.table.model_copy(deep=True) if recorded.table else None
+        exception = (
+            self._to_exception(recorded.exception) if recorded.exception else None
+        )
+        return recorded.status, table, exception, recorded.statistics
@@ -0,0 +1,99 @@
+from concurrent.futures import Executor, Future
+from threading import Lock
+from typing import Callable, Dict, Generic, Iterable, Optional, TypeVar
+
+import agate
+
+from dbt_dry_run.metrics import CACHE_REQUESTS
+from dbt_dry_run.models import Table
+from dbt_dry_run.models.manifest import Node
+from dbt_dry_run.models.report import RunStatistics
+from dbt_dry_run.sql.literals import sql_key
+from dbt_dry_run.sql_runner import QueryResult, SQLRunner
+
+T = TypeVar("T")
+
+
+class _SingleFlight(Generic[T]):
+    """
+    Runs a call once per key. Callers that ask for a key while its call is in flight wait for
+    it and share its result, callers that ask after it completed get the result from memory.
+    A call that raises is forgotten so that it can be tried again
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._lock = Lock()
+        self._calls: Dict[str, Future[T]] = {}
+        self.coalesced = 0
+        self.cached = 0
+
+    def do(self, key: str, call: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+                is_owner = True
+                CACHE_REQUESTS.inc(cache=self._name, result="miss")
+            else:
+                is_owner = False
+                if future.done():
+                    self.cached += 1
+                    CACHE_REQUESTS.inc(cache=self._name, result="hit")
+                else:
+                    self.coalesced += 1
+                    CACHE_REQUESTS.inc(cache=self._name, result="coalesced")
+        if not is_owner:
+            return future.result()
+        try:
+            result = call()
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+        return result
+
+
+class CoalescingSQLRunner(SQLRunner):
+    """
+    Wraps another `SQLRunner` so identical requests in a run only reach BigQuery once. Queries
+    are matched on their normalised SQL, so test nodes that compile to the same SQL apart from
+    the generated upstream literals share one dry run, and schema lookups are matched on the
+    table. The results are shared between nodes so they must not be mutated
+    """
+
+    def __init__(self, sql_runner: SQLRunner):
+        super().__init__(sql_runner._project)
+        self._sql_runner = sql_runner
+        self._queries: _SingleFlight[QueryResult] = _SingleFlight("query")
+        self._schemas: _SingleFlight[Optional[Table]] = _SingleFlight("schema_lookup")
+
+    def node_exists(self, node: Node) -> bool:
+        return self.get_node_schema(node) is not None
+
+    def get_node_schema(self, node: Node) -> Optional[Table]:
+        return self._schemas.do(
+            node.get_table_ref_literal(),
+            lambda: self._sql_runner.get_node_schema(node),
+        )
+
+    def prefetch_node_schemas(self, nodes: Iterable[Node], executor: Executor) -> None:
+        self._sql_runner.prefetch_node_schemas(nodes, executor)
+
+    def query(self, sql: str) -> QueryResult:
+        return self._queries.do(sql_key(sql), lambda: self._sql_runner.query(sql))
+
+    def update_statistics(self, statistics: RunStatistics) -> None:
+        self._sql_runner.update_statistics(statistics)
+        statistics.coalesced_queries += self._queries.coalesced
+        statistics.cached_queries += self._queries.cached
+        statistics.coalesced_schema_lookups += self._schemas.coalesced
+        statistics.cached_schema_lookups += self._schemas.cached
+
+    def convert_agate_type(
+        self, agate_table: agate.Table, col_idx: int
+    ) -> Optional[str]:
+        return self._sql_runner.convert_agate_type(agate_table, col_idx)
@@ -0,0 +1,201 @@
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from dbt_dry_run.models import BigQueryFieldMode, BigQueryFieldType, Table, TableField
+
+COLUMN_FIELD_PATHS_SQL = """
+SELECT
+  paths.table_name,
+  paths.field_path,
+  paths.data_type,
+  paths.description,
+  columns.ordinal_position,
+  columns.is_nullable
+FROM `{database}`.`{schema}`.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS AS paths
+LEFT JOIN `{database}`.`{schema}`.INFORMATION_SCHEMA.COLUMNS AS columns
+  ON columns.table_name = paths.table_name AND columns.column_name = paths.field_path
+WHERE paths.table_name IN UNNEST(@table_names)
+  AND IFNULL(columns.is_hidden, 'NO') = 'NO'
+"""
+
+# INFORMATION_SCHEMA uses the standard SQL type names but `client.get_table` returns the
+# legacy names, map them so that prefetched schemas are identical to fetched ones
+_STANDARD_TO_LEGACY_TYPE: Dict[str, BigQueryFieldType] = {
+    "INT64": BigQueryFieldType.INTEGER,
+    "FLOAT64": BigQueryFieldType.FLOAT,
+    "BOOL": BigQueryFieldType.BOOLEAN,
+    "STRUCT": BigQueryFieldType.RECORD,
+    "DECIMAL": BigQueryFieldType.NUMERIC,
+    "BIGDECIMAL": BigQueryFieldType.BIGNUMERIC,
+}
+
+_TOKEN_REGEX = re.compile(r"\s*(`[^`]*`|[A-Za-z_][A-Za-z0-9_]*|\d+|[<>(),])")
+
+
+class DataTypeParseError(ValueError):
+    pass
+
+
+def _tokenize(data_type: str) -> List[str]:
+    tokens: List[str] = []
+    position = 0
+    stripped = data_type.rstrip()
+    while position < len(stripped):
+        match = _TOKEN_REGEX.match(stripped, position)
+        if not match:
+            raise DataTypeParseError(f"Could not parse data type '{data_type}'")
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+class _DataTypeParser:
+    def __init__(self, data_type: str):
+        self._data_type = data_type
+        self._tokens = _tokenize(data_type)
+        self._position = 0
+
+    def _peek(self) -> Optional[str]:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise DataTypeParseError(f"Unexpected end of data type '{self._data_type}'")
+        self._position += 1
+        return token
+
+    def _expect(self, expected: str) -> None:
+        token = self._next()
+        if token != expected:
+            raise DataTypeParseError(
+                f"Expected '{expected}' but found '{token}' in data type '{self._data_type}'"
+            )
+
+    def _skip_parameters(self) -> None:
+        # Parameterised types such as STRING(10) or NUMERIC(10, 2)
+        if self._peek() == "(":
+            while self._next() != ")":
+                pass
+
+    def _parse_not_null(self) -> bool:
+        token = self._peek()
+        if token is not None and token.upper() == "NOT":
+            self._next()
+            if self._next().upper() != "NULL":
+                raise DataTypeParseError(f"Expected NOT NULL in '{self._data_type}'")
+            return True
+        return False
+
+    def parse_field(self, name: str, mode: BigQueryFieldMode) -> TableField:
+        type_name = self._next().upper()
+        fields: Optional[List[TableField]] = None
+        if type_name == "ARRAY":
+            self._expect("<")
+            field = self.parse_field(name, BigQueryFieldMode.REPEATED)
+            self._expect(">")
+            return field
+        if type_name == "STRUCT":
+            self._expect("<")
+            fields = []
+            while True:
+                field_name = self._next().strip("`")
+                nested = self.parse_field(field_name, BigQueryFieldMode.NULLABLE)
+                fields.append(nested)
+                if self._peek() == ",":
+                    self._next()
+                    continue
+                self._expect(">")
+                break
+        elif type_name == "RANGE":
+            self._expect("<")
+            self._next()
+            self._expect(">")
+        else:
+            self._skip_parameters()
+        if self._parse_not_null() and mode != BigQueryFieldMode.REPEATED:
+            mode = BigQueryFieldMode.REQUIRED
+        try:
+            field_type = _STANDARD_TO_LEGACY_TYPE.get(type_name) or BigQueryFieldType(
+                type_name
+            )
+        except ValueError:
+            raise DataTypeParseError(
+                f"Unknown type '{type_name}' in data type '{self._data_type}'"
+            )
+        return TableField(name=name, type=field_type, mode=mode, fields=fields)
+
+    def parse(self, name: str, mode: BigQueryFieldMode) -> TableField:
+        field = self.parse_field(name, mode)
+        if self._peek() is not None:
+            raise DataTypeParseError(
+                f"Unexpected '{self._peek()}' in data type '{self._data_type}'"
+            )
+        return field
+
+
+def parse_data_type(
+    name: str, data_type: str, mode: BigQueryFieldMode = BigQueryFieldMode.NULLABLE
+) -> TableField:
+    """
+    Parse an INFORMATION_SCHEMA data type such as `ARRAY<STRUCT<a INT64, b STRING>>` into a
+    `TableField`
+    """
+    return _DataTypeParser(data_type).parse(name, mode)
+
+
+def _with_descriptions(
+    field: TableField, path: str, descriptions: Mapping[str, Optional[str]]
+) -> TableField:
+    field.description = descriptions.get(path)
+    for nested in field.fields or []:
+        _with_descriptions(nested, f"{path}.{nested.name}", descriptions)
+    return field
+
+
+def tables_from_column_field_paths(
+    rows: Iterable[Mapping[str, Any]],
+) -> Dict[str, Optional[Table]]:
+    """
+    Build a table schema for every table in the rows of `COLUMN_FIELD_PATHS_SQL`. A table maps
+    to `None` if its schema could not be parsed so that the caller can fall back to fetching it
+    """
+    top_level_columns: Dict[str, List[Tuple[int, str, str, bool]]] = defaultdict(list)
+    descriptions: Dict[str, Dict[str, Optional[str]]] = defaultdict(dict)
+    for row in rows:
+        table_name = row["table_name"]
+        descriptions[table_name][row["field_path"]] = row["description"]
+        if row["ordinal_position"] is not None:
+            top_level_columns[table_name].append(
+                (
+                    row["ordinal_position"],
+                    row["field_path"],
+                    row["data_type"],
+                    row["is_nullable"] == "NO",
+                )
+            )
+
+    tables: Dict[str, Optional[Table]] = {}
+    for table_name, columns in top_level_columns.items():
+        try:
+            fields = [
+                _with_descriptions(
+                    parse_data_type(
+                        column_name,
+                        data_type,
+                        BigQueryFieldMode.REQUIRED
+                        if required
+                        else BigQueryFieldMode.NULLABLE,
+                    ),
+                    column_name,
+                    descriptions[table_name],
+                )
+                for _, column_name, data_type, required in sorted(columns)
+            ]
+            tables[table_name] = Table(fields=fields)
+        except DataTypeParseError:
+            tables[table_name] = None
+    return tables
@@ -0,0 +1,443 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from dbt_dry_run.adapter.service import ProjectService
+from dbt_dry_run.columns_metadata import map_columns_to_table
+from dbt_dry_run.exception import (
+    InvalidColumnSpecification,
+    UnknownColumnException,
+    UnknownDataTypeException,
+    UnsupportedSQLException,
+)
+from dbt_dry_run.models import BigQueryFieldMode, BigQueryFieldType, Table, TableField
+from dbt_dry_run.models.manifest import Node
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.sql_runner import QueryResult, SQLRunner
+
+try:
+    import sqlglot
+    from sqlglot import exp
+    from sqlglot.errors import OptimizeError, ParseError
+    from sqlglot.optimizer.annotate_types import annotate_types
+    from sqlglot.optimizer.qualify import qualify
+    from sqlglot.optimizer.scope import traverse_scope
+    from sqlglot.schema import MappingSchema
+except ImportError:  # pragma: no cover
+    sqlglot = None  # type: ignore
+
+DIALECT = "bigquery"
+
+# Use the legacy type names so that inferred schemas match what a BigQuery dry run returns
+_SQLGLOT_TO_BIGQUERY_TYPE: Dict[str, BigQueryFieldType] = {
+    "VARCHAR": BigQueryFieldType.STRING,
+    "TEXT": BigQueryFieldType.STRING,
+    "CHAR": BigQueryFieldType.STRING,
+    "NVARCHAR": BigQueryFieldType.STRING,
+    "NCHAR": BigQueryFieldType.STRING,
+    "BINARY": BigQueryFieldType.BYTES,
+    "VARBINARY": BigQueryFieldType.BYTES,
+    "TINYINT": BigQueryFieldType.INTEGER,
+    "SMALLINT": BigQueryFieldType.INTEGER,
+    "INT": BigQueryFieldType.INTEGER,
+    "BIGINT": BigQueryFieldType.INTEGER,
+    "FLOAT": BigQueryFieldType.FLOAT,
+    "DOUBLE": BigQueryFieldType.FLOAT,
+    "BOOLEAN": BigQueryFieldType.BOOLEAN,
+    "DECIMAL": BigQueryFieldType.NUMERIC,
+    "BIGDECIMAL": BigQueryFieldType.BIGNUMERIC,
+    "DATE": BigQueryFieldType.DATE,
+    "DATETIME": BigQueryFieldType.DATETIME,
+    "TIMESTAMP": BigQueryFieldType.DATETIME,
+    "TIMESTAMPTZ": BigQueryFieldType.TIMESTAMP,
+    "TIMESTAMPLTZ": BigQueryFieldType.TIMESTAMP,
+    "TIME": BigQueryFieldType.TIME,
+    "INTERVAL": BigQueryFieldType.INTERVAL,
+    "JSON": BigQueryFieldType.JSON,
+    "GEOGRAPHY": BigQueryFieldType.GEOGRAPHY,
+}
+
+_BIGQUERY_TO_STANDARD_TYPE: Dict[BigQueryFieldType, str] = {
+    BigQueryFieldType.INTEGER: "INT64",
+    BigQueryFieldType.FLOAT: "FLOAT64",
+    BigQueryFieldType.BOOLEAN: "BOOL",
+    BigQueryFieldType.RECORD: "STRUCT",
+}
+
+# BigQuery coerces numeric types to the highest ranked one. Every other type only matches itself
+_NUMERIC_TYPE_RANKS: Dict[str, int] = {
+    "TINYINT": 0,
+    "SMALLINT": 0,
+    "INT": 0,
+    "BIGINT": 0,
+    "DECIMAL": 1,
+    "BIGDECIMAL": 2,
+    "FLOAT": 3,
+    "DOUBLE": 3,
+}
+
+_TEXT_TYPES = {"VARCHAR", "TEXT", "CHAR", "NVARCHAR", "NCHAR"}
+
+# Columns BigQuery adds to some tables that are never part of their schema
+_PSEUDO_COLUMNS = {"_PARTITIONTIME", "_PARTITIONDATE", "_FILE_NAME", "_TABLE_SUFFIX"}
+
+# Projections without an alias are marked before sqlglot gives them its own names so that
+# they can be named `f<n>_` like BigQuery does
+_ANONYMOUS_COLUMN_PREFIX = "__dry_run_anonymous_"
+
+TableKey = Tuple[str, str, str]
+
+
+def _field_type_sql(field: TableField) -> str:
+    if field.fields:
+        nested = ", ".join(f"`{f.name}` {_field_type_sql(f)}" for f in field.fields)
+        type_sql = f"STRUCT<{nested}>"
+    else:
+        type_sql = _BIGQUERY_TO_STANDARD_TYPE.get(field.type_, field.type_.value)
+    if field.mode == BigQueryFieldMode.REPEATED:
+        type_sql = f"ARRAY<{type_sql}>"
+    return type_sql
+
+
+def _to_table_field(name: str, data_type: "exp.DataType") -> TableField:
+    if data_type.is_type(exp.DataType.Type.ARRAY):
+        element_type = data_type.expressions[0] if data_type.expressions else None
+        if element_type is None or element_type.is_type(exp.DataType.Type.ARRAY):
+            raise UnsupportedSQLException(
+                f"Could not infer the element type of array column '{name}'"
+            )
+        field = _to_table_field(name, element_type)
+        field.mode = BigQueryFieldMode.REPEATED
+        return field
+    if data_type.is_type(exp.DataType.Type.STRUCT):
+        nested_fields = [
+            _to_table_field(column.name, column.args["kind"])
+            for column in data_type.expressions
+        ]
+        return TableField(
+            name=name,
+            type=BigQueryFieldType.RECORD,
+            mode=BigQueryFieldMode.NULLABLE,
+            fields=nested_fields,
+        )
+    field_type = _SQLGLOT_TO_BIGQUERY_TYPE.get(data_type.this.name)
+    if field_type is None:
+        raise UnsupportedSQLException(
+            f"Could not infer the type of column '{name}' from '{data_type.sql(DIALECT)}'"
+        )
+    return TableField(name=name, type=field_type, mode=BigQueryFieldMode.NULLABLE)
+
+
+def _get_query(statements: List[Optional["exp.Expr"]]) -> "exp.Query":
+    queries = [
+        statement
+        for statement in statements
+        if statement is not None and not isinstance(statement, exp.Declare)
+    ]
+    if len(queries) != 1:
+        raise UnsupportedSQLException(
+            "Only a single query statement can be inferred offline"
+        )
+    query = queries[0]
+    if isinstance(query, exp.Create) and query.kind in ("VIEW", "TABLE"):
+        query = query.expression
+    while isinstance(query, exp.Subquery):
+        query = query.this
+    if not isinstance(query, exp.Query):
+        raise UnsupportedSQLException(
+            f"'{query.key.upper()}' statements can't be inferred offline"
+        )
+    return query
+
+
+def _declared_variables(statements: List[Optional["exp.Expr"]]) -> Set[str]:
+    return {
+        identifier.name.upper()
+        for statement in statements
+        if isinstance(statement, exp.Declare)
+        for item in statement.expressions
+        for identifier in item.this
+    }
+
+
+def _assert_columns_exist(query: "exp.Query", variables: Set[str]) -> None:
+    """
+    An unqualified column that doesn't resolve to any of the query's tables, whose schemas are
+    all known, is the one error that is certain to fail in BigQuery too
+    """
+    for scope in traverse_scope(query):
+        if (
+            not isinstance(scope.expression, exp.Select)
+            or scope.is_correlated_subquery
+            or scope.pivots
+        ):
+            continue
+        for column in scope.external_columns:
+            name = column.name.upper()
+            if column.table or name in variables or name in _PSEUDO_COLUMNS:
+                continue
+            raise UnknownColumnException(
+                f"Column '{column.name}' doesn't exist or is ambiguous"
+            )
+
+
+def _is_known(data_type: Optional["exp.DataType"]) -> bool:
+    return data_type is not None and not data_type.is_type(exp.DataType.Type.UNKNOWN)
+
+
+def _common_type(
+    data_types: Iterable["exp.DataType"], description: str
+) -> "exp.DataType":
+    """
+    The type BigQuery coerces all of `data_types` to. sqlglot picks one of them even when there
+    isn't one, so this raises instead
+    """
+    common: Optional[exp.DataType] = None
+    for data_type in data_types:
+        if common is None or data_type == common:
+            common = data_type
+            continue
+        common_rank = _NUMERIC_TYPE_RANKS.get(common.this.name)
+        rank = _NUMERIC_TYPE_RANKS.get(data_type.this.name)
+        if common_rank is None or rank is None:
+            raise UnsupportedSQLException(
+                f"Could not infer a common type for {description} from "
+                f"'{common.sql(DIALECT)}' and '{data_type.sql(DIALECT)}'"
+            )
+        if rank > common_rank:
+            common = data_type
+    if common is None:
+        raise UnsupportedSQLException(f"Could not infer the type of {description}")
+    return common
+
+
+def _set_operation_types(query: "exp.SetOperation") -> List["exp.DataType"]:
+    branches: List[exp.Expr] = [query]
+    selects: List[List[exp.Expr]] = []
+    while branches:
+        branch = branches.pop()
+        if isinstance(branch, exp.SetOperation):
+            branches.extend([branch.right, branch.left])
+        else:
+            select = branch.unnest()
+            if not isinstance(select, exp.Query):
+                raise UnsupportedSQLException(
+                    f"Could not infer the columns of '{branch.sql(DIALECT)}'"
+                )
+            selects.append(select.selects)
+    if len({len(projections) for projections in selects}) != 1:
+        raise UnsupportedSQLException(
+            "Set operation queries have different numbers of columns"
+        )
+    return [
+        _common_type(
+            (
+                projection.type
+                for projection in column
+                if not isinstance(projection.unalias(), exp.Null)
+                and _is_known(projection.type)
+            ),
+            f"set operation column {position + 1}",
+        )
+        for position, column in enumerate(zip(*selects))
+    ]
+
+
+def _branches(node: "exp.Expr") -> List[Optional["exp.Expr"]]:
+    """
+    The values of an expression that BigQuery coerces to one type
+    """
+    if isinstance(node, exp.If):
+        return [node.args["true"], node.args.get("false")]
+    if isinstance(node, exp.Case):
+        return [case.args["true"] for case in node.args["ifs"]] + [
+            node.args.get("default")
+        ]
+    if isinstance(node, (exp.Coalesce, exp.Greatest, exp.Least)):
+        return [node.this, *node.expressions]
+    if isinstance(node, exp.Array) and not any(
+        isinstance(e, exp.Query) for e in node.expressions
+    ):
+        return node.expressions
+    return []
+
+
+def _assert_branches_have_common_type(node: "exp.Expr") -> None:
+    result_type = node.type
+    if result_type is None or not _is_known(result_type):
+        return
+    if isinstance(node, exp.Array):
+        element_type = result_type.expressions[0] if result_type.expressions else None
+        if not isinstance(element_type, exp.DataType):
+            return
+        result_type = element_type
+    branch_types: List[exp.DataType] = []
+    for branch in _branches(node):
+        if branch is None or isinstance(branch, exp.Null):
+            continue
+        if branch.type is None or not _is_known(branch.type):
+            # Unknown types propagate up to the column, which is skipped anyway
+            return
+        branch_types.append(branch.type)
+    description = f"'{node.sql(DIALECT)}'"
+    if _common_type([*branch_types, result_type], description) != result_type:
+        raise UnsupportedSQLException(f"Could not infer the type of {description}")
+
+
+def _assert_types_are_certain(query: "exp.Query") -> None:
+    """
+    Where BigQuery has no common type for the values of an expression, or where sqlglot's type
+    is known to be wrong, it still annotates a type. Those queries are skipped instead of
+    trusting the guess
+    """
+    if query.args.get("kind"):
+        raise UnsupportedSQLException(
+            f"SELECT AS {query.args['kind']} can't be inferred offline"
+        )
+    for node in query.walk():
+        if (
+            isinstance(node, exp.Select)
+            and node.args.get("kind")
+            and isinstance(node.parent, exp.Subquery)
+            and not isinstance(node.parent.parent, (exp.From, exp.Join))
+        ):
+            # sqlglot types a scalar subquery as its only column, even when it's a STRUCT
+            raise UnsupportedSQLException(
+                f"Subqueries with SELECT AS {node.args['kind']} can't be inferred offline"
+            )
+        if isinstance(node, exp.SetOperation):
+            _set_operation_types(node)
+        elif isinstance(node, (exp.Add, exp.Sub, exp.Mul, exp.Div, exp.Mod)):
+            operand_types = [node.left.type, node.right.type]
+            if any(
+                data_type is not None and data_type.this.name in _TEXT_TYPES
+                for data_type in operand_types
+            ):
+                raise UnsupportedSQLException(
+                    f"Could not infer the type of '{node.sql(DIALECT)}'"
+                )
+        else:
+            _assert_branches_have_common_type(node)
+
+
+def _alias_anonymous_columns(query: "exp.Query") -> None:
+    for position, projection in enumerate(query.selects):
+        if not isinstance(projection, (exp.Alias, exp.Column, exp.Star)):
+            projection.replace(
+                exp.alias_(projection.copy(), f"{_ANONYMOUS_COLUMN_PREFIX}{position}")
+            )
+
+
+def _output_names(query: "exp.Query") -> List[str]:
+    names: List[str] = []
+    anonymous_columns = 0
+    for projection in query.selects:
+        if projection.alias_or_name.startswith(_ANONYMOUS_COLUMN_PREFIX):
+            names.append(f"f{anonymous_columns}_")
+            anonymous_columns += 1
+        else:
+            names.append(projection.alias_or_name)
+    return names
+
+
+class OfflineSQLRunner(SQLRunner):
+    """
+    Infers the schema of each query locally with sqlglot instead of dry running it in BigQuery,
+    so no network access or credentials are needed. Upstream models have already been replaced
+    with `SELECT` literals so their columns and types are known. Other tables, such as sources,
+    are only known if every column declares its `data_type`. Anything that can't be typed
+    without guessing is reported as SKIPPED
+    """
+
+    def __init__(self, project: ProjectService):
+        if sqlglot is None:
+            raise ImportError(
+                "The offline SQL runner needs sqlglot, install it with `pip install dbt-dry-run[offline]`"
+            )
+        super().__init__(project)
+        self._known_tables: Dict[TableKey, Table] = {}
+
+    def node_exists(self, node: Node) -> bool:
+        # Existence can't be checked offline so everything is assumed to exist
+        return True
+
+    def get_node_schema(self, node: Node) -> Optional[Table]:
+        declared_table = self._get_declared_table(node)
+        if declared_table is not None:
+            table_ref = node.table_ref
+            key = (table_ref.database, table_ref.db_schema, table_ref.name)
+            self._known_tables[key] = declared_table
+        if node.resource_type == "source":
+            return declared_table or Table(fields=[])
+        # Whether an incremental model's table already exists can't be known offline so it is
+        # treated like a new table
+        return None
+
+    @staticmethod
+    def _get_declared_table(node: Node) -> Optional[Table]:
+        if not node.columns or not all(c.data_type for c in node.columns.values()):
+            return None
+        try:
+            return map_columns_to_table(node.columns)
+        except (InvalidColumnSpecification, UnknownDataTypeException):
+            return None
+
+    def _get_schema(self, query: "exp.Query") -> "MappingSchema":
+        cte_names = {cte.alias_or_name for cte in query.find_all(exp.CTE)}
+        schema: Dict[str, Any] = {}
+        for table in query.find_all(exp.Table):
+            if not table.db and table.name in cte_names:
+                continue
+            known_table = self._known_tables.get((table.catalog, table.db, table.name))
+            if known_table is None:
+                raise UnsupportedSQLException(
+                    f"Schema of table {table.sql(DIALECT)} is not known offline"
+                )
+            schema.setdefault(table.catalog, {}).setdefault(table.db, {})[
+                table.name
+            ] = {field.name: _field_type_sql(field) for field in known_table.fields}
+        return MappingSchema(schema, dialect=DIALECT)
+
+    def _infer_table(self, sql: str) -> Table:
+        # sqlglot doesn't understand everything BigQuery does, so a query it can't parse or
+        # qualify is skipped rather than reported as a failure of the model
+        try:
+            statements = sqlglot.parse(sql, read=DIALECT)
+        except ParseError as e:
+            raise UnsupportedSQLException(f"sqlglot could not parse the query: {e}")
+        query = _get_query(statements)
+        schema = self._get_schema(query)
+        _alias_anonymous_columns(query)
+        try:
+            qualified = qualify(
+                query, dialect=DIALECT, schema=schema, validate_qualify_columns=False
+            )
+        except OptimizeError as e:
+            raise UnsupportedSQLException(f"sqlglot could not qualify the query: {e}")
+        _assert_columns_exist(qualified, _declared_variables(statements))
+        annotated = annotate_types(qualified, schema=schema, dialect=DIALECT)
+        _assert_types_are_certain(annotated)
+        if isinstance(annotated, exp.SetOperation):
+            column_types = _set_operation_types(annotated)
+        else:
+            column_types = [
+                projection.type or exp.DataType.build("UNKNOWN")
+                for projection in annotated.selects
+            ]
+        fields = [
+            _to_table_field(name, column_type)
+            for name, column_type in zip(_output_names(annotated), column_types)
+        ]
+        return Table(fields=fields)
+
+    def query(self, sql: str) -> QueryResult:
+        try:
+            return DryRunStatus.SUCCESS, self._infer_table(sql), None, None
+        except UnknownColumnException as e:
+            return DryRunStatus.FAILURE, None, e, None
+        except UnsupportedSQLException as e:
+            return DryRunStatus.SKIPPED, None, e, None
+        except Exception as e:
+            # Never report one of sqlglot's limitations as a failure of the model
+            unsupported = UnsupportedSQLException(
+                f"Could not infer schema offline: {e.__class__.__name__}: {e}"
+            )
+            return DryRunStatus.SKIPPED, None, unsupported, None
@@ -3,6 +3,7 @@ from typing import Generator
 import pytest
 
 from dbt_dry_run import flags
+from dbt_dry_run.metrics import REGISTRY, MetricsRegistry
 
 
 @pytest.fixture
@@ -10,3 +11,10 @@ def default_flags() -> Generator[flags.Flags, None, None]:
     flags.reset_flags()
     yield flags._DEFAULT_FLAGS
     flags.reset_flags()
+
+
+@pytest.fixture
+def metrics() -> Generator[MetricsRegistry, None, None]:
+    REGISTRY.reset()
+    yield REGISTRY
+    REGISTRY.reset()
@@ -0,0 +1,52 @@
+from dbt_dry_run.models import BigQueryFieldMode, BigQueryFieldType, Table, TableField
+from dbt_dry_run.models.frozen_schema import FrozenSchema
+
+
+def nested_table() -> Table:
+    return Table(
+        fields=[
+            TableField(name="a", type=BigQueryFieldType.STRING, description="A"),
+            TableField(
+                name="s",
+                type=BigQueryFieldType.RECORD,
+                fields=[
+                    TableField(
+                        name="x",
+                        type=BigQueryFieldType.INT64,
+                        mode=BigQueryFieldMode.REPEATED,
+                    )
+                ],
+            ),
+        ]
+    )
+
+
+def test_equal_tables_have_the_same_frozen_schema() -> None:
+    schema = FrozenSchema.from_table(nested_table())
+
+    assert FrozenSchema.from_table(nested_table()) is schema
+    assert FrozenSchema.from_table(schema.to_table()) is schema
+
+
+def test_frozen_schema_round_trips_to_table() -> None:
+    table = nested_table()
+
+    converted = FrozenSchema.from_table(table).to_table()
+
+    assert converted == table
+    assert Table.model_validate_json(converted.model_dump_json(by_alias=True)) == table
+
+
+def test_different_tables_have_different_frozen_schemas() -> None:
+    table = nested_table()
+    described = nested_table()
+    described.fields[1].description = "S"
+    empty_struct = Table(fields=[TableField(name="s", type=BigQueryFieldType.RECORD)])
+    empty_struct_fields = Table(
+        fields=[TableField(name="s", type=BigQueryFieldType.RECORD, fields=[])]
+    )
+
+    assert FrozenSchema.from_table(table) != FrozenSchema.from_table(described)
+    assert FrozenSchema.from_table(empty_struct) != FrozenSchema.from_table(
+        empty_struct_fields
+    )
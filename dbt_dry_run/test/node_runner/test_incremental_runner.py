@@ -3,8 +3,8 @@ from unittest.mock import MagicMock, call, patch
 
 from dbt_dry_run import flags
 from dbt_dry_run.exception import SchemaChangeException
-from dbt_dry_run.models import BigQueryFieldType, Table, TableField
-from dbt_dry_run.models.manifest import NodeConfig, PartitionBy
+from dbt_dry_run.models import BigQueryFieldType, QueryStatistics, Table, TableField
+from dbt_dry_run.models.manifest import NodeConfig, NodeMeta, PartitionBy
 from dbt_dry_run.models.report import DryRunStatus
 from dbt_dry_run.node_runner.incremental_runner import IncrementalRunner
 from dbt_dry_run.results import Results
@@ -48,7 +48,12 @@ def get_mock_sql_runner_with(
     model_schema: Table, target_schema: Optional[Table]
 ) -> MagicMock:
     mock_sql_runner = MagicMock()
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, model_schema, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        model_schema,
+        None,
+        None,
+    )
     mock_sql_runner.get_node_schema.return_value = target_schema
     return mock_sql_runner
 
@@ -62,6 +67,7 @@ def test_partitioned_incremental_model_declares_dbt_max_partition_variable() ->
         DryRunStatus.SUCCESS,
         A_SIMPLE_TABLE,
         None,
+        None,
     )
 
     node = SimpleNode(
@@ -101,6 +107,7 @@ def test_partitioned_incremental_model_does_not_add_partitiontime_column_when_fi
         DryRunStatus.SUCCESS,
         Table(fields=[TableField(name="a", type=BigQueryFieldType.STRING)]),
         None,
+        None,
     )
     mock_sql_runner.get_node_schema.return_value = None
 
@@ -472,6 +479,7 @@ def test_model_with_sql_header_executes_header_first() -> None:
         DryRunStatus.SUCCESS,
         A_SIMPLE_TABLE,
         None,
+        None,
     )
 
     pre_header_value = "DECLARE x INT64;"
@@ -490,3 +498,80 @@ def test_model_with_sql_header_executes_header_first() -> None:
     executed_sql = get_executed_sql(mock_sql_runner)
     assert executed_sql.startswith(pre_header_value)
     assert node.compiled_code in executed_sql
+
+
+def test_incremental_runner_needs_target_metadata_unless_full_refresh(
+    default_flags: flags.Flags,
+) -> None:
+    runner = IncrementalRunner(MagicMock(), Results())
+    incremental_node = SimpleNode(
+        unique_id="node1",
+        depends_on=[],
+        table_config=NodeConfig(materialized="incremental"),
+    ).to_node()
+    full_refresh_node = SimpleNode(
+        unique_id="node2",
+        depends_on=[],
+        table_config=NodeConfig(materialized="incremental", full_refresh=True),
+    ).to_node()
+
+    assert runner.needs_target_metadata(incremental_node)
+    assert not runner.needs_target_metadata(full_refresh_node)
+
+
+def test_incremental_model_dry_runs_full_refresh_sql_to_compare_bytes_processed() -> (
+    None
+):
+    mock_sql_runner = MagicMock()
+    mock_sql_runner.query.side_effect = [
+        (
+            DryRunStatus.SUCCESS,
+            A_SIMPLE_TABLE,
+            None,
+            QueryStatistics(total_bytes_processed=10),
+        ),
+        (
+            DryRunStatus.SUCCESS,
+            A_SIMPLE_TABLE,
+            None,
+            QueryStatistics(total_bytes_processed=1000),
+        ),
+    ]
+    mock_sql_runner.get_node_schema.return_value = None
+    node = SimpleNode(
+        unique_id="node1",
+        depends_on=[],
+        table_config=NodeConfig(materialized="incremental"),
+        compiled_code="SELECT * FROM `foo` WHERE d > (SELECT MAX(d) FROM `this`)",
+    ).to_node()
+    node.full_refresh_compiled_code = "SELECT * FROM `foo`"
+    node.depends_on.deep_nodes = []
+
+    result = IncrementalRunner(mock_sql_runner, Results()).run(node)
+
+    assert mock_sql_runner.query.call_args_list[1].args[0] == "SELECT * FROM `foo`"
+    assert result.statistics == QueryStatistics(
+        total_bytes_processed=10, full_refresh_bytes_processed=1000
+    )
+
+
+def test_incremental_model_can_opt_out_of_partition_pruning_check() -> None:
+    mock_sql_runner = get_mock_sql_runner_with(A_SIMPLE_TABLE, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        A_SIMPLE_TABLE,
+        None,
+        QueryStatistics(total_bytes_processed=10),
+    )
+    node = SimpleNode(
+        unique_id="node1",
+        depends_on=[],
+        table_config=NodeConfig(materialized="incremental"),
+        meta=NodeMeta({"dry_run.check_partition_pruning": False}),
+    ).to_node()
+    node.full_refresh_compiled_code = "SELECT * FROM `foo`"
+    node.depends_on.deep_nodes = []
+
+    IncrementalRunner(mock_sql_runner, Results()).run(node)
+
+    assert mock_sql_runner.query.call_count == 1
@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 from dbt_dry_run import flags
 from dbt_dry_run.exception import NotCompiledException
 from dbt_dry_run.flags import Flags
+from dbt_dry_run.models import BigQueryFieldType, Table, TableField
+from dbt_dry_run.models.manifest import NodeConfig
 from dbt_dry_run.models.report import DryRunStatus
 from dbt_dry_run.node_runner.incremental_runner import IncrementalRunner
 from dbt_dry_run.scheduler import ManifestScheduler
@@ -45,3 +48,48 @@ def test_validate_node_skips_if_skip_not_compiled_is_true(default_flags: Flags)
     assert validation_result
     assert validation_result.status == DryRunStatus.SKIPPED
     assert validation_result.exception is None
+
+
+def test_prefetched_target_schema_is_used_by_run(default_flags: Flags) -> None:
+    target_table = Table(fields=[TableField(name="a", type=BigQueryFieldType.STRING)])
+    mock_sql_runner = MagicMock()
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        target_table,
+        None,
+        None,
+    )
+    mock_sql_runner.get_node_schema.return_value = target_table
+    node = SimpleNode(
+        unique_id="node1",
+        depends_on=[],
+        table_config=NodeConfig(materialized="incremental"),
+    ).to_node()
+    node.depends_on.deep_nodes = []
+    model_runner = IncrementalRunner(mock_sql_runner, MagicMock())
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        model_runner.prefetch_target_metadata(node, executor)
+        executor.submit(lambda: None).result()
+        assert mock_sql_runner.get_node_schema.called, "Lookup should start before run"
+        result = model_runner.run(node)
+
+    assert result.status == DryRunStatus.SUCCESS
+    mock_sql_runner.get_node_schema.assert_called_once_with(node)
+
+
+def test_prefetch_target_metadata_skips_nodes_that_do_not_need_it(
+    default_flags: Flags,
+) -> None:
+    mock_sql_runner = MagicMock()
+    node = SimpleNode(
+        unique_id="node1",
+        depends_on=[],
+        table_config=NodeConfig(materialized="incremental", full_refresh=True),
+    ).to_node()
+    model_runner = IncrementalRunner(mock_sql_runner, MagicMock())
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        model_runner.prefetch_target_metadata(node, executor)
+
+    assert not mock_sql_runner.get_node_schema.called
@@ -1,12 +1,26 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Set
+from typing import Optional, Set, Tuple
 from unittest.mock import MagicMock
 
+from dbt.adapters.bigquery import BigQueryAdapter
+from pytest_mock import MockerFixture
+
+from dbt_dry_run import flags
 from dbt_dry_run.exception import UnknownSchemaException
+from dbt_dry_run.models import BigQueryFieldType
 from dbt_dry_run.models.dry_run_result import DryRunResult
 from dbt_dry_run.models.manifest import Node
 from dbt_dry_run.models.report import DryRunStatus
-from dbt_dry_run.node_runner.seed_runner import SeedRunner
+from dbt_dry_run.models.seed_schema_cache import SeedSchemaCache
+from dbt_dry_run.node_runner import seed_runner
+from dbt_dry_run.node_runner.seed_runner import (
+    SeedRunner,
+    load_seed_schema_cache,
+    save_seed_schema_cache,
+)
+from dbt_dry_run.results import Results
 from dbt_dry_run.scheduler import ManifestScheduler
 from dbt_dry_run.test.utils import SimpleNode
 
@@ -124,3 +138,138 @@ def test_validate_node_returns_none_if_node_is_not_compiled() -> None:
 
     validation_result = model_runner.check_node_compiled(node)
     assert validation_result is None
+
+
+def test_seed_runner_parses_large_seeds_in_process_pool(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(seed_runner, "PROCESS_POOL_MIN_BYTES", 0)
+    p = tmp_path / "seed1.csv"
+    p.write_text("a,b\n12,foo\n")
+    node = SimpleNode(
+        unique_id="node1",
+        depends_on=[],
+        resource_type=ManifestScheduler.SEED,
+        original_file_path=p.as_posix(),
+    ).to_node()
+    mock_sql_runner = MagicMock()
+    mock_sql_runner.convert_agate_type.side_effect = BigQueryAdapter.convert_agate_type
+    runner = SeedRunner(mock_sql_runner, MagicMock())
+
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        runner.use_process_pool(executor)
+        result = runner.run(node)
+
+    assert result.table
+    assert {field.name: field.type_ for field in result.table.fields} == {
+        "a": BigQueryFieldType.INT64,
+        "b": BigQueryFieldType.STRING,
+    }
+
+
+def _seed_node(path: Path) -> Node:
+    return SimpleNode(
+        unique_id="node1",
+        depends_on=[],
+        resource_type=ManifestScheduler.SEED,
+        original_file_path=path.as_posix(),
+    ).to_node()
+
+
+def _cached_run(
+    node: Node, cache: SeedSchemaCache
+) -> Tuple[DryRunResult, SeedSchemaCache, Results]:
+    mock_sql_runner = MagicMock()
+    mock_sql_runner.convert_agate_type.return_value = "string"
+    results = Results()
+    runner = SeedRunner(mock_sql_runner, results)
+    next_cache = runner.use_schema_cache(cache)
+    return runner.run(node), next_cache, results
+
+
+def test_seed_schema_cache_is_not_shared_between_runners(
+    tmp_path: Path, default_flags: flags.Flags
+) -> None:
+    p = tmp_path / "seed1.csv"
+    p.write_text("a,b\nfoo,bar\n")
+    mock_sql_runner = MagicMock()
+    mock_sql_runner.convert_agate_type.return_value = "string"
+    cached_runner = SeedRunner(mock_sql_runner, Results())
+    next_cache = cached_runner.use_schema_cache(SeedSchemaCache())
+
+    result = SeedRunner(mock_sql_runner, Results()).run(_seed_node(p))
+
+    assert result.status == DryRunStatus.SUCCESS
+    assert next_cache.schemas == {}
+
+
+def test_seed_runner_reuses_cached_schema_of_unchanged_seed(
+    tmp_path: Path, mocker: MockerFixture, default_flags: flags.Flags
+) -> None:
+    p = tmp_path / "seed1.csv"
+    p.write_text("a,b\nfoo,bar\n")
+    node = _seed_node(p)
+
+    first, cache, first_results = _cached_run(node, SeedSchemaCache())
+    infer = mocker.patch.object(seed_runner, "infer_seed_sample")
+    second, _, second_results = _cached_run(node, cache)
+
+    infer.assert_not_called()
+    assert second.table == first.table
+    assert first_results.statistics.seed_schema_cache_misses == 1
+    assert second_results.statistics.seed_schema_cache_hits == 1
+
+
+def test_seed_runner_parses_seed_again_if_content_or_config_changes(
+    tmp_path: Path, default_flags: flags.Flags
+) -> None:
+    p = tmp_path / "seed1.csv"
+    p.write_text("a,b\nfoo,bar\n")
+    node = _seed_node(p)
+    _, cache, _ = _cached_run(node, SeedSchemaCache())
+
+    p.write_text("a,b,c\nfoo,bar,baz\n")
+    changed_content, cache, results = _cached_run(node, cache)
+    assert results.statistics.seed_schema_cache_misses == 1
+    assert changed_content.table
+    assert [field.name for field in changed_content.table.fields] == ["a", "b", "c"]
+
+    node.config.column_types = {"a": "INT64"}
+    _, _, results = _cached_run(node, cache)
+    assert results.statistics.seed_schema_cache_misses == 1
+
+
+def test_seed_runner_only_hashes_seed_if_stat_changed_when_trusting_mtime(
+    tmp_path: Path, mocker: MockerFixture, default_flags: flags.Flags
+) -> None:
+    flags.set_flags(flags.Flags(seed_schema_cache_trust_mtime=True))
+    p = tmp_path / "seed1.csv"
+    p.write_text("a,b\nfoo,bar\n")
+    node = _seed_node(p)
+    _, cache, _ = _cached_run(node, SeedSchemaCache())
+
+    hash_file = mocker.spy(seed_runner, "hash_file")
+    _, _, results = _cached_run(node, cache)
+
+    hash_file.assert_not_called()
+    assert results.statistics.seed_schema_cache_hits == 1
+
+
+def test_seed_schema_cache_round_trips_and_ignores_bad_files(
+    tmp_path: Path, default_flags: flags.Flags
+) -> None:
+    p = tmp_path / "seed1.csv"
+    p.write_text("a,b\nfoo,bar\n")
+    _, cache, _ = _cached_run(_seed_node(p), SeedSchemaCache())
+    cache_path = (tmp_path / "cache.json").as_posix()
+
+    save_seed_schema_cache(cache, cache_path)
+    assert load_seed_schema_cache(cache_path) == cache
+
+    (tmp_path / "cache.json").write_text("not json")
+    assert load_seed_schema_cache(cache_path) == SeedSchemaCache()
+    assert load_seed_schema_cache((tmp_path / "missing.json").as_posix()) == (
+        SeedSchemaCache()
+    )
@@ -26,7 +26,12 @@ def test_snapshot_with_check_all_strategy_runs_sql_with_id() -> None:
             )
         ]
     )
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, expected_table, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        expected_table,
+        None,
+        None,
+    )
 
     node = SimpleNode(
         unique_id="node1",
@@ -61,7 +66,12 @@ def test_snapshot_with_hard_deletes_new_record_returns_all_meta_columns() -> Non
             )
         ]
     )
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, expected_table, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        expected_table,
+        None,
+        None,
+    )
 
     node = SimpleNode(
         unique_id="node1",
@@ -107,7 +117,12 @@ def test_snapshot_with_check_all_strategy_fails_without_id() -> None:
             )
         ]
     )
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, expected_table, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        expected_table,
+        None,
+        None,
+    )
 
     node = SimpleNode(
         unique_id="node1",
@@ -145,7 +160,12 @@ def test_snapshot_with_check_all_strategy_runs_sql_with_matching_columns() -> No
             ),
         ]
     )
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, expected_table, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        expected_table,
+        None,
+        None,
+    )
 
     node = SimpleNode(
         unique_id="node1",
@@ -183,7 +203,12 @@ def test_snapshot_with_check_cols_strategy_fails_with_missing_column() -> None:
             )
         ]
     )
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, expected_table, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        expected_table,
+        None,
+        None,
+    )
 
     node = SimpleNode(
         unique_id="node1",
@@ -218,7 +243,12 @@ def test_snapshot_with_timestamp_strategy_with_updated_at_column() -> None:
             TableField(name="last_updated_col", type=BigQueryFieldType.TIMESTAMP),
         ]
     )
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, expected_table, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        expected_table,
+        None,
+        None,
+    )
 
     node = SimpleNode(
         unique_id="node1",
@@ -253,7 +283,12 @@ def test_snapshot_with_timestamp_strategy_with_missing_updated_at_column() -> No
             TableField(name="last_updated_col", type=BigQueryFieldType.TIMESTAMP),
         ]
     )
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, expected_table, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        expected_table,
+        None,
+        None,
+    )
 
     node = SimpleNode(
         unique_id="node1",
@@ -292,7 +327,12 @@ def test_snapshot_with_list_of_unique_key_columns_raises_error() -> None:
             TableField(name="last_updated_col", type=BigQueryFieldType.TIMESTAMP),
         ]
     )
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, expected_table, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        expected_table,
+        None,
+        None,
+    )
 
     node = SimpleNode(
         unique_id="node1",
@@ -353,3 +393,23 @@ def test_validate_node_skips_if_skip_not_compiled_is_true(
     assert validation_result
     assert validation_result.status == DryRunStatus.SKIPPED
     assert validation_result.exception is None
+
+
+def test_snapshot_does_not_mutate_table_returned_by_sql_runner() -> None:
+    mock_sql_runner = MagicMock()
+    query_table = Table(fields=[TableField(name="a", type=BigQueryFieldType.STRING)])
+    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, query_table, None, None)
+    node = SimpleNode(
+        unique_id="node1",
+        depends_on=[],
+        resource_type=ManifestScheduler.SNAPSHOT,
+        table_config=NodeConfig(
+            unique_key="a", strategy="check", check_cols="all", materialized="snapshot"
+        ),
+    ).to_node()
+    node.depends_on.deep_nodes = []
+
+    result = SnapshotRunner(mock_sql_runner, Results()).run(node)
+
+    assert result.table and len(result.table.fields) > 1
+    assert [f.name for f in query_table.fields] == ["a"]
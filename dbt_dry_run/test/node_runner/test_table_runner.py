@@ -36,6 +36,7 @@ def test_model_with_no_dependencies_runs_sql() -> None:
         DryRunStatus.SUCCESS,
         expected_table,
         None,
+        None,
     )
 
     node = SimpleNode(
@@ -60,6 +61,7 @@ def test_model_with_failed_dependency_raises_upstream_failed_exception() -> None
         DryRunStatus.SUCCESS,
         A_SIMPLE_TABLE,
         None,
+        None,
     )
 
     upstream_simple_node = SimpleNode(unique_id="upstream", depends_on=[])
@@ -96,6 +98,7 @@ def test_model_with_dependency_inserts_sql_literal() -> None:
         DryRunStatus.SUCCESS,
         A_SIMPLE_TABLE,
         None,
+        None,
     )
 
     upstream_simple_node = SimpleNode(unique_id="upstream", depends_on=[])
@@ -137,6 +140,7 @@ def test_model_with_sql_header_executes_header_first() -> None:
         DryRunStatus.SUCCESS,
         A_SIMPLE_TABLE,
         None,
+        None,
     )
 
     pre_header_value = "DECLARE x INT64;"
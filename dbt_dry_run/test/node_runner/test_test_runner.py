@@ -1,13 +1,20 @@
 from unittest.mock import MagicMock
 
 from dbt_dry_run import flags
-from dbt_dry_run.exception import NotCompiledException
-from dbt_dry_run.models import BigQueryFieldType, Table, TableField
+from dbt_dry_run.exception import NotCompiledException, UpstreamFailedException
+from dbt_dry_run.models import BigQueryFieldMode, BigQueryFieldType, Table, TableField
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.manifest import GenericTestMetadata, Node
 from dbt_dry_run.models.report import DryRunStatus
-from dbt_dry_run.node_runner.node_test_runner import NodeTestRunner
+from dbt_dry_run.node_runner.node_test_runner import (
+    BATCH_COLUMN_PREFIX,
+    NodeTestRunner,
+    get_test_batch_sql,
+)
 from dbt_dry_run.results import Results
 from dbt_dry_run.scheduler import ManifestScheduler
 from dbt_dry_run.sql.literals import enable_test_example_values
+from dbt_dry_run.sql_runner import QueryResult
 from dbt_dry_run.test.utils import SimpleNode
 
 enable_test_example_values(True)
@@ -39,7 +46,12 @@ def test_test_runs_sql() -> None:
             )
         ]
     )
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, expected_table, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        expected_table,
+        None,
+        None,
+    )
 
     test_node = SimpleNode(
         unique_id="test1", depends_on=[], resource_type=ManifestScheduler.TEST
@@ -95,3 +107,159 @@ def test_validate_node_skips_if_skip_not_compiled_is_true(
     assert validation_result
     assert validation_result.status == DryRunStatus.SKIPPED
     assert validation_result.exception is None
+
+
+def _test_node(unique_id: str, compiled_code: str) -> Node:
+    node = SimpleNode(
+        unique_id=unique_id,
+        depends_on=[],
+        resource_type=ManifestScheduler.TEST,
+        compiled_code=compiled_code,
+    ).to_node()
+    node.depends_on.deep_nodes = []
+    return node
+
+
+def _batch_result(*tests: Table) -> QueryResult:
+    fields = [
+        TableField(
+            name=f"{BATCH_COLUMN_PREFIX}{index}",
+            type=BigQueryFieldType.RECORD,
+            mode=BigQueryFieldMode.REPEATED,
+            fields=test.fields,
+        )
+        for index, test in enumerate(tests)
+    ]
+    return DryRunStatus.SUCCESS, Table(fields=fields), None, None
+
+
+def test_run_batch_dry_runs_tests_in_one_query() -> None:
+    mock_sql_runner = MagicMock()
+    anonymous_table = Table(
+        fields=[TableField(name="_field_1", type=BigQueryFieldType.INTEGER)]
+    )
+    mock_sql_runner.query.return_value = _batch_result(A_SIMPLE_TABLE, anonymous_table)
+    nodes = [_test_node("test1", "SELECT a FROM t"), _test_node("test2", "SELECT 1;")]
+
+    results = NodeTestRunner(mock_sql_runner, Results()).run_batch(nodes)
+
+    assert get_executed_sql(mock_sql_runner) == get_test_batch_sql(
+        ["SELECT a FROM t", "SELECT 1;"]
+    )
+    assert [r.node.unique_id for r in results] == ["test1", "test2"]
+    assert all(r.status == DryRunStatus.SUCCESS for r in results)
+    assert results[0].table == A_SIMPLE_TABLE
+    assert results[1].table == Table(
+        fields=[TableField(name="f0_", type=BigQueryFieldType.INTEGER)]
+    )
+
+
+def test_run_batch_bisects_to_find_failing_tests() -> None:
+    mock_sql_runner = MagicMock()
+    bad_sql = "SELECT not_a_column FROM t"
+    error = Exception("Unrecognized name: not_a_column")
+
+    def query(sql: str) -> QueryResult:
+        if bad_sql in sql:
+            return DryRunStatus.FAILURE, None, error, None
+        if sql.startswith("SELECT\nARRAY("):
+            return _batch_result(*[A_SIMPLE_TABLE] * sql.count("ARRAY("))
+        return DryRunStatus.SUCCESS, A_SIMPLE_TABLE, None, None
+
+    mock_sql_runner.query.side_effect = query
+    nodes = [_test_node(f"test{i}", f"SELECT a FROM t{i}") for i in range(16)]
+    nodes[5] = _test_node("test5", bad_sql)
+
+    results = NodeTestRunner(mock_sql_runner, Results()).run_batch(nodes)
+
+    assert [r.status for r in results] == [DryRunStatus.SUCCESS] * 5 + [
+        DryRunStatus.FAILURE
+    ] + [DryRunStatus.SUCCESS] * 10
+    assert results[5].exception is error
+    # The failing test is dry run on its own exactly like an unbatched run
+    mock_sql_runner.query.assert_any_call(bad_sql)
+    # One query for the whole batch then two for each of the four halvings
+    assert mock_sql_runner.query.call_count == 9
+
+
+def test_run_batch_fails_tests_with_failed_upstreams() -> None:
+    mock_sql_runner = MagicMock()
+    mock_sql_runner.query.return_value = _batch_result(A_SIMPLE_TABLE)
+    upstream = SimpleNode(unique_id="upstream", depends_on=[]).to_node()
+    upstream_results = Results()
+    upstream_results.add_result(
+        "upstream", DryRunResult(upstream, None, DryRunStatus.FAILURE, None)
+    )
+    failing = _test_node("failing", "SELECT 1")
+    failing.depends_on.deep_nodes = ["upstream"]
+
+    results = NodeTestRunner(mock_sql_runner, upstream_results).run_batch(
+        [failing, _test_node("passing", "SELECT a FROM t")]
+    )
+
+    assert results[0].status == DryRunStatus.FAILURE
+    assert isinstance(results[0].exception, UpstreamFailedException)
+    assert results[1].status == DryRunStatus.SUCCESS
+    mock_sql_runner.query.assert_called_once_with("SELECT a FROM t")
+
+
+def _not_null_test(column_name: str) -> Node:
+    node = _test_node("not_null_model_a", "SELECT * FROM model WHERE a IS NULL")
+    node.depends_on.nodes = ["model"]
+    node.depends_on.deep_nodes = ["model"]
+    node.attached_node = "model"
+    node.column_name = column_name
+    node.test_metadata = GenericTestMetadata(
+        name="not_null", kwargs={"column_name": column_name}
+    )
+    return node
+
+
+def _results_with_model(status: DryRunStatus) -> Results:
+    results = Results()
+    model = SimpleNode(unique_id="model", depends_on=[]).to_node()
+    results.add_result("model", DryRunResult(model, A_SIMPLE_TABLE, status, None))
+    return results
+
+
+def test_generic_test_is_validated_without_dry_run(
+    default_flags: flags.Flags,
+) -> None:
+    flags.set_flags(flags.Flags(local_generic_tests=True))
+    mock_sql_runner = MagicMock()
+    runner = NodeTestRunner(mock_sql_runner, _results_with_model(DryRunStatus.SUCCESS))
+
+    passing = runner.run(_not_null_test("a"))
+    failing = runner.run(_not_null_test("b"))
+
+    assert passing.status == DryRunStatus.SUCCESS
+    assert failing.status == DryRunStatus.FAILURE
+    mock_sql_runner.query.assert_not_called()
+
+
+def test_generic_test_of_failed_model_fails_upstream(
+    default_flags: flags.Flags,
+) -> None:
+    flags.set_flags(flags.Flags(local_generic_tests=True))
+    runner = NodeTestRunner(MagicMock(), _results_with_model(DryRunStatus.FAILURE))
+
+    result = runner.run(_not_null_test("a"))
+
+    assert isinstance(result.exception, UpstreamFailedException)
+
+
+def test_generic_test_is_dry_run_by_default(
+    default_flags: flags.Flags,
+) -> None:
+    mock_sql_runner = MagicMock()
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        A_SIMPLE_TABLE,
+        None,
+        None,
+    )
+    runner = NodeTestRunner(mock_sql_runner, _results_with_model(DryRunStatus.SUCCESS))
+
+    runner.run(_not_null_test("a"))
+
+    mock_sql_runner.query.assert_called_once()
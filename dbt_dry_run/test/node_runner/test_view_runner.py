@@ -38,7 +38,12 @@ def test_model_with_no_dependencies_runs_sql() -> None:
             )
         ]
     )
-    mock_sql_runner.query.return_value = (DryRunStatus.SUCCESS, expected_table, None)
+    mock_sql_runner.query.return_value = (
+        DryRunStatus.SUCCESS,
+        expected_table,
+        None,
+        None,
+    )
 
     node = SimpleNode(
         unique_id="node1", depends_on=[], resource_type=ManifestScheduler.SEED
@@ -64,6 +69,7 @@ def test_model_as_view_runs_create_view() -> None:
         DryRunStatus.SUCCESS,
         A_SIMPLE_TABLE,
         None,
+        None,
     )
 
     node = SimpleNode(
@@ -88,6 +94,7 @@ def test_model_with_failed_dependency_raises_upstream_failed_exception() -> None
         DryRunStatus.SUCCESS,
         A_SIMPLE_TABLE,
         None,
+        None,
     )
 
     upstream_simple_node = SimpleNode(unique_id="upstream", depends_on=[])
@@ -124,6 +131,7 @@ def test_model_with_dependency_inserts_sql_literal() -> None:
         DryRunStatus.SUCCESS,
         A_SIMPLE_TABLE,
         None,
+        None,
     )
 
     upstream_simple_node = SimpleNode(unique_id="upstream", depends_on=[])
@@ -167,6 +175,7 @@ def test_model_with_sql_header_executes_header_first() -> None:
         DryRunStatus.SUCCESS,
         A_SIMPLE_TABLE,
         None,
+        None,
     )
 
     pre_header_value = "DECLARE x INT64;"
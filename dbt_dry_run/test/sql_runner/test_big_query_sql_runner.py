@@ -1,19 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 from unittest.mock import MagicMock
 
 import pytest
-from google.api_core.exceptions import BadRequest
+import requests.exceptions
+from google.api_core.exceptions import (
+    BadRequest,
+    Forbidden,
+    InternalServerError,
+    ServiceUnavailable,
+    TooManyRequests,
+)
 from google.cloud.bigquery import DatasetReference, SchemaField, Table, TableReference
 from google.cloud.exceptions import NotFound
-from tenacity import RetryError, wait_none
 
 from dbt_dry_run.adapter.service import ProjectService
-from dbt_dry_run.exception import UnknownSchemaException
-from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.exception import RetryableException, UnknownSchemaException
+from dbt_dry_run.metrics import (
+    BIGQUERY_CLIENTS,
+    BIGQUERY_REQUEST_DURATION,
+    BIGQUERY_RETRYABLE_ERRORS,
+    BIGQUERY_THROTTLED,
+    MetricsRegistry,
+)
+from dbt_dry_run.models import QueryStatistics
+from dbt_dry_run.models import Table as TableModel
+from dbt_dry_run.models.report import DryRunStatus, RunStatistics
 from dbt_dry_run.sql_runner.big_query_sql_runner import (
-    MAX_ATTEMPT_NUMBER,
     QUERY_TIMED_OUT,
     BigQuerySQLRunner,
+    is_retryable_error,
 )
 from dbt_dry_run.test.utils import SimpleNode
 
@@ -23,8 +39,10 @@ class MockProject:
         self._connection_mock = MagicMock()
         self.mock_client = MagicMock()
         self._connection_mock.handle = self.mock_client
+        self.get_connection_calls = 0
 
     def get_connection(self) -> MagicMock:
+        self.get_connection_calls += 1
         return self._connection_mock
 
     def assert_query_called_with_sql(self, sql: str, num_calls: int = 1) -> None:
@@ -32,20 +50,123 @@ class MockProject:
         assert all(call.args[0] == sql for call in self.mock_client.query.mock_calls)
 
 
-def test_timeout_query_retries() -> None:
+def test_timeout_query_raises_retryable_exception() -> None:
     mock_project = MockProject()
     bad_request: BadRequest = BadRequest(message=QUERY_TIMED_OUT)
     mock_project.mock_client.query.side_effect = bad_request
     sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
 
-    # Disable wait to make test run faster
-    sql_runner.query.retry.wait = wait_none()  # type: ignore
-
     expected_sql = "SELECT * FROM foo"
-    with pytest.raises(RetryError):
+    with pytest.raises(RetryableException) as exc_info:
         sql_runner.query(expected_sql)
 
-    mock_project.assert_query_called_with_sql(expected_sql, MAX_ATTEMPT_NUMBER)
+    assert exc_info.value.exception is bad_request
+    mock_project.assert_query_called_with_sql(expected_sql)
+
+
+@pytest.mark.parametrize(
+    "exception, expected_retryable",
+    [
+        (BadRequest("bad", errors=[{"reason": "invalidQuery"}]), False),
+        (NotFound("missing", errors=[{"reason": "notFound"}]), False),
+        (Forbidden("denied", errors=[{"reason": "accessDenied"}]), False),
+        (Forbidden("slow down", errors=[{"reason": "rateLimitExceeded"}]), True),
+        (BadRequest("oops", errors=[{"reason": "backendError"}]), True),
+        (BadRequest(QUERY_TIMED_OUT), True),
+        (InternalServerError("oops"), True),
+        (ServiceUnavailable("oops"), True),
+        (TooManyRequests("slow down"), True),
+        (ConnectionError("reset"), True),
+        (BadRequest("bad"), False),
+        (ValueError("bug"), False),
+    ],
+)
+def test_is_retryable_error(exception: Exception, expected_retryable: bool) -> None:
+    assert is_retryable_error(exception) is expected_retryable
+
+
+def test_transient_query_error_raises_retryable_exception() -> None:
+    mock_project = MockProject()
+    raised_exception = ServiceUnavailable("oops")
+    mock_project.mock_client.query.side_effect = raised_exception
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+
+    with pytest.raises(RetryableException):
+        sql_runner.query("SELECT * FROM foo")
+
+
+@pytest.mark.parametrize(
+    "exception, expected_throttled",
+    [
+        (TooManyRequests("slow down"), 1),
+        (Forbidden("slow down", errors=[{"reason": "rateLimitExceeded"}]), 1),
+        (ServiceUnavailable("oops"), 0),
+    ],
+)
+def test_transient_query_error_is_counted(
+    metrics: MetricsRegistry, exception: Exception, expected_throttled: int
+) -> None:
+    mock_project = MockProject()
+    mock_project.mock_client.query.side_effect = exception
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+
+    with pytest.raises(RetryableException):
+        sql_runner.query("SELECT * FROM foo")
+
+    assert BIGQUERY_RETRYABLE_ERRORS.value(call="query") == 1
+    assert BIGQUERY_THROTTLED.value(call="query") == expected_throttled
+    assert BIGQUERY_REQUEST_DURATION.count(call="query") == 1
+
+
+def test_transient_get_node_schema_error_raises_retryable_exception() -> None:
+    mock_project = MockProject()
+    mock_project.mock_client.get_table.side_effect = InternalServerError("oops")
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+    node = SimpleNode(unique_id="a", depends_on=[]).to_node()
+
+    with pytest.raises(RetryableException):
+        sql_runner.get_node_schema(node)
+
+
+def test_query_disables_client_retries() -> None:
+    mock_project = MockProject()
+    mock_project.mock_client.query.return_value.schema = []
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+
+    sql_runner.query("SELECT 1")
+
+    mock_project.mock_client.query.assert_called_once()
+    call = mock_project.mock_client.query.call_args
+    assert call.kwargs["retry"] is None
+    assert call.kwargs["job_retry"] is None
+
+
+def test_get_node_schema_disables_client_retries() -> None:
+    mock_project = MockProject()
+    mock_project.mock_client.get_table.side_effect = NotFound("not_found")
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+
+    sql_runner.get_node_schema(SimpleNode(unique_id="a", depends_on=[]).to_node())
+
+    mock_project.mock_client.get_table.assert_called_once()
+    assert mock_project.mock_client.get_table.call_args.kwargs["retry"] is None
+
+
+def test_prefetch_node_schemas_disables_client_retries() -> None:
+    mock_project = MockProject()
+    query_job = mock_project.mock_client.query.return_value
+    query_job.result.return_value = []
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+    node = SimpleNode(unique_id="a", depends_on=[]).to_node()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sql_runner.prefetch_node_schemas([node], executor)
+
+    mock_project.mock_client.query.assert_called_once()
+    call = mock_project.mock_client.query.call_args
+    assert call.kwargs["retry"] is None
+    assert call.kwargs["job_retry"] is None
+    query_job.result.assert_called_once_with(retry=None, job_retry=None)
 
 
 def test_error_query_does_not_retry() -> None:
@@ -55,7 +176,7 @@ def test_error_query_does_not_retry() -> None:
     sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
 
     expected_sql = "SELECT * FROM foo"
-    status, _, exc = sql_runner.query(expected_sql)
+    status, _, exc, _ = sql_runner.query(expected_sql)
 
     assert status == DryRunStatus.FAILURE
     assert exc is raised_exception
@@ -114,3 +235,156 @@ def test_get_schema_from_schema_fields_raises_error_if_unknown_field_type() -> N
         BigQuerySQLRunner.get_schema_from_schema_fields(
             [SchemaField(name=invalid_field_name, field_type=invalid_field_type)]
         )
+
+
+_NESTED_SCHEMA = [
+    SchemaField("a", "INT64", description="An integer"),
+    SchemaField(
+        "b",
+        "RECORD",
+        mode="REPEATED",
+        fields=[
+            SchemaField("c", "string"),
+            SchemaField("d", "RECORD", fields=[SchemaField("e", "TIMESTAMP")]),
+        ],
+    ),
+]
+
+
+def test_get_schema_from_schema_fields_matches_validated_schema() -> None:
+    table = BigQuerySQLRunner.get_schema_from_schema_fields(_NESTED_SCHEMA)
+
+    assert table == BigQuerySQLRunner._validate_schema_fields(_NESTED_SCHEMA)
+    assert table.model_dump(by_alias=True) == BigQuerySQLRunner._validate_schema_fields(
+        _NESTED_SCHEMA
+    ).model_dump(by_alias=True)
+
+
+def test_get_schema_from_schema_fields_raises_error_if_unknown_nested_field_mode() -> (
+    None
+):
+    schema = [
+        SchemaField(
+            "a", "RECORD", fields=[SchemaField("b", "STRING", mode="SOMETIMES")]
+        )
+    ]
+    with pytest.raises(UnknownSchemaException, match="'b'"):
+        BigQuerySQLRunner.get_schema_from_schema_fields(schema)
+
+
+def test_map_fields_gives_leaf_fields_an_empty_list() -> None:
+    fields = TableModel.map_fields(_NESTED_SCHEMA)
+
+    assert fields[0].fields == []
+    assert fields[1].fields is not None
+    assert fields[1].fields[0].fields == []
+
+
+def test_get_client_reuses_client_within_a_thread() -> None:
+    mock_project = MockProject()
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+
+    first_client = sql_runner.get_client()
+    second_client = sql_runner.get_client()
+
+    assert first_client is second_client
+    assert mock_project.get_connection_calls == 1
+
+
+def test_get_client_opens_one_client_per_thread(metrics: MetricsRegistry) -> None:
+    mock_project = MockProject()
+    mock_project.get_connection = MagicMock(  # type: ignore
+        side_effect=lambda: MagicMock(handle=MagicMock())
+    )
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+    thread_count = 4
+
+    def get_clients(_: int) -> int:
+        return len({id(sql_runner.get_client()) for _ in range(3)})
+
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        clients_per_call = list(executor.map(get_clients, range(thread_count)))
+
+    assert clients_per_call == [1] * thread_count
+    statistics = RunStatistics()
+    sql_runner.update_statistics(statistics)
+    assert statistics.bigquery_clients_created == mock_project.get_connection.call_count
+    assert statistics.bigquery_client_acquisitions == thread_count * 3
+    assert statistics.bigquery_client_acquisition_seconds >= 0
+    assert BIGQUERY_CLIENTS.value() == mock_project.get_connection.call_count
+
+
+def test_prefetch_node_schemas_answers_from_memory() -> None:
+    mock_project = MockProject()
+    existing = SimpleNode(unique_id="existing", depends_on=[]).to_node()
+    missing = SimpleNode(unique_id="missing", depends_on=[]).to_node()
+    mock_project.mock_client.query.return_value.result.return_value = [
+        {
+            "table_name": "existing",
+            "field_path": "a",
+            "data_type": "INT64",
+            "description": None,
+            "ordinal_position": 1,
+            "is_nullable": "YES",
+        }
+    ]
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sql_runner.prefetch_node_schemas([existing, missing], executor)
+
+    table = sql_runner.get_node_schema(existing)
+    assert table is not None
+    assert table.field_names == {"a"}
+    assert not sql_runner.node_exists(missing)
+    assert mock_project.mock_client.query.call_count == 1
+    assert not mock_project.mock_client.get_table.called
+
+
+def test_prefetch_node_schemas_falls_back_to_get_table_on_error() -> None:
+    mock_project = MockProject()
+    node = SimpleNode(unique_id="a", depends_on=[]).to_node()
+    mock_project.mock_client.query.side_effect = Forbidden("no access")
+    mock_project.mock_client.get_table.side_effect = NotFound("not_found")
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sql_runner.prefetch_node_schemas([node], executor)
+
+    assert sql_runner.get_node_schema(node) is None
+    assert len(mock_project.mock_client.get_table.mock_calls) == 1
+
+
+def test_prefetch_node_schemas_falls_back_to_get_table_on_transport_error() -> None:
+    mock_project = MockProject()
+    node = SimpleNode(unique_id="a", depends_on=[]).to_node()
+    mock_project.mock_client.query.side_effect = requests.exceptions.ConnectionError(
+        "Connection reset by peer"
+    )
+    mock_project.mock_client.get_table.side_effect = NotFound("not_found")
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sql_runner.prefetch_node_schemas([node], executor)
+
+    assert sql_runner.get_node_schema(node) is None
+    assert len(mock_project.mock_client.get_table.mock_calls) == 1
+
+
+def test_query_returns_job_statistics() -> None:
+    mock_project = MockProject()
+    query_job = mock_project.mock_client.query.return_value
+    query_job.schema = [SchemaField(name="a", field_type="STRING")]
+    query_job.total_bytes_processed = 1024
+    query_job.referenced_tables = [
+        TableReference(DatasetReference("my-project", "my_dataset"), "my_table")
+    ]
+    sql_runner = BigQuerySQLRunner(cast(ProjectService, mock_project))
+
+    status, _, _, statistics = sql_runner.query("SELECT a FROM my_table")
+
+    assert status == DryRunStatus.SUCCESS
+    assert statistics == QueryStatistics(
+        total_bytes_processed=1024,
+        referenced_tables=["my-project.my_dataset.my_table"],
+    )
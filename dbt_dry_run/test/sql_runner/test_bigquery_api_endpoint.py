@@ -0,0 +1,109 @@
+from typing import Generator, cast
+from unittest.mock import MagicMock
+
+import pytest
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.bigquery import Client
+
+from benchmarks.fake_bigquery import FakeBigQueryConfig, FakeBigQueryServer
+from dbt_dry_run import flags
+from dbt_dry_run.adapter.service import ProjectService
+from dbt_dry_run.exception import RetryableException
+from dbt_dry_run.models import BigQueryFieldMode, BigQueryFieldType, Table
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.sql_runner.big_query_sql_runner import BigQuerySQLRunner
+from dbt_dry_run.test.utils import SimpleNode, field_with_name
+
+EXISTING_TABLE_FIELDS = [{"name": "id", "type": "INTEGER", "mode": "REQUIRED"}]
+
+
+def _start_server(config: FakeBigQueryConfig) -> FakeBigQueryServer:
+    config.tables = {"my_db.my_schema.existing": EXISTING_TABLE_FIELDS}
+    return FakeBigQueryServer(config).start()
+
+
+def _sql_runner(server: FakeBigQueryServer) -> BigQuerySQLRunner:
+    flags.set_flags(flags.Flags(bigquery_api_endpoint=server.endpoint))
+    project = MagicMock()
+    project.get_connection.return_value.handle = Client(
+        project="my_db", credentials=AnonymousCredentials()
+    )
+    return BigQuerySQLRunner(cast(ProjectService, project))
+
+
+@pytest.fixture
+def server(default_flags: flags.Flags) -> Generator[FakeBigQueryServer, None, None]:
+    server = _start_server(FakeBigQueryConfig())
+    yield server
+    server.stop()
+
+
+def test_query_uses_overridden_endpoint(server: FakeBigQueryServer) -> None:
+    sql_runner = _sql_runner(server)
+
+    status, table, exception, _ = sql_runner.query("SELECT 'a' AS a")
+
+    assert status == DryRunStatus.SUCCESS, exception
+    assert table == Table(fields=[field_with_name("a", BigQueryFieldType.STRING)])
+    assert server.stats.dry_run_queries == 1
+
+
+def test_get_node_schema_uses_overridden_endpoint(server: FakeBigQueryServer) -> None:
+    sql_runner = _sql_runner(server)
+    existing = SimpleNode(unique_id="existing", depends_on=[]).to_node()
+    missing = SimpleNode(unique_id="missing", depends_on=[]).to_node()
+
+    existing_table = sql_runner.get_node_schema(existing)
+
+    assert existing_table is not None
+    assert [(f.name, f.type_, f.mode) for f in existing_table.fields] == [
+        ("id", BigQueryFieldType.INTEGER, BigQueryFieldMode.REQUIRED)
+    ]
+    assert sql_runner.get_node_schema(missing) is None
+    assert server.stats.table_lookups == 2
+
+
+def test_injected_backend_error_is_retryable_without_client_retries(
+    default_flags: flags.Flags,
+) -> None:
+    config = FakeBigQueryConfig(error_rate=1.0, error_reason="backendError")
+    with _start_server(config) as server:
+        with pytest.raises(RetryableException):
+            _sql_runner(server).query("SELECT 1")
+
+    assert server.stats.requests == 1
+    assert server.stats.injected_errors == 1
+
+
+def test_query_statistics_are_parsed_from_response(
+    default_flags: flags.Flags,
+) -> None:
+    with _start_server(FakeBigQueryConfig(total_bytes_processed=2048)) as server:
+        _, _, _, statistics = _sql_runner(server).query("SELECT 1")
+
+    assert statistics is not None
+    assert statistics.total_bytes_processed == 2048
+
+
+def test_requests_over_quota_are_rate_limited(default_flags: flags.Flags) -> None:
+    config = FakeBigQueryConfig(queries_per_second=1)
+    with _start_server(config) as server:
+        sql_runner = _sql_runner(server)
+        status, _, _, _ = sql_runner.query("SELECT 1")
+
+        with pytest.raises(RetryableException) as exc_info:
+            sql_runner.query("SELECT 1")
+
+    assert status == DryRunStatus.SUCCESS
+    assert "rateLimitExceeded" in str(exc_info.value.exception.errors)  # type: ignore[attr-defined]
+    assert server.stats.throttled == 1
+
+
+def test_injected_invalid_query_fails(default_flags: flags.Flags) -> None:
+    config = FakeBigQueryConfig(error_rate=1.0, error_reason="invalidQuery")
+    with _start_server(config) as server:
+        status, table, exception, _ = _sql_runner(server).query("SELECT 1")
+
+    assert status == DryRunStatus.FAILURE
+    assert table is None
+    assert "invalidQuery" in str(exception.errors)  # type: ignore[union-attr]
@@ -0,0 +1,92 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from google.cloud.exceptions import BadRequest
+
+from dbt_dry_run.exception import CassetteMissException, RetryableException
+from dbt_dry_run.models import BigQueryFieldType, Table
+from dbt_dry_run.models.cassette import Cassette
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.sql.literals import get_sql_literal_from_table, sql_key
+from dbt_dry_run.sql_runner.cassette_sql_runner import (
+    RecordingSQLRunner,
+    ReplaySQLRunner,
+    load_cassette,
+    save_cassette,
+)
+from dbt_dry_run.test.utils import SimpleNode, field_with_name
+
+A_TABLE = Table(fields=[field_with_name("a", BigQueryFieldType.STRING)])
+
+
+def test_sql_key_ignores_generated_uuids_and_whitespace() -> None:
+    first = f"SELECT a FROM {get_sql_literal_from_table(A_TABLE)}"
+    second = f"  SELECT  a FROM\t{get_sql_literal_from_table(A_TABLE)}\n\n"
+
+    assert first != second
+    assert sql_key(first) == sql_key(second)
+    assert sql_key(first) != sql_key("SELECT b FROM foo")
+
+
+def test_sql_key_keeps_line_breaks_that_end_comments() -> None:
+    commented_out = "SELECT a -- , b\nFROM foo"
+    commented = "SELECT a -- ,\nb FROM foo"
+
+    assert sql_key(commented_out) != sql_key(commented)
+    assert sql_key(commented) == sql_key("SELECT a -- ,\r\n  b  FROM foo")
+
+
+def test_recorded_run_can_be_replayed(tmp_path: Path) -> None:
+    existing_node = SimpleNode(unique_id="existing", depends_on=[]).to_node()
+    missing_node = SimpleNode(unique_id="missing", depends_on=[]).to_node()
+    inner = MagicMock()
+    inner.query.side_effect = [
+        (DryRunStatus.SUCCESS, A_TABLE, None, None),
+        (DryRunStatus.FAILURE, None, BadRequest("Unrecognized name: b"), None),
+    ]
+    inner.get_node_schema.side_effect = lambda node: (
+        A_TABLE if node.unique_id == "existing" else None
+    )
+    cassette = Cassette()
+    recorder = RecordingSQLRunner(inner, cassette)
+
+    recorded_success = recorder.query("SELECT a FROM foo")
+    recorded_failure = recorder.query("SELECT b FROM foo")
+    recorder.get_node_schema(existing_node)
+    recorder.get_node_schema(missing_node)
+    cassette_path = str(tmp_path / "cassette.json")
+    save_cassette(cassette, cassette_path)
+
+    replay = ReplaySQLRunner(MagicMock(), load_cassette(cassette_path))
+
+    assert replay.query("SELECT a  FROM foo") == recorded_success
+    status, table, exception, _ = replay.query("SELECT b FROM foo")
+    assert (status, table) == recorded_failure[:2]
+    assert exception.__class__.__name__ == "BadRequest"
+    assert str(exception) == str(recorded_failure[2])
+    assert replay.get_node_schema(existing_node) == A_TABLE
+    assert replay.get_node_schema(missing_node) is None
+    assert not replay.node_exists(missing_node)
+
+
+def test_replay_fails_queries_missing_from_cassette() -> None:
+    replay = ReplaySQLRunner(MagicMock(), Cassette())
+
+    status, table, exception, _ = replay.query("SELECT 1")
+
+    assert status == DryRunStatus.FAILURE
+    assert table is None
+    assert isinstance(exception, CassetteMissException)
+
+
+def test_recording_does_not_record_retryable_errors() -> None:
+    inner = MagicMock()
+    inner.query.side_effect = RetryableException(Exception("rate limited"))
+    cassette = Cassette()
+    recorder = RecordingSQLRunner(inner, cassette)
+
+    with pytest.raises(RetryableException):
+        recorder.query("SELECT 1")
+
+    assert cassette.queries == {}
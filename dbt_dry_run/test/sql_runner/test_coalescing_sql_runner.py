@@ -0,0 +1,108 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from dbt_dry_run.exception import RetryableException
+from dbt_dry_run.models import BigQueryFieldType, Table
+from dbt_dry_run.models.manifest import Node
+from dbt_dry_run.models.report import DryRunStatus, RunStatistics
+from dbt_dry_run.sql_runner import QueryResult
+from dbt_dry_run.sql_runner.coalescing_sql_runner import CoalescingSQLRunner
+from dbt_dry_run.test.utils import SimpleNode, field_with_name
+
+A_TABLE = Table(fields=[field_with_name("a", BigQueryFieldType.STRING)])
+CONCURRENT_CALLERS = 8
+
+
+def _blocking_query(
+    release: threading.Event,
+) -> Tuple[MagicMock, "threading.Event"]:
+    started = threading.Event()
+    inner = MagicMock()
+
+    def query(sql: str) -> QueryResult:
+        started.set()
+        release.wait()
+        return DryRunStatus.SUCCESS, A_TABLE, None, None
+
+    inner.query.side_effect = query
+    return inner, started
+
+
+def test_concurrent_identical_queries_share_one_call() -> None:
+    release = threading.Event()
+    inner, started = _blocking_query(release)
+    sql_runner = CoalescingSQLRunner(inner)
+
+    with ThreadPoolExecutor(max_workers=CONCURRENT_CALLERS) as executor:
+        futures = [
+            executor.submit(sql_runner.query, "SELECT 1")
+            for _ in range(CONCURRENT_CALLERS)
+        ]
+        started.wait()
+        while sql_runner._queries.coalesced < CONCURRENT_CALLERS - 1:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert inner.query.call_count == 1
+    assert all(r == (DryRunStatus.SUCCESS, A_TABLE, None, None) for r in results)
+    statistics = RunStatistics()
+    sql_runner.update_statistics(statistics)
+    assert statistics.coalesced_queries == CONCURRENT_CALLERS - 1
+    assert statistics.cached_queries == 0
+
+
+def test_completed_queries_are_answered_from_memory() -> None:
+    inner = MagicMock()
+    inner.query.return_value = (DryRunStatus.SUCCESS, A_TABLE, None, None)
+    sql_runner = CoalescingSQLRunner(inner)
+
+    first = sql_runner.query("SELECT 'aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa' AS a")
+    second = sql_runner.query("SELECT 'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb' AS a")
+    different = sql_runner.query("SELECT 2")
+
+    assert first == second == different
+    assert inner.query.call_count == 2
+    statistics = RunStatistics()
+    sql_runner.update_statistics(statistics)
+    assert statistics.cached_queries == 1
+
+
+def test_retryable_errors_are_not_cached() -> None:
+    inner = MagicMock()
+    inner.query.side_effect = [
+        RetryableException(Exception("rate limited")),
+        (DryRunStatus.SUCCESS, A_TABLE, None, None),
+    ]
+    sql_runner = CoalescingSQLRunner(inner)
+
+    with pytest.raises(RetryableException):
+        sql_runner.query("SELECT 1")
+
+    assert sql_runner.query("SELECT 1") == (
+        DryRunStatus.SUCCESS,
+        A_TABLE,
+        None,
+        None,
+    )
+    assert inner.query.call_count == 2
+
+
+def test_schema_lookups_are_shared_per_table() -> None:
+    inner = MagicMock()
+    inner.get_node_schema.return_value = A_TABLE
+    sql_runner = CoalescingSQLRunner(inner)
+    node: Node = SimpleNode(unique_id="a", depends_on=[]).to_node()
+    same_table = node.model_copy(update={"unique_id": "other"})
+
+    assert sql_runner.get_node_schema(node) is A_TABLE
+    assert sql_runner.get_node_schema(same_table) is A_TABLE
+    assert sql_runner.node_exists(node)
+    assert inner.get_node_schema.call_count == 1
+    statistics = RunStatistics()
+    sql_runner.update_statistics(statistics)
+    assert statistics.cached_schema_lookups == 2
@@ -0,0 +1,137 @@
+from typing import Any, Dict, Optional
+
+import pytest
+
+from dbt_dry_run.models import BigQueryFieldMode, BigQueryFieldType, Table, TableField
+from dbt_dry_run.sql_runner.information_schema import (
+    DataTypeParseError,
+    parse_data_type,
+    tables_from_column_field_paths,
+)
+
+
+def _row(
+    table_name: str,
+    field_path: str,
+    data_type: str,
+    ordinal_position: Optional[int] = None,
+    is_nullable: Optional[str] = None,
+    description: Optional[str] = None,
+) -> Dict[str, Any]:
+    return {
+        "table_name": table_name,
+        "field_path": field_path,
+        "data_type": data_type,
+        "description": description,
+        "ordinal_position": ordinal_position,
+        "is_nullable": is_nullable,
+    }
+
+
+@pytest.mark.parametrize(
+    "data_type, expected_type",
+    [
+        ("INT64", BigQueryFieldType.INTEGER),
+        ("FLOAT64", BigQueryFieldType.FLOAT),
+        ("BOOL", BigQueryFieldType.BOOLEAN),
+        ("STRING(10)", BigQueryFieldType.STRING),
+        ("NUMERIC(10, 2)", BigQueryFieldType.NUMERIC),
+        ("RANGE<DATE>", BigQueryFieldType.RANGE),
+        ("TIMESTAMP", BigQueryFieldType.TIMESTAMP),
+    ],
+)
+def test_parse_data_type_maps_to_legacy_type_names(
+    data_type: str, expected_type: BigQueryFieldType
+) -> None:
+    field = parse_data_type("a", data_type)
+    assert field == TableField(
+        name="a", type=expected_type, mode=BigQueryFieldMode.NULLABLE
+    )
+
+
+def test_parse_data_type_parses_nested_repeated_structs() -> None:
+    field = parse_data_type(
+        "a", "ARRAY<STRUCT<b INT64 NOT NULL, `c` ARRAY<STRING>, d STRUCT<e DATE>>>"
+    )
+
+    assert field == TableField(
+        name="a",
+        type=BigQueryFieldType.RECORD,
+        mode=BigQueryFieldMode.REPEATED,
+        fields=[
+            TableField(
+                name="b",
+                type=BigQueryFieldType.INTEGER,
+                mode=BigQueryFieldMode.REQUIRED,
+            ),
+            TableField(
+                name="c", type=BigQueryFieldType.STRING, mode=BigQueryFieldMode.REPEATED
+            ),
+            TableField(
+                name="d",
+                type=BigQueryFieldType.RECORD,
+                mode=BigQueryFieldMode.NULLABLE,
+                fields=[
+                    TableField(
+                        name="e",
+                        type=BigQueryFieldType.DATE,
+                        mode=BigQueryFieldMode.NULLABLE,
+                    )
+                ],
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize("data_type", ["UNKNOWN_TYPE", "STRUCT<a INT64", "INT64 foo"])
+def test_parse_data_type_raises_on_invalid_types(data_type: str) -> None:
+    with pytest.raises(DataTypeParseError):
+        parse_data_type("a", data_type)
+
+
+def test_tables_from_column_field_paths_orders_columns_and_adds_descriptions() -> None:
+    rows = [
+        _row("t1", "b", "STRUCT<c STRING>", 2, "YES"),
+        _row("t1", "b.c", "STRING", description="nested"),
+        _row("t1", "a", "INT64", 1, "NO", description="top level"),
+    ]
+
+    tables = tables_from_column_field_paths(rows)
+
+    assert tables == {
+        "t1": Table(
+            fields=[
+                TableField(
+                    name="a",
+                    type=BigQueryFieldType.INTEGER,
+                    mode=BigQueryFieldMode.REQUIRED,
+                    description="top level",
+                ),
+                TableField(
+                    name="b",
+                    type=BigQueryFieldType.RECORD,
+                    mode=BigQueryFieldMode.NULLABLE,
+                    fields=[
+                        TableField(
+                            name="c",
+                            type=BigQueryFieldType.STRING,
+                            mode=BigQueryFieldMode.NULLABLE,
+                            description="nested",
+                        )
+                    ],
+                ),
+            ]
+        )
+    }
+
+
+def test_tables_from_column_field_paths_maps_unparseable_tables_to_none() -> None:
+    rows = [
+        _row("t1", "a", "INT64", 1, "YES"),
+        _row("t2", "a", "NOT_A_TYPE", 1, "YES"),
+    ]
+
+    tables = tables_from_column_field_paths(rows)
+
+    assert tables["t1"] is not None
+    assert tables["t2"] is None
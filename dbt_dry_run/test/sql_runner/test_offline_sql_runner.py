@@ -0,0 +1,232 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dbt_dry_run.exception import UnknownColumnException, UnsupportedSQLException
+from dbt_dry_run.models import BigQueryFieldMode, BigQueryFieldType, Table, TableField
+from dbt_dry_run.models.manifest import ManifestColumn, NodeConfig
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.sql.literals import get_sql_literal_from_table
+from dbt_dry_run.sql_runner.offline_sql_runner import OfflineSQLRunner
+from dbt_dry_run.test.utils import SimpleNode, field_with_name
+
+UPSTREAM_TABLE = Table(
+    fields=[
+        field_with_name("name", BigQueryFieldType.STRING),
+        field_with_name("amount", BigQueryFieldType.INTEGER),
+        field_with_name("created", BigQueryFieldType.DATE),
+        field_with_name(
+            "tags", BigQueryFieldType.STRING, mode=BigQueryFieldMode.REPEATED
+        ),
+        TableField(
+            name="address",
+            type=BigQueryFieldType.RECORD,
+            mode=BigQueryFieldMode.NULLABLE,
+            fields=[field_with_name("postcode", BigQueryFieldType.STRING)],
+        ),
+    ]
+)
+UPSTREAM_LITERAL = get_sql_literal_from_table(UPSTREAM_TABLE)
+
+
+@pytest.fixture
+def sql_runner() -> OfflineSQLRunner:
+    return OfflineSQLRunner(MagicMock())
+
+
+def test_query_infers_schema_from_upstream_literals(
+    sql_runner: OfflineSQLRunner,
+) -> None:
+    sql = f"""
+        SELECT
+          name,
+          amount * 2 AS doubled,
+          amount / 2 AS halved,
+          DATE_TRUNC(created, MONTH) AS month,
+          tags,
+          address.postcode,
+          STRUCT(name AS n, [amount] AS a) AS nested
+        FROM {UPSTREAM_LITERAL}
+    """
+
+    status, table, exception, _ = sql_runner.query(sql)
+
+    assert status == DryRunStatus.SUCCESS, exception
+    assert table == Table(
+        fields=[
+            field_with_name("name", BigQueryFieldType.STRING),
+            field_with_name("doubled", BigQueryFieldType.INTEGER),
+            field_with_name("halved", BigQueryFieldType.FLOAT),
+            field_with_name("month", BigQueryFieldType.DATE),
+            field_with_name(
+                "tags", BigQueryFieldType.STRING, mode=BigQueryFieldMode.REPEATED
+            ),
+            field_with_name("postcode", BigQueryFieldType.STRING),
+            TableField(
+                name="nested",
+                type=BigQueryFieldType.RECORD,
+                mode=BigQueryFieldMode.NULLABLE,
+                fields=[
+                    field_with_name("n", BigQueryFieldType.STRING),
+                    field_with_name(
+                        "a", BigQueryFieldType.INTEGER, mode=BigQueryFieldMode.REPEATED
+                    ),
+                ],
+            ),
+        ]
+    )
+
+
+def test_query_names_anonymous_columns_like_bigquery(
+    sql_runner: OfflineSQLRunner,
+) -> None:
+    status, table, exception, _ = sql_runner.query(
+        f"SELECT name, amount + 1, 'x' FROM {UPSTREAM_LITERAL}"
+    )
+
+    assert status == DryRunStatus.SUCCESS, exception
+    assert table is not None
+    assert [f.name for f in table.fields] == ["name", "f0_", "f1_"]
+
+
+def test_query_infers_view_schema(sql_runner: OfflineSQLRunner) -> None:
+    sql = f"CREATE OR REPLACE VIEW `p`.`d`.`v` AS (\nSELECT name FROM {UPSTREAM_LITERAL}\n)"
+
+    status, table, exception, _ = sql_runner.query(sql)
+
+    assert status == DryRunStatus.SUCCESS, exception
+    assert table == Table(fields=[field_with_name("name", BigQueryFieldType.STRING)])
+
+
+def test_query_ignores_declare_statements(sql_runner: OfflineSQLRunner) -> None:
+    sql = (
+        "declare _dbt_max_partition date default CURRENT_DATE();\n"
+        f"SELECT created FROM {UPSTREAM_LITERAL} WHERE created > _dbt_max_partition"
+    )
+
+    status, table, exception, _ = sql_runner.query(sql)
+
+    assert status == DryRunStatus.SUCCESS, exception
+    assert table == Table(fields=[field_with_name("created", BigQueryFieldType.DATE)])
+
+
+def test_query_fails_for_unknown_column(sql_runner: OfflineSQLRunner) -> None:
+    status, table, exception, _ = sql_runner.query(
+        f"SELECT not_a_column FROM {UPSTREAM_LITERAL}"
+    )
+
+    assert status == DryRunStatus.FAILURE
+    assert table is None
+    assert "not_a_column" in str(exception)
+
+
+def test_query_fails_for_unknown_column_outside_select(
+    sql_runner: OfflineSQLRunner,
+) -> None:
+    status, table, exception, _ = sql_runner.query(
+        f"SELECT name FROM {UPSTREAM_LITERAL} WHERE not_a_column > 1"
+    )
+
+    assert status == DryRunStatus.FAILURE
+    assert isinstance(exception, UnknownColumnException)
+
+
+def test_query_does_not_treat_declared_variables_as_columns(
+    sql_runner: OfflineSQLRunner,
+) -> None:
+    sql = (
+        "DECLARE my_variable INT64 DEFAULT 1;\n"
+        f"SELECT name FROM {UPSTREAM_LITERAL} WHERE amount > my_variable"
+    )
+
+    status, table, exception, _ = sql_runner.query(sql)
+
+    assert status == DryRunStatus.SUCCESS, exception
+
+
+def test_query_coerces_set_operation_columns_to_common_type(
+    sql_runner: OfflineSQLRunner,
+) -> None:
+    status, table, exception, _ = sql_runner.query(
+        f"SELECT amount AS a, NULL AS b FROM {UPSTREAM_LITERAL} UNION ALL SELECT 1.5, name FROM {UPSTREAM_LITERAL}"
+    )
+
+    assert status == DryRunStatus.SUCCESS, exception
+    assert table == Table(
+        fields=[
+            field_with_name("a", BigQueryFieldType.FLOAT),
+            field_with_name("b", BigQueryFieldType.STRING),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT a FROM `p`.`d`.`unknown_table`",
+        f"SELECT my_dataset.my_udf(name) AS a FROM {UPSTREAM_LITERAL}",
+        "MERGE `p`.`d`.`t` USING `p`.`d`.`s` ON FALSE WHEN NOT MATCHED THEN INSERT ROW",
+        f"SELEC name FROM {UPSTREAM_LITERAL}",
+        "SELECT (SELECT AS STRUCT 1 AS a) AS s",
+        f"SELECT IF(amount > 1, name, amount) AS a FROM {UPSTREAM_LITERAL}",
+        f"SELECT COALESCE(tags, [1]) AS a FROM {UPSTREAM_LITERAL}",
+        f"SELECT name + 1 AS a FROM {UPSTREAM_LITERAL}",
+        f"SELECT name AS a FROM {UPSTREAM_LITERAL} UNION ALL SELECT amount FROM {UPSTREAM_LITERAL}",
+    ],
+)
+def test_query_skips_what_it_cannot_infer(
+    sql_runner: OfflineSQLRunner, sql: str
+) -> None:
+    status, table, exception, _ = sql_runner.query(sql)
+
+    assert status == DryRunStatus.SKIPPED
+    assert table is None
+    assert isinstance(exception, UnsupportedSQLException)
+
+
+def test_declared_source_columns_are_used_to_infer_queries(
+    sql_runner: OfflineSQLRunner,
+) -> None:
+    source = SimpleNode(
+        unique_id="my_source", depends_on=[], resource_type="source"
+    ).to_node()
+    source.columns = {
+        "id": ManifestColumn(name="id", data_type="INT64"),
+        "labels": ManifestColumn(name="labels", data_type="STRING[]"),
+    }
+
+    source_schema = sql_runner.get_node_schema(source)
+    status, table, exception, _ = sql_runner.query(
+        f"SELECT id, labels FROM {source.get_table_ref_literal()}"
+    )
+
+    assert source_schema is not None
+    assert status == DryRunStatus.SUCCESS, exception
+    assert table == Table(
+        fields=[
+            field_with_name("id", BigQueryFieldType.INTEGER),
+            field_with_name(
+                "labels", BigQueryFieldType.STRING, mode=BigQueryFieldMode.REPEATED
+            ),
+        ]
+    )
+
+
+def test_undeclared_source_is_assumed_to_exist(sql_runner: OfflineSQLRunner) -> None:
+    source = SimpleNode(
+        unique_id="my_source", depends_on=[], resource_type="source"
+    ).to_node()
+
+    assert sql_runner.get_node_schema(source) == Table(fields=[])
+
+
+def test_incremental_target_is_treated_as_new_table(
+    sql_runner: OfflineSQLRunner,
+) -> None:
+    model = SimpleNode(
+        unique_id="my_model",
+        depends_on=[],
+        table_config=NodeConfig(materialized="incremental"),
+    ).to_node()
+
+    assert sql_runner.get_node_schema(model) is None
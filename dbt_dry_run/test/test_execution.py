@@ -1,13 +1,32 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock
 
 import pytest
 
 from dbt_dry_run import flags
-from dbt_dry_run.exception import ManifestValidationError
-from dbt_dry_run.execution import should_check_columns, validate_manifest_compatibility
+from dbt_dry_run.exception import ManifestValidationError, RetryableException
+from dbt_dry_run.execution import (
+    _run_generation,
+    add_full_refresh_compiled_code,
+    dry_run_node,
+    record_result_metrics,
+    should_check_columns,
+    validate_manifest_compatibility,
+)
 from dbt_dry_run.flags import Flags
-from dbt_dry_run.models.manifest import Manifest, NodeMeta
+from dbt_dry_run.metrics import BYTES_PROCESSED, NODES, MetricsRegistry
+from dbt_dry_run.models import Table
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.manifest import Manifest, Node, NodeConfig, NodeMeta
+from dbt_dry_run.models.query_statistics import QueryStatistics
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.node_dispatch import RunnerKey
+from dbt_dry_run.node_runner import NodeRunner
+from dbt_dry_run.node_runner.node_test_runner import NodeTestRunner
+from dbt_dry_run.results import ResultListener, Results
+from dbt_dry_run.retry import RetryPolicy
 from dbt_dry_run.test.utils import SimpleNode
 
 SOME_KEY = "SOME_KEY"
@@ -86,3 +105,163 @@ def test_validate_manifest_compatibility_raises_if_contains_python_models() -> N
     manifest = Manifest(nodes={"a": node}, sources={}, macros={})
     with pytest.raises(ManifestValidationError):
         validate_manifest_compatibility(manifest)
+
+
+def _retrying_runners(side_effect: Any) -> Dict[RunnerKey, NodeRunner]:
+    mock_runner = MagicMock()
+    mock_runner.check_node_compiled.return_value = None
+    mock_runner.run.side_effect = side_effect
+    return {RunnerKey("model", "table"): mock_runner}
+
+
+def _success(node: Node) -> DryRunResult:
+    return DryRunResult(node, Table(fields=[]), DryRunStatus.SUCCESS, None)
+
+
+def test_dry_run_node_returns_delay_for_retryable_error(default_flags: Flags) -> None:
+    node = SimpleNode(unique_id="a", depends_on=[]).to_node()
+    runners = _retrying_runners(RetryableException(Exception("rate limited")))
+    listener = MagicMock(spec=ResultListener)
+    results = Results([listener])
+    policy = RetryPolicy(budget=10, min_wait=1, max_wait=1)
+
+    delay = dry_run_node(runners, node, results, policy)
+
+    assert delay == 1
+    assert "a" not in results
+    listener.on_node_retry.assert_called_once_with(node)
+
+
+def test_run_generation_retries_transient_errors(default_flags: Flags) -> None:
+    node = SimpleNode(unique_id="a", depends_on=[]).to_node()
+    transient = RetryableException(Exception("rate limited"))
+    runners = _retrying_runners([transient, transient, _success(node)])
+    results = Results()
+    policy = RetryPolicy(budget=10, min_wait=0, max_wait=0)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        _run_generation([node], runners, results, policy, executor)
+
+    result = results.get_result("a")
+    assert result.status == DryRunStatus.SUCCESS
+    assert result.retry_count == 2
+    assert policy.remaining_budget == 8
+
+
+def test_run_generation_fails_when_retry_budget_is_exhausted(
+    default_flags: Flags,
+) -> None:
+    node = SimpleNode(unique_id="a", depends_on=[]).to_node()
+    original = Exception("rate limited")
+    runners = _retrying_runners([RetryableException(original)] * 3)
+    results = Results()
+    policy = RetryPolicy(budget=2, min_wait=0, max_wait=0)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        _run_generation([node], runners, results, policy, executor)
+
+    result = results.get_result("a")
+    assert result.status == DryRunStatus.FAILURE
+    assert result.exception is original
+    assert result.retry_count == 2
+
+
+def test_run_generation_does_not_hold_thread_while_waiting_to_retry(
+    default_flags: Flags,
+) -> None:
+    flaky = SimpleNode(unique_id="flaky", depends_on=[]).to_node()
+    healthy = SimpleNode(unique_id="healthy", depends_on=[]).to_node()
+    calls: List[str] = []
+
+    def run(node: Node) -> DryRunResult:
+        calls.append(node.unique_id)
+        if node.unique_id == "flaky" and calls.count("flaky") == 1:
+            raise RetryableException(Exception("rate limited"))
+        return _success(node)
+
+    runners = _retrying_runners(run)
+    results = Results()
+    policy = RetryPolicy(budget=10, min_wait=0.2, max_wait=0.2)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        _run_generation([flaky, healthy], runners, results, policy, executor)
+
+    assert calls == ["flaky", "healthy", "flaky"]
+    assert results.get_result("flaky").retry_count == 1
+    assert results.get_result("healthy").retry_count == 0
+
+
+def test_record_result_metrics_counts_final_result_of_each_node(
+    metrics: MetricsRegistry,
+) -> None:
+    node = SimpleNode(unique_id="a", depends_on=[]).to_node()
+    success = replace(
+        _success(node), statistics=QueryStatistics(total_bytes_processed=100)
+    )
+    results = Results()
+    results.add_result("a", success)
+    # Replaced like a node that goes over its scan budget
+    results.add_result(
+        "a", replace(success, status=DryRunStatus.FAILURE, exception=Exception())
+    )
+
+    record_result_metrics(results)
+
+    assert NODES.value(status="FAILURE") == 1
+    assert NODES.value(status="SUCCESS") == 0
+    assert BYTES_PROCESSED.value(package=node.package) == 100
+
+
+def test_add_full_refresh_compiled_code_only_to_changed_incremental_models() -> None:
+    incremental = SimpleNode(
+        unique_id="incremental",
+        depends_on=[],
+        table_config=NodeConfig(materialized="incremental"),
+        compiled_code="SELECT * FROM a WHERE d > 1",
+    ).to_node()
+    table = SimpleNode(unique_id="table", depends_on=[]).to_node()
+    manifest = Manifest(
+        nodes={"incremental": incremental, "table": table}, sources={}, macros={}
+    )
+    full_refresh_manifest = manifest.model_copy(deep=True)
+    full_refresh_manifest.nodes["incremental"].compiled_code = "SELECT * FROM a"
+    full_refresh_manifest.nodes["table"].compiled_code = "SELECT 2"
+
+    add_full_refresh_compiled_code(manifest, full_refresh_manifest)
+
+    assert incremental.full_refresh_compiled_code == "SELECT * FROM a"
+    assert table.full_refresh_compiled_code is None
+
+
+def test_run_generation_batches_tests(default_flags: Flags) -> None:
+    flags.set_flags(Flags(test_batch_size=2))
+    model = SimpleNode(unique_id="model", depends_on=[]).to_node()
+    tests = [
+        SimpleNode(
+            unique_id=f"test{i}",
+            depends_on=[],
+            resource_type="test",
+            table_config=NodeConfig(materialized="test"),
+        ).to_node()
+        for i in range(3)
+    ]
+    model_runner = MagicMock()
+    model_runner.check_node_compiled.return_value = None
+    model_runner.run.side_effect = _success
+    test_runner = MagicMock(spec=NodeTestRunner)
+    test_runner.check_node_compiled.return_value = None
+    test_runner.run.side_effect = _success
+    test_runner.run_batch.side_effect = lambda nodes: [_success(n) for n in nodes]
+    runners: Dict[RunnerKey, NodeRunner] = {
+        RunnerKey("model", "table"): model_runner,
+        RunnerKey("test", "test"): test_runner,
+    }
+    results = Results()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        _run_generation([model, *tests], runners, results, RetryPolicy(), executor)
+
+    test_runner.run_batch.assert_called_once_with(tests[:2])
+    test_runner.run.assert_called_once_with(tests[2])
+    model_runner.run.assert_called_once_with(model)
+    assert results.keys() == {"model", "test0", "test1", "test2"}
@@ -0,0 +1,153 @@
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from dbt_dry_run.exception import InvalidGenericTestException
+from dbt_dry_run.generic_tests import validate_generic_test
+from dbt_dry_run.models import BigQueryFieldMode, BigQueryFieldType, Table, TableField
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.manifest import GenericTestMetadata, Node, NodeConfig
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.results import Results
+from dbt_dry_run.test.utils import SimpleNode, field_with_name
+
+ORDERS = Table(
+    fields=[
+        field_with_name("order_id", BigQueryFieldType.INTEGER),
+        field_with_name("customer_id", BigQueryFieldType.INT64),
+        field_with_name("status", BigQueryFieldType.STRING),
+        field_with_name("ordered_at", BigQueryFieldType.DATE),
+        field_with_name(
+            "tags", BigQueryFieldType.STRING, mode=BigQueryFieldMode.REPEATED
+        ),
+        TableField(
+            name="address",
+            type=BigQueryFieldType.RECORD,
+            fields=[field_with_name("postcode", BigQueryFieldType.STRING)],
+        ),
+    ]
+)
+CUSTOMERS = Table(
+    fields=[
+        field_with_name("id", BigQueryFieldType.INTEGER),
+        field_with_name("name", BigQueryFieldType.STRING),
+    ]
+)
+
+
+@pytest.fixture
+def results() -> Results:
+    results = Results()
+    for unique_id, table in [
+        ("model.shop.orders", ORDERS),
+        ("model.shop.customers", CUSTOMERS),
+    ]:
+        node = SimpleNode(unique_id=unique_id, depends_on=[]).to_node()
+        results.add_result(
+            unique_id, DryRunResult(node, table, DryRunStatus.SUCCESS, None)
+        )
+    return results
+
+
+def generic_test(
+    name: str,
+    column_name: Optional[str],
+    kwargs: Optional[Dict[str, Any]] = None,
+    depends_on: Optional[List[str]] = None,
+    namespace: Optional[str] = None,
+    where: Optional[str] = None,
+    attached_node: Optional[str] = "model.shop.orders",
+) -> Node:
+    node = SimpleNode(
+        unique_id=f"test.shop.{name}",
+        depends_on=[],
+        resource_type="test",
+        table_config=NodeConfig(materialized="test", where=where),
+    ).to_node()
+    node.depends_on.nodes = depends_on or ["model.shop.orders"]
+    node.attached_node = attached_node
+    node.column_name = column_name
+    node.test_metadata = GenericTestMetadata(
+        name=name,
+        kwargs={"column_name": column_name, **(kwargs or {})},
+        namespace=namespace,
+    )
+    return node
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        generic_test("not_null", "order_id"),
+        generic_test("not_null", "ORDER_ID"),
+        generic_test("not_null", "address.postcode"),
+        generic_test("not_null", "tags"),
+        generic_test("unique", "`order_id`"),
+        generic_test("accepted_values", "status", {"values": ["placed", "shipped"]}),
+        generic_test("accepted_values", "ordered_at", {"values": ["2024-01-01"]}),
+        generic_test(
+            "relationships",
+            "customer_id",
+            {"to": "ref('customers')", "field": "id"},
+            ["model.shop.customers", "model.shop.orders"],
+        ),
+    ],
+)
+def test_valid_generic_tests_succeed_without_dry_run(
+    node: Node, results: Results
+) -> None:
+    result = validate_generic_test(node, results)
+
+    assert result is not None
+    assert result.status == DryRunStatus.SUCCESS, result.exception
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        generic_test("not_null", "missing"),
+        generic_test("not_null", "address.missing"),
+        generic_test("unique", "tags"),
+        generic_test("unique", "address"),
+        generic_test("accepted_values", "order_id", {"values": ["1", "2"]}),
+        generic_test(
+            "relationships",
+            "customer_id",
+            {"to": "ref('customers')", "field": "missing"},
+            ["model.shop.customers", "model.shop.orders"],
+        ),
+    ],
+)
+def test_invalid_generic_tests_fail_without_dry_run(
+    node: Node, results: Results
+) -> None:
+    result = validate_generic_test(node, results)
+
+    assert result is not None
+    assert result.status == DryRunStatus.FAILURE
+    assert isinstance(result.exception, InvalidGenericTestException)
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        generic_test("not_null", "lower(status)"),
+        generic_test("not_null", "order_id", where="status = 'placed'"),
+        generic_test("not_null", "order_id", namespace="dbt_utils"),
+        generic_test("expression_is_true", None, {"expression": "order_id > 0"}),
+        generic_test("accepted_values", "order_id", {"values": [1], "quote": False}),
+        generic_test(
+            "relationships",
+            "status",
+            {"to": "ref('customers')", "field": "id"},
+            ["model.shop.customers", "model.shop.orders"],
+        ),
+        generic_test(
+            "not_null", "id", depends_on=["source.shop.raw"], attached_node=None
+        ),
+    ],
+)
+def test_generic_tests_that_cannot_be_validated_locally_are_dry_run(
+    node: Node, results: Results
+) -> None:
+    assert validate_generic_test(node, results) is None
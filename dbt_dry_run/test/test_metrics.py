@@ -0,0 +1,151 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from dbt_dry_run.metrics import (
+    CACHE_REQUESTS,
+    RETRIES,
+    RETRIES_REFUSED,
+    RUN_SUCCESS,
+    MetricsRegistry,
+)
+from dbt_dry_run.metrics_textfile import MetricsTextfileWriter
+from dbt_dry_run.models import Table
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.results import Results
+from dbt_dry_run.retry import RetryPolicy
+from dbt_dry_run.sql_runner.coalescing_sql_runner import CoalescingSQLRunner
+from dbt_dry_run.test.utils import SimpleNode
+
+
+def test_render_counter_and_gauge() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests", ["call"])
+    gauge = registry.gauge("in_flight", "In flight")
+    counter.inc(call="query")
+    counter.inc(2, call='say "hi"\n')
+    gauge.inc(3)
+    gauge.dec()
+
+    assert registry.render() == (
+        "# HELP requests_total Requests\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{call="query"} 1\n'
+        'requests_total{call="say \\"hi\\"\\n"} 2\n'
+        "# HELP in_flight In flight\n"
+        "# TYPE in_flight gauge\n"
+        "in_flight 2\n"
+    )
+
+
+def test_render_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency", ["call"], [0.1, 1])
+    for value in [0.05, 0.1, 0.5, 5]:
+        histogram.observe(value, call="query")
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{call="query",le="0.1"} 2',
+        'latency_seconds_bucket{call="query",le="1"} 3',
+        'latency_seconds_bucket{call="query",le="+Inf"} 4',
+        'latency_seconds_sum{call="query"} 5.65',
+        'latency_seconds_count{call="query"} 4',
+    ]
+
+
+def test_metrics_reject_wrong_labels() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests", ["call"])
+
+    with pytest.raises(ValueError, match="has labels"):
+        counter.inc(table="a")
+    with pytest.raises(ValueError, match="already registered"):
+        registry.counter("requests_total", "Requests")
+
+
+def test_counter_cant_be_decreased() -> None:
+    counter = MetricsRegistry().counter("requests_total", "Requests")
+
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+
+
+def test_write_textfile_replaces_file(tmp_path: Path) -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests")
+    path = tmp_path / "dbt_dry_run.prom"
+    path.write_text("old")
+
+    counter.inc()
+    registry.write_textfile(str(path))
+
+    assert path.read_text().endswith("requests_total 1\n")
+    assert [p.name for p in tmp_path.iterdir()] == ["dbt_dry_run.prom"]
+
+
+def test_retry_policy_counts_retries(metrics: MetricsRegistry) -> None:
+    policy = RetryPolicy(max_attempts=2, budget=1)
+
+    policy.next_delay(1)
+    policy.next_delay(1)
+    policy.next_delay(2)
+
+    assert RETRIES.value() == 1
+    assert RETRIES_REFUSED.value(reason="budget") == 1
+    assert RETRIES_REFUSED.value(reason="max_attempts") == 1
+
+
+def test_coalescing_runner_counts_cache_requests(metrics: MetricsRegistry) -> None:
+    class Inner:
+        _project = None
+
+        def query(self, sql: str) -> object:
+            return DryRunStatus.SUCCESS, None, None, None
+
+    sql_runner = CoalescingSQLRunner(Inner())  # type: ignore[arg-type]
+    sql_runner.query("SELECT 1")
+    sql_runner.query("SELECT 1")
+
+    assert CACHE_REQUESTS.value(cache="query", result="miss") == 1
+    assert CACHE_REQUESTS.value(cache="query", result="hit") == 1
+
+
+def test_textfile_writer_writes_run_metrics_on_finish(
+    metrics: MetricsRegistry, tmp_path: Path
+) -> None:
+    path = tmp_path / "dbt_dry_run.prom"
+    results = Results([MetricsTextfileWriter(str(path))])
+    results.start(1)
+    results.add_result(
+        "a",
+        DryRunResult(
+            node=SimpleNode(unique_id="a", depends_on=[]).to_node(),
+            table=Table(fields=[]),
+            status=DryRunStatus.FAILURE,
+            exception=Exception("Oh no!"),
+        ),
+    )
+    results.finish()
+
+    assert RUN_SUCCESS.value() == 0
+    content = path.read_text()
+    assert "dbt_dry_run_success 0\n" in content
+    assert "# TYPE dbt_dry_run_node_duration_seconds histogram\n" in content
+    assert "dbt_dry_run_last_run_timestamp_seconds " in content
+
+
+def test_textfile_writer_writes_periodically(
+    metrics: MetricsRegistry, tmp_path: Path
+) -> None:
+    path = tmp_path / "dbt_dry_run.prom"
+    with MetricsTextfileWriter(str(path), interval=0.01) as writer:
+        writer.on_start(1)
+        for _ in range(100):
+            if path.exists():
+                break
+            RETRIES.inc()
+            time.sleep(0.01)
+
+    assert "dbt_dry_run_retries_total" in path.read_text()
@@ -0,0 +1,69 @@
+import io
+import json
+from typing import Any, Dict, List
+
+from dbt_dry_run.models import Report, Table
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.ndjson_report import NDJSONReportWriter
+from dbt_dry_run.result_reporter import ResultReporter
+from dbt_dry_run.results import Results
+from dbt_dry_run.test.utils import SimpleNode
+
+
+def _result(unique_id: str, status: DryRunStatus) -> DryRunResult:
+    return DryRunResult(
+        node=SimpleNode(unique_id=unique_id, depends_on=[]).to_node(),
+        table=Table(fields=[]) if status == DryRunStatus.SUCCESS else None,
+        status=status,
+        exception=None if status == DryRunStatus.SUCCESS else Exception("Oh no!"),
+    )
+
+
+def _records(output: io.StringIO) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_writes_a_record_as_each_result_is_added() -> None:
+    output = io.StringIO()
+    results = Results([NDJSONReportWriter(output)])
+
+    results.add_result("A", _result("A", DryRunStatus.SUCCESS))
+    assert [r["unique_id"] for r in _records(output)] == ["A"]
+
+    results.add_result("B", _result("B", DryRunStatus.FAILURE))
+    records = _records(output)
+    assert [r["record"] for r in records] == ["node", "node"]
+    assert records[1]["unique_id"] == "B"
+    assert records[1]["error_message"] == "Exception"
+
+
+def test_writes_summary_when_results_finish() -> None:
+    output = io.StringIO()
+    results = Results([NDJSONReportWriter(output)])
+    results.add_result("A", _result("A", DryRunStatus.SUCCESS))
+    results.add_result("B", _result("B", DryRunStatus.FAILURE))
+
+    results.finish()
+
+    summary = _records(output)[-1]
+    assert summary["record"] == "summary"
+    assert summary["success"] is False
+    assert summary["node_count"] == 2
+    assert summary["failed_node_ids"] == ["B"]
+    assert "nodes" not in summary
+
+
+def test_records_match_json_report() -> None:
+    output = io.StringIO()
+    results = Results([NDJSONReportWriter(output)])
+    results.add_result("A", _result("A", DryRunStatus.SUCCESS))
+    results.add_result("B", _result("B", DryRunStatus.FAILURE))
+    results.finish()
+
+    *nodes, summary = _records(output)
+    for record in [summary, *nodes]:
+        del record["record"]
+    streamed = Report.model_validate({**summary, "nodes": nodes})
+
+    assert streamed == ResultReporter(results, set()).get_report()
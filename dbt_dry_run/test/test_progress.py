@@ -0,0 +1,131 @@
+import io
+import time
+import pytest
+
+from dbt_dry_run.models import Table
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.progress import ProgressReporter, format_duration
+from dbt_dry_run.results import Results
+from dbt_dry_run.test.utils import SimpleNode
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _result(unique_id: str, status: DryRunStatus) -> DryRunResult:
+    return DryRunResult(
+        node=SimpleNode(unique_id=unique_id, depends_on=[]).to_node(),
+        table=Table(fields=[]),
+        status=status,
+        exception=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "seconds,expected", [(5.9, "5s"), (65, "1m 05s"), (3 * 3600 + 120, "3h 02m")]
+)
+def test_format_duration(seconds: float, expected: str) -> None:
+    assert format_duration(seconds) == expected
+
+
+def test_progress_counts_completed_failed_and_in_flight_nodes() -> None:
+    clock = FakeClock()
+    reporter = ProgressReporter(io.StringIO(), tty=False, clock=clock)
+    results = Results([reporter])
+    with reporter:
+        results.start(10)
+        for unique_id in ["a", "b", "c"]:
+            results.start_node(SimpleNode(unique_id=unique_id, depends_on=[]).to_node())
+        clock.now = 2.0
+        results.add_result("a", _result("a", DryRunStatus.SUCCESS))
+        results.add_result("b", _result("b", DryRunStatus.FAILURE))
+
+        assert reporter.format_progress() == (
+            "[2s] 2/10 nodes (1 failed, 1 in flight, 0 retrying), 1.0 nodes/s, ETA 8s"
+        )
+
+
+def test_nodes_waiting_to_retry_are_not_in_flight() -> None:
+    reporter = ProgressReporter(io.StringIO(), tty=False, clock=FakeClock())
+    results = Results([reporter])
+    with reporter:
+        results.start(2)
+        node_a = SimpleNode(unique_id="a", depends_on=[]).to_node()
+        node_b = SimpleNode(unique_id="b", depends_on=[]).to_node()
+        results.start_node(node_a)
+        results.start_node(node_b)
+        results.retry_node(node_a)
+        results.retry_node(node_b)
+
+        assert "(0 failed, 0 in flight, 2 retrying)" in reporter.format_progress()
+
+        results.start_node(node_a)
+        results.add_result("b", _result("b", DryRunStatus.FAILURE))
+
+        assert "(1 failed, 1 in flight, 0 retrying)" in reporter.format_progress()
+
+
+def test_eta_follows_recent_node_rate() -> None:
+    clock = FakeClock()
+    reporter = ProgressReporter(io.StringIO(), tty=False, clock=clock)
+    results = Results([reporter])
+    with reporter:
+        results.start(100)
+        for index in range(30):
+            results.add_result(str(index), _result(str(index), DryRunStatus.SUCCESS))
+        # Nothing completes for a while, so the node rate falls back to zero
+        clock.now = 100.0
+
+        assert reporter.format_progress().endswith("0.0 nodes/s, ETA unknown")
+
+        for index in range(30, 40):
+            results.add_result(str(index), _result(str(index), DryRunStatus.SUCCESS))
+        clock.now = 110.0
+
+        assert reporter.format_progress() == (
+            "[1m 50s] 40/100 nodes (0 failed, 0 in flight, 0 retrying), 0.3 nodes/s, ETA 3m 00s"
+        )
+
+
+def test_replaced_result_is_not_counted_twice() -> None:
+    reporter = ProgressReporter(io.StringIO(), tty=False, clock=FakeClock())
+    results = Results([reporter])
+    with reporter:
+        results.start(1)
+        results.add_result("a", _result("a", DryRunStatus.SUCCESS))
+        results.add_result("a", _result("a", DryRunStatus.FAILURE))
+
+        assert reporter.format_progress().startswith("[0s] 1/1 nodes (1 failed")
+
+
+def test_logs_progress_periodically_when_not_a_terminal() -> None:
+    output = io.StringIO()
+    results = Results([ProgressReporter(output, interval=0.01, tty=False)])
+    results.start(2)
+    results.add_result("a", _result("a", DryRunStatus.SUCCESS))
+    time.sleep(0.1)
+    results.finish()
+
+    lines = output.getvalue().splitlines()
+    assert len(lines) > 2
+    assert "\r" not in output.getvalue()
+    assert "1/2 nodes (0 failed, 0 in flight, 0 retrying)" in lines[-1]
+
+
+def test_redraws_one_line_in_a_terminal() -> None:
+    output = io.StringIO()
+    results = Results([ProgressReporter(output, tty=True)])
+    results.start(1)
+    results.add_result("a", _result("a", DryRunStatus.SUCCESS))
+    results.finish()
+
+    assert output.getvalue().startswith("\r")
+    assert output.getvalue().count("\n") == 1
+    assert "1/1 nodes" in output.getvalue()
+    assert output.getvalue().rstrip().endswith("done")
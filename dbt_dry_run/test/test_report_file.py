@@ -0,0 +1,139 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from dbt_dry_run.models import (
+    BigQueryFieldType,
+    QueryStatistics,
+    Report,
+    ReportNode,
+    Table,
+    TableField,
+)
+from dbt_dry_run.models.report import DryRunStatus, LintingStatus
+from dbt_dry_run.report_file import (
+    ReportFormat,
+    _zstd,
+    compact_report,
+    read_report,
+    write_report,
+)
+
+
+def _table(*names: str) -> Table:
+    return Table(
+        fields=[TableField(name=name, type=BigQueryFieldType.STRING) for name in names]
+    )
+
+
+def _node(unique_id: str, table: Optional[Table]) -> ReportNode:
+    return ReportNode(
+        unique_id=unique_id,
+        success=table is not None,
+        status=DryRunStatus.SUCCESS if table is not None else DryRunStatus.FAILURE,
+        error_message=None if table is not None else "BadRequest",
+        table=table,
+        linting_status=LintingStatus.SKIPPED,
+        linting_errors=[],
+        statistics=QueryStatistics(total_bytes_processed=10),
+    )
+
+
+@pytest.fixture()
+def report() -> Report:
+    nodes: List[ReportNode] = [
+        _node("model.a", _table("a", "b")),
+        _node("model.b", _table("a", "b")),
+        _node("model.c", _table("c")),
+        _node("model.d", None),
+    ]
+    return Report(
+        success=False,
+        execution_time=3,
+        node_count=4,
+        failure_count=1,
+        failed_node_ids=["model.d"],
+        nodes=nodes,
+        total_bytes_processed=40,
+        bytes_processed_by_package={"a": 40},
+    )
+
+
+def _skip_without_zstd(suffix: str) -> None:
+    if suffix == ".zst":
+        try:
+            _zstd()
+        except ImportError:
+            pytest.skip("zstd isn't available")
+
+
+@pytest.mark.parametrize("report_format", list(ReportFormat))
+@pytest.mark.parametrize("suffix", ["", ".gz", ".zst"])
+def test_report_round_trips(
+    report: Report, tmp_path: Path, report_format: ReportFormat, suffix: str
+) -> None:
+    _skip_without_zstd(suffix)
+    path = str(tmp_path / f"report.json{suffix}")
+
+    write_report(report, path, report_format)
+
+    assert read_report(path) == report
+
+
+def test_compact_report_stores_each_schema_once(report: Report) -> None:
+    compact = compact_report(report)
+
+    assert len(compact.schemas) == 2
+    schema_ids = [node.schema_id for node in compact.nodes]
+    assert schema_ids[0] == schema_ids[1]
+    assert schema_ids[0] != schema_ids[2]
+    assert schema_ids[3] is None
+
+
+def test_expanded_compact_report_shares_tables(report: Report, tmp_path: Path) -> None:
+    path = str(tmp_path / "report.json")
+    write_report(report, path, ReportFormat.COMPACT)
+
+    nodes = read_report(path).nodes
+
+    assert nodes[0].table is nodes[1].table
+
+
+@pytest.mark.parametrize("report_format", list(ReportFormat))
+def test_report_without_tables(
+    report: Report, tmp_path: Path, report_format: ReportFormat
+) -> None:
+    path = str(tmp_path / "report.json")
+
+    write_report(report, path, report_format, include_tables=False)
+
+    actual = read_report(path)
+    assert all(node.table is None for node in actual.nodes)
+    assert [node.unique_id for node in actual.nodes] == [
+        node.unique_id for node in report.nodes
+    ]
+    assert actual.failed_node_ids == report.failed_node_ids
+
+
+def test_plain_report_without_tables_is_still_a_valid_report(
+    report: Report, tmp_path: Path
+) -> None:
+    path = tmp_path / "report.json"
+
+    write_report(report, str(path), include_tables=False)
+
+    Report.model_validate_json(path.read_text())
+
+
+def test_read_report_raises_on_unknown_compact_version(
+    report: Report, tmp_path: Path
+) -> None:
+    path = tmp_path / "report.json"
+    content = json.loads(compact_report(report).model_dump_json(by_alias=True))
+    content["compact_report_version"] = 99
+    path.write_text(json.dumps(content))
+
+    with pytest.raises(ValueError, match="version 99"):
+        read_report(str(path))
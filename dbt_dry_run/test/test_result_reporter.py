@@ -2,7 +2,7 @@ from typing import List
 
 import pytest
 
-from dbt_dry_run.models import Table
+from dbt_dry_run.models import QueryStatistics, Table
 from dbt_dry_run.models.dry_run_result import DryRunResult, LintingError
 from dbt_dry_run.models.report import DryRunStatus, LintingStatus
 from dbt_dry_run.result_reporter import ResultReporter
@@ -73,3 +73,29 @@ def test_failed_linting_results(
     failed_results = build_results([successful_result, failed_linting_result])
     reporter = ResultReporter(failed_results, set())
     assert reporter.report_and_check_results() == 1
+
+
+def test_report_totals_bytes_processed_per_package() -> None:
+    def result_with_bytes(unique_id: str, total_bytes_processed: int) -> DryRunResult:
+        return DryRunResult(
+            node=SimpleNode(unique_id=unique_id, depends_on=[]).to_node(),
+            table=Table(fields=[]),
+            status=DryRunStatus.SUCCESS,
+            exception=None,
+            statistics=QueryStatistics(total_bytes_processed=total_bytes_processed),
+        )
+
+    results = build_results(
+        [
+            result_with_bytes("model.sales.orders", 100),
+            result_with_bytes("model.sales.customers", 20),
+            result_with_bytes("model.marketing.campaigns", 3),
+        ]
+    )
+
+    report = ResultReporter(results, set()).get_report()
+
+    assert report.total_bytes_processed == 123
+    assert report.bytes_processed_by_package == {"sales": 120, "marketing": 3}
+    orders = next(n for n in report.nodes if n.unique_id == "model.sales.orders")
+    assert orders.statistics == QueryStatistics(total_bytes_processed=100)
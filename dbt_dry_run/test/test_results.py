@@ -0,0 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from dbt_dry_run.models import Table
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.results import ResultListener, Results
+from dbt_dry_run.test.utils import SimpleNode
+
+CONTENTION_THREADS = 64
+
+
+def _result(unique_id: str) -> DryRunResult:
+    return DryRunResult(
+        node=SimpleNode(unique_id=unique_id, depends_on=[]).to_node(),
+        table=Table(fields=[]),
+        status=DryRunStatus.SUCCESS,
+        exception=None,
+    )
+
+
+def test_results_contains_only_added_keys() -> None:
+    results = Results()
+    results.add_result("a", _result("a"))
+
+    assert "a" in results
+    assert "b" not in results
+    assert len(results) == 1
+
+
+def test_get_many_skips_missing_keys_and_preserves_order() -> None:
+    results = Results()
+    for key in ["a", "b", "c"]:
+        results.add_result(key, _result(key))
+
+    actual = results.get_many(["c", "missing", "a"])
+
+    assert [r.node.unique_id for r in actual] == ["c", "a"]
+
+
+def test_results_are_consistent_under_contention() -> None:
+    results = Results()
+    node_keys = [f"node_{i}" for i in range(CONTENTION_THREADS * 20)]
+    prebuilt = {key: _result(key) for key in node_keys}
+
+    def writer_and_reader(thread_id: int) -> List[str]:
+        own_keys = node_keys[thread_id::CONTENTION_THREADS]
+        for key in own_keys:
+            results.add_result(key, prebuilt[key])
+            assert key in results
+            results.get_many(node_keys)
+        return [r.node.unique_id for r in results.get_many(own_keys)]
+
+    with ThreadPoolExecutor(max_workers=CONTENTION_THREADS) as executor:
+        seen = list(executor.map(writer_and_reader, range(CONTENTION_THREADS)))
+
+    assert len(results) == len(node_keys)
+    assert results.keys() == set(node_keys)
+    for thread_id, thread_seen in enumerate(seen):
+        assert thread_seen == node_keys[thread_id::CONTENTION_THREADS]
+
+
+def test_listeners_are_told_about_results_and_finish() -> None:
+    added: List[str] = []
+    finished: List[Results] = []
+
+    class Listener(ResultListener):
+        def on_result(self, result: DryRunResult) -> None:
+            added.append(result.node.unique_id)
+
+        def on_finish(self, results: Results) -> None:
+            finished.append(results)
+
+    results = Results([Listener()])
+    results.add_result("a", _result("a"))
+    results.add_result("b", _result("b"))
+    results.finish()
+
+    assert added == ["a", "b"]
+    assert finished == [results]
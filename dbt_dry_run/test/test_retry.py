@@ -0,0 +1,32 @@
+import pytest
+
+from dbt_dry_run.retry import RetryPolicy
+
+
+def test_next_delay_stops_after_max_attempts() -> None:
+    policy = RetryPolicy(max_attempts=3, budget=100)
+
+    assert policy.next_delay(1) is not None
+    assert policy.next_delay(2) is not None
+    assert policy.next_delay(3) is None
+
+
+def test_next_delay_stops_when_budget_is_exhausted() -> None:
+    policy = RetryPolicy(max_attempts=10, budget=2)
+
+    assert policy.next_delay(1) is not None
+    assert policy.next_delay(1) is not None
+    assert policy.next_delay(1) is None
+    assert policy.remaining_budget == 0
+
+
+@pytest.mark.parametrize("attempt", [1, 2, 3, 4, 10])
+def test_next_delay_is_jittered_within_bounds(attempt: int) -> None:
+    policy = RetryPolicy(
+        max_attempts=20, budget=1000, min_wait=0.5, max_wait=10.0, multiplier=0.5
+    )
+    ceiling = max(0.5, min(10.0, 0.5 * 2**attempt))
+
+    delays = [policy.next_delay(attempt) for _ in range(50)]
+
+    assert all(d is not None and 0.5 <= d <= ceiling for d in delays)
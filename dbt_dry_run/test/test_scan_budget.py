@@ -0,0 +1,193 @@
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from dbt_dry_run import flags
+from dbt_dry_run.exception import PartitionPruningException, ScanBudgetException
+from dbt_dry_run.models import QueryStatistics, Report, ReportNode, Table
+from dbt_dry_run.models.dry_run_result import DryRunResult, LintingStatus
+from dbt_dry_run.models.manifest import NodeMeta
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.results import Results
+from dbt_dry_run.scan_budget import (
+    check_scan_budget,
+    check_scan_budgets,
+    load_baseline_bytes_processed,
+    parse_bytes,
+)
+from dbt_dry_run.test.utils import SimpleNode
+
+GB = 1024**3
+
+
+def result_with_bytes(
+    bytes_processed: Optional[int], max_bytes_processed: Any = None
+) -> DryRunResult:
+    meta = (
+        NodeMeta({"dry_run.max_bytes_processed": max_bytes_processed})
+        if max_bytes_processed is not None
+        else None
+    )
+    return DryRunResult(
+        node=SimpleNode(
+            unique_id="model.my_package.a", depends_on=[], meta=meta
+        ).to_node(),
+        table=Table(fields=[]),
+        status=DryRunStatus.SUCCESS,
+        exception=None,
+        statistics=QueryStatistics(total_bytes_processed=bytes_processed),
+    )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (1024, 1024),
+        ("2048", 2048),
+        ("1KB", 1024),
+        ("1.5 GiB", int(1.5 * GB)),
+        ("2tb", 2 * 1024**4),
+    ],
+)
+def test_parse_bytes(value: Any, expected: int) -> None:
+    assert parse_bytes(value) == expected
+
+
+@pytest.mark.parametrize("value", ["lots", "1 XB", "-1", True])
+def test_parse_bytes_rejects_invalid_values(value: Any) -> None:
+    with pytest.raises(ValueError):
+        parse_bytes(value)
+
+
+def test_node_over_its_meta_budget_fails(default_flags: flags.Flags) -> None:
+    result = check_scan_budget(result_with_bytes(2 * GB, "1GB"), {})
+
+    assert result.status == DryRunStatus.FAILURE
+    assert isinstance(result.exception, ScanBudgetException)
+    assert result.table is not None
+
+
+def test_node_meta_budget_takes_precedence_over_run_budget(
+    default_flags: flags.Flags,
+) -> None:
+    flags.set_flags(flags.Flags(max_bytes_processed=GB))
+
+    result = check_scan_budget(result_with_bytes(2 * GB, "10GB"), {})
+
+    assert result.status == DryRunStatus.SUCCESS
+
+
+def test_node_over_run_budget_fails(default_flags: flags.Flags) -> None:
+    flags.set_flags(flags.Flags(max_bytes_processed=GB))
+
+    result = check_scan_budget(result_with_bytes(GB + 1), {})
+
+    assert result.status == DryRunStatus.FAILURE
+
+
+def test_invalid_meta_budget_fails_node(default_flags: flags.Flags) -> None:
+    result = check_scan_budget(result_with_bytes(GB, "lots"), {})
+
+    assert result.status == DryRunStatus.FAILURE
+    assert "dry_run.max_bytes_processed" in str(result.exception)
+
+
+@pytest.mark.parametrize(
+    "bytes_processed, baseline, expected_status",
+    [
+        (120, 100, DryRunStatus.SUCCESS),
+        (121, 100, DryRunStatus.FAILURE),
+        (50, 100, DryRunStatus.SUCCESS),
+        (121, 0, DryRunStatus.SUCCESS),
+        (121, None, DryRunStatus.SUCCESS),
+    ],
+)
+def test_growth_over_baseline(
+    default_flags: flags.Flags,
+    bytes_processed: int,
+    baseline: Optional[int],
+    expected_status: DryRunStatus,
+) -> None:
+    flags.set_flags(flags.Flags(max_bytes_processed_growth=20))
+    baselines = {} if baseline is None else {"model.my_package.a": baseline}
+
+    result = check_scan_budget(result_with_bytes(bytes_processed), baselines)
+
+    assert result.status == expected_status
+
+
+def test_results_without_bytes_processed_are_not_checked(
+    default_flags: flags.Flags,
+) -> None:
+    flags.set_flags(flags.Flags(max_bytes_processed=0))
+    unknown = result_with_bytes(None)
+
+    assert check_scan_budget(unknown, {}) is unknown
+
+
+def test_check_scan_budgets_reads_baseline_report(
+    default_flags: flags.Flags, tmp_path: Path
+) -> None:
+    baseline_path = tmp_path / "baseline.json"
+    baseline_node = ReportNode(
+        unique_id="model.my_package.a",
+        success=True,
+        status=DryRunStatus.SUCCESS,
+        error_message=None,
+        table=None,
+        linting_status=LintingStatus.SKIPPED,
+        linting_errors=[],
+        statistics=QueryStatistics(total_bytes_processed=GB),
+    )
+    baseline_report = Report(
+        success=True,
+        execution_time=1,
+        node_count=1,
+        failure_count=0,
+        nodes=[baseline_node],
+    )
+    baseline_path.write_text(baseline_report.model_dump_json(by_alias=True))
+    flags.set_flags(
+        flags.Flags(baseline_report=str(baseline_path), max_bytes_processed_growth=10.0)
+    )
+    results = Results()
+    results.add_result("model.my_package.a", result_with_bytes(2 * GB))
+
+    check_scan_budgets(results)
+
+    assert load_baseline_bytes_processed(str(baseline_path)) == {
+        "model.my_package.a": GB
+    }
+    assert results.get_result("model.my_package.a").status == DryRunStatus.FAILURE
+
+
+@pytest.mark.parametrize(
+    "full_refresh_bytes_processed, expected_status",
+    [
+        (10 * GB, DryRunStatus.SUCCESS),
+        (2 * GB, DryRunStatus.SUCCESS),
+        (GB + GB // 2, DryRunStatus.FAILURE),
+        (None, DryRunStatus.SUCCESS),
+    ],
+)
+def test_incremental_run_must_process_fewer_bytes_than_full_refresh(
+    default_flags: flags.Flags,
+    full_refresh_bytes_processed: Optional[int],
+    expected_status: DryRunStatus,
+) -> None:
+    result = result_with_bytes(GB)
+    assert result.statistics
+    result = replace(
+        result,
+        statistics=result.statistics.model_copy(
+            update={"full_refresh_bytes_processed": full_refresh_bytes_processed}
+        ),
+    )
+
+    checked = check_scan_budget(result, {})
+
+    assert checked.status == expected_status
+    if expected_status == DryRunStatus.FAILURE:
+        assert isinstance(checked.exception, PartitionPruningException)
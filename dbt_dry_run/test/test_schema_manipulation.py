@@ -179,3 +179,45 @@ def test_collect_flattened_field_paths_returns_flattened_field_paths() -> None:
     ]
 
     assert actual_fields_with_paths == expected_fields_with_paths
+
+
+def test_merge_table_fields_shares_fields_with_nothing_added() -> None:
+    unchanged_struct = TableField(
+        name="unchanged",
+        type=BigQueryFieldType.STRUCT,
+        fields=[TableField(name="field_1", type=BigQueryFieldType.STRING)],
+    )
+    changed_struct = TableField(
+        name="changed",
+        type=BigQueryFieldType.STRUCT,
+        fields=[unchanged_struct],
+    )
+    new_field = TableField(name="field_2", type=BigQueryFieldType.STRING)
+    table_2_fields = [
+        changed_struct.model_copy(
+            update={"fields": [unchanged_struct, new_field]}, deep=True
+        )
+    ]
+
+    actual_fields = merge_table_fields(
+        table_1_fields=[changed_struct], table_2_fields=table_2_fields
+    )
+
+    assert actual_fields == table_2_fields
+    assert actual_fields[0] is not changed_struct
+    assert changed_struct.fields == [unchanged_struct]
+    assert actual_fields[0].fields
+    assert actual_fields[0].fields[0] is unchanged_struct
+
+
+def test_merge_table_fields_replaces_empty_struct_fields_with_none() -> None:
+    table_fields = [TableField(name="struct_col", type=BigQueryFieldType.STRUCT)]
+    table_fields[0].fields = []
+
+    actual_fields = merge_table_fields(
+        table_1_fields=table_fields, table_2_fields=table_fields
+    )
+
+    assert actual_fields == [
+        TableField(name="struct_col", type=BigQueryFieldType.STRUCT, fields=None)
+    ]
@@ -0,0 +1,81 @@
+from pathlib import Path
+from typing import List, Optional
+
+import agate as ag
+import pytest
+from dbt.adapters.bigquery import BigQueryAdapter
+
+from dbt_dry_run.seed_inference import infer_seed_sample
+
+
+def bigquery_types(table: ag.Table) -> List[Optional[str]]:
+    return [
+        BigQueryAdapter.convert_agate_type(table, index)
+        for index in range(len(table.columns))
+    ]
+
+
+@pytest.mark.parametrize(
+    "csv_content",
+    [
+        "a,b,c\nfoo,bar,baz\n",
+        "a,b,c\n1,1.5,true\n2,2.25,false\n",
+        "a,b\n1,2\n1.000,2.5\n,\n",
+        "a,b\n1,2023-01-01\nfoo,2023-01-02 10:00:00\n",
+        "a,b,c\n2023-01-01,10:00:00,null\n2023-02-01,,\n",
+        pytest.param(
+            "a,,a\n1,2,3\n",
+            marks=pytest.mark.filterwarnings("ignore:Column"),
+        ),
+        "a,b\n1\n2,x\n",
+        "a,b\n",
+        "a;b\n1;2\n",
+        "a,b\n12,1\n2023-01-01,0.5\n3 days,2\n",
+        "a,b\nyes,2023-01-01\n,2023-01-01 10:00:00\n1.5,\n",
+    ],
+)
+def test_infer_seed_sample_matches_agate(tmp_path: Path, csv_content: str) -> None:
+    path = tmp_path / "seed.csv"
+    path.write_text(csv_content)
+    delimiter = ";" if ";" in csv_content else ","
+    with open(path, "r", encoding="utf-8-sig") as f:
+        expected = ag.Table.from_csv(f, delimiter=delimiter)
+
+    actual = infer_seed_sample(str(path), delimiter).to_agate_table()
+
+    assert actual.column_names == expected.column_names
+    assert bigquery_types(actual) == bigquery_types(expected)
+
+
+def test_infer_seed_sample_only_reads_header_when_column_types_are_known(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "seed.csv"
+    # The row would fail to load because it has more values than the header
+    path.write_text("a,b\n1,2,3\n")
+
+    sample = infer_seed_sample(str(path), ",", frozenset({"a", "b"}))
+
+    assert sample.column_names == ["a", "b"]
+
+
+def test_infer_seed_sample_stops_reading_once_every_column_is_text(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "seed.csv"
+    path.write_text("a,b\nfoo,bar\n1,2,3\n")
+
+    sample = infer_seed_sample(str(path), ",")
+
+    assert [type(t) for t in sample.column_types] == [ag.Text, ag.Text]
+
+
+def test_infer_seed_sample_only_reads_sample_rows(tmp_path: Path) -> None:
+    path = tmp_path / "seed.csv"
+    path.write_text("a\n1\n2\nfoo\n")
+
+    sampled = infer_seed_sample(str(path), ",", sample_rows=2)
+    full = infer_seed_sample(str(path), ",")
+
+    assert bigquery_types(sampled.to_agate_table()) == ["int64"]
+    assert bigquery_types(full.to_agate_table()) == ["string"]
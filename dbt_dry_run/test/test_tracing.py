@@ -0,0 +1,96 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Generator, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from dbt_dry_run import tracing
+from dbt_dry_run.exception import RetryableException
+from dbt_dry_run.execution import _run_generation
+from dbt_dry_run.flags import Flags
+from dbt_dry_run.models import Table
+from dbt_dry_run.models.dry_run_result import DryRunResult
+from dbt_dry_run.models.report import DryRunStatus
+from dbt_dry_run.node_dispatch import RunnerKey
+from dbt_dry_run.results import Results
+from dbt_dry_run.retry import RetryPolicy
+from dbt_dry_run.test.utils import SimpleNode
+
+
+@pytest.fixture
+def tracer() -> Generator[tracing.Tracer, None, None]:
+    yield tracing.start_tracing()
+    tracing.stop_tracing()
+
+
+def _events(tracer: tracing.Tracer, phase: str) -> List[Dict[str, Any]]:
+    return [event for event in tracer.events() if event["ph"] == phase]
+
+
+def test_span_does_nothing_when_tracing_is_off() -> None:
+    with tracing.span("a", "node"):
+        pass
+    tracing.instant("b", "retry")
+
+
+def test_spans_are_nested_on_their_thread(tracer: tracing.Tracer) -> None:
+    with tracing.span("outer", "node", attempt=1):
+        with tracing.span("inner", "bigquery"):
+            pass
+    thread = threading.Thread(target=lambda: tracing.instant("other", "retry"))
+    thread.start()
+    thread.join()
+
+    outer, inner = sorted(_events(tracer, "X"), key=lambda e: e["ts"])
+    assert (outer["name"], inner["name"]) == ("outer", "inner")
+    assert outer["args"] == {"attempt": 1}
+    assert outer["tid"] == inner["tid"]
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    (other,) = _events(tracer, "i")
+    assert other["tid"] != outer["tid"]
+    thread_names = {e["tid"]: e["args"]["name"] for e in _events(tracer, "M")}
+    assert thread_names[outer["tid"]] == threading.current_thread().name
+
+
+def test_run_generation_traces_nodes_queue_waits_and_retries(
+    default_flags: Flags, tracer: tracing.Tracer
+) -> None:
+    node = SimpleNode(unique_id="a", depends_on=[]).to_node()
+    runner = MagicMock()
+    runner.check_node_compiled.return_value = None
+    runner.run.side_effect = [
+        RetryableException(Exception("rate limited")),
+        DryRunResult(node, Table(fields=[]), DryRunStatus.SUCCESS, None),
+    ]
+    policy = RetryPolicy(budget=10, min_wait=0, max_wait=0)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        _run_generation(
+            [node], {RunnerKey("model", "table"): runner}, Results(), policy, executor
+        )
+
+    node_spans = [e for e in _events(tracer, "X") if e["name"] == "a"]
+    assert [span["args"]["attempt"] for span in node_spans] == [1, 2]
+    async_names = [e["name"] for e in _events(tracer, "b")]
+    assert async_names.count("queue wait") == 2
+    assert async_names.count("retry backoff") == 1
+    (retry,) = _events(tracer, "i")
+    assert retry["args"] == {"nodes": ["a"], "attempt": 1, "error": "Exception"}
+
+
+def test_trace_writer_writes_trace_on_finish(tmp_path: Path) -> None:
+    path = tmp_path / "trace.json"
+    with tracing.TraceWriter(str(path)) as writer:
+        results = Results([writer])
+        with tracing.span("a", "node"):
+            pass
+        results.finish()
+
+    trace = json.loads(path.read_text())
+    assert trace["displayTimeUnit"] == "ms"
+    assert [e["name"] for e in trace["traceEvents"] if e["ph"] == "X"] == ["a"]
+    assert tracing._TRACER is None
@@ -0,0 +1,182 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from itertools import count
+from types import TracebackType
+from typing import Any, ContextManager, Dict, Generator, List, Optional, Type
+
+from dbt_dry_run.results import ResultListener, Results
+
+_NULL_CONTEXT: ContextManager[None] = nullcontext()
+
+
+class Tracer:
+    """
+    Records events in the Chrome trace event format, which can be opened in Perfetto or
+    `chrome://tracing`. Spans are recorded on the thread they ran on, asynchronous spans, like
+    a node waiting to be picked up by a worker, are recorded on their own tracks because they
+    can overlap
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+        self._start = time.perf_counter()
+        self._pid = os.getpid()
+        self._thread_ids: Dict[int, int] = {}
+        self._async_ids = count(1)
+
+    def _timestamp(self, perf_counter: float) -> float:
+        # Microseconds since the trace started
+        return round((perf_counter - self._start) * 1_000_000, 3)
+
+    def _tid(self) -> int:
+        ident = threading.get_ident()
+        tid = self._thread_ids.get(ident)
+        if tid is None:
+            with self._lock:
+                tid = self._thread_ids[ident] = len(self._thread_ids) + 1
+                self._events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": self._pid,
+                        "tid": tid,
+                        "args": {"name": threading.current_thread().name},
+                    }
+                )
+        return tid
+
+    def _add(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self._events.append(event)
+
+    @contextmanager
+    def span(
+        self, name: str, category: str, **args: Any
+    ) -> Generator[None, None, None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, category, start, time.perf_counter(), **args)
+
+    def complete(
+        self, name: str, category: str, start: float, end: float, **args: Any
+    ) -> None:
+        """
+        A span on the current thread between two `time.perf_counter` readings
+        """
+        self._add(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": self._timestamp(start),
+                "dur": self._timestamp(end) - self._timestamp(start),
+                "pid": self._pid,
+                "tid": self._tid(),
+                "args": args,
+            }
+        )
+
+    def async_span(
+        self, name: str, category: str, start: float, end: float, **args: Any
+    ) -> None:
+        async_id = next(self._async_ids)
+        event = {"name": name, "cat": category, "pid": self._pid, "id": async_id}
+        self._add({**event, "ph": "b", "ts": self._timestamp(start), "args": args})
+        self._add({**event, "ph": "e", "ts": self._timestamp(end)})
+
+    def instant(self, name: str, category: str, **args: Any) -> None:
+        self._add(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "i",
+                "s": "t",
+                "ts": self._timestamp(time.perf_counter()),
+                "pid": self._pid,
+                "tid": self._tid(),
+                "args": args,
+            }
+        )
+
+    def events(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._events)
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, f)
+
+
+_TRACER: Optional[Tracer] = None
+
+
+def start_tracing() -> Tracer:
+    global _TRACER
+    _TRACER = Tracer()
+    return _TRACER
+
+
+def stop_tracing() -> None:
+    global _TRACER
+    _TRACER = None
+
+
+def span(name: str, category: str, **args: Any) -> ContextManager[None]:
+    """
+    Record the block as a span on the current thread if tracing is on. When it is off this
+    does nothing, so it is cheap enough to leave around every call worth seeing in a trace
+    """
+    tracer = _TRACER
+    if tracer is None:
+        return _NULL_CONTEXT
+    return tracer.span(name, category, **args)
+
+
+def async_span(name: str, category: str, start: float, end: float, **args: Any) -> None:
+    tracer = _TRACER
+    if tracer is not None:
+        tracer.async_span(name, category, start, end, **args)
+
+
+def instant(name: str, category: str, **args: Any) -> None:
+    tracer = _TRACER
+    if tracer is not None:
+        tracer.instant(name, category, **args)
+
+
+class TraceWriter(ResultListener):
+    """
+    Traces the dry run while it is in use as a context manager and writes the trace to `path`
+    when the run finishes, or when it fails
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._tracer: Optional[Tracer] = None
+
+    def __enter__(self) -> "TraceWriter":
+        self._tracer = start_tracing()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self._write()
+        stop_tracing()
+
+    def on_finish(self, results: Results) -> None:
+        self._write()
+
+    def _write(self) -> None:
+        if self._tracer is not None:
+            self._tracer.write(self._path)
+            self._tracer = None